@@ -0,0 +1,83 @@
+"""
+Estadísticas filtradas por nombre: filtro anterior (OR de JOIN + __icontains)
+frente a la resolución de nombres a ids (utils/referencias.py) con IN sobre
+la FK.
+"""
+import statistics
+import time
+from django.db.models import Q
+from django.http import QueryDict
+from ..filters import PublicacionFilter
+from ..models import Publicacion
+from ..services.statistics_service import StatisticsService
+
+# Parámetro del filtro -> campo de nombre usado por el filtro anterior
+CAMPOS_NOMBRE = {
+    "junta_vecinal": "junta_vecinal__nombre_junta",
+    "departamento": "departamento__nombre",
+    "categoria": "categoria__nombre",
+    "situacion": "situacion__nombre",
+}
+
+CASOS_FILTROS = {
+    "departamento": {"departamento": "Obras"},
+    "departamentos": {"departamento": "Obras,Aseo,Alumbrado"},
+    "categoria": {"categoria": "Seguridad 1,Tránsito 2"},
+    "junta_vecinal": {"junta_vecinal": "Junta Vecinal 1"},
+    "situacion": {"situacion": "Pendiente,En curso"},
+    "combinado": {"departamento": "Obras,Salud", "situacion": "Pendiente", "junta_vecinal": "Vecinal 2"},
+}
+
+
+def queryset_filtro_anterior(parametros):
+    """Reproduce el filtrado previo por nombre, como referencia de comparación"""
+    queryset = Publicacion.objects.all()
+    for parametro, valor in parametros.items():
+        consulta = Q()
+        for texto in valor.split(","):
+            consulta |= Q(**{f"{CAMPOS_NOMBRE[parametro]}__icontains": texto})
+        queryset = queryset.filter(consulta)
+    return queryset
+
+
+def queryset_filtro_actual(parametros):
+    datos = QueryDict(mutable=True)
+    datos.update(parametros)
+    return PublicacionFilter(datos, queryset=Publicacion.objects.all()).qs
+
+
+def _estadisticas(queryset):
+    StatisticsService.get_resumen_estadisticas(queryset)
+    StatisticsService.get_publicaciones_por_categoria(queryset)
+    StatisticsService.get_tasa_resolucion_departamento(queryset)
+
+
+def _mediana_ms(funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def medir_filtros(repeticiones=5):
+    """
+    Para cada caso: mediana (ms) de filtrar + calcular tres estadísticas con el
+    filtro anterior y con el actual, y si ambos seleccionan las mismas filas.
+    """
+    resultados = {}
+    for nombre, parametros in CASOS_FILTROS.items():
+        ids_anterior = set(queryset_filtro_anterior(parametros).values_list("id", flat=True))
+        ids_actual = set(queryset_filtro_actual(parametros).values_list("id", flat=True))
+
+        antes = _mediana_ms(lambda: _estadisticas(queryset_filtro_anterior(parametros)), repeticiones)
+        despues = _mediana_ms(lambda: _estadisticas(queryset_filtro_actual(parametros)), repeticiones)
+        resultados[nombre] = {
+            "filas": len(ids_actual),
+            "mismas_filas": ids_anterior == ids_actual,
+            "antes_ms": round(antes, 2),
+            "despues_ms": round(despues, 2),
+            "aceleracion": round(antes / despues, 2) if despues else None,
+        }
+    return resultados
@@ -0,0 +1,74 @@
+"""
+Verificación con EXPLAIN de que las rutas de acceso dominantes de Publicacion
+usan su índice (ver Meta.indexes del modelo). Cada consulta reproduce lo que
+generan PublicacionFilter y el listado de PublicacionViewSet.
+"""
+from datetime import timedelta
+from django.db import connection
+from django.utils import timezone
+from ..models import Publicacion
+from ..utils.dias_habiles import corte_vencimiento
+
+SITUACION_PENDIENTE = 4
+# Los plazos vencidos se consultan por ventana (los que vencieron en el último
+# mes): todas las pendientes vencidas son una fracción grande de la tabla y
+# para esa lectura un recorrido secuencial es el plan correcto
+VENTANA_RECIENTE_DIAS = 30
+
+
+def consultas_indexadas():
+    """nombre -> (índice esperado, queryset), con ids tomados de los datos sembrados"""
+    muestra = Publicacion.objects.exclude(situacion=None).order_by("id").first()
+    desde = timezone.now() - timedelta(days=90)
+    return {
+        "dashboard_departamento": (
+            "idx_pub_depto_sit_fecha",
+            Publicacion.objects.filter(
+                departamento_id__in=[muestra.departamento_id],
+                situacion_id__in=[muestra.situacion_id],
+                fecha_publicacion__gte=desde,
+            ),
+        ),
+        "dashboard_junta": (
+            "idx_pub_junta_fecha",
+            Publicacion.objects.filter(
+                junta_vecinal_id__in=[muestra.junta_vecinal_id], fecha_publicacion__gte=desde
+            ).order_by("-fecha_publicacion"),
+        ),
+        "pendientes_vencidas": (
+            "idx_pub_pendiente_fecha",
+            Publicacion.objects.filter(
+                situacion_id=SITUACION_PENDIENTE,
+                fecha_publicacion__gte=timezone.now() - timedelta(days=20 + VENTANA_RECIENTE_DIAS),
+                fecha_publicacion__lt=timezone.now() - timedelta(days=20),
+            ),
+        ),
+        "vencidas_plazo_legal": (
+            "idx_pub_sit_vencimiento",
+            Publicacion.objects.filter(
+                situacion_id=SITUACION_PENDIENTE,
+                fecha_vencimiento_legal__gte=corte_vencimiento() - timedelta(days=VENTANA_RECIENTE_DIAS),
+                fecha_vencimiento_legal__lt=corte_vencimiento(),
+            ),
+        ),
+        "listado": (
+            "idx_pub_fecha_id",
+            Publicacion.objects.order_by("-fecha_publicacion", "-id")[:20],
+        ),
+    }
+
+
+def actualizar_estadisticas():
+    """El planificador elige índices según las estadísticas de la tabla"""
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {Publicacion._meta.db_table}")
+
+
+def verificar_indices():
+    """nombre -> {indice, usado, plan}"""
+    actualizar_estadisticas()
+    resultados = {}
+    for nombre, (indice, queryset) in consultas_indexadas().items():
+        plan = queryset.explain()
+        resultados[nombre] = {"indice": indice, "usado": indice in plan, "plan": plan}
+    return resultados
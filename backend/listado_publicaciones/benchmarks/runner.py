@@ -0,0 +1,200 @@
+"""
+Recorre todas las rutas de listado_publicaciones.urls y mide, por endpoint:
+número de consultas SQL, tiempo (mediana), memoria pico y tamaño de respuesta.
+
+El reporte es JSON y se puede comparar contra una línea base guardada; un
+aumento en el número de consultas siempre cuenta como regresión (es la señal
+típica de un N+1), mientras que tiempo y memoria usan un umbral relativo.
+"""
+import statistics
+import time
+import tracemalloc
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, reverse
+from rest_framework.test import APIClient
+from ..models import Publicacion
+
+# Parámetros que se agregan a cada ruta para que los listados sean comparables
+PARAMETROS_POR_DEFECTO = {"pagesize": 100}
+
+
+def _recorrer_patrones(patrones, prefijo=""):
+    for patron in patrones:
+        if isinstance(patron, URLResolver):
+            namespace = f"{prefijo}{patron.namespace}:" if patron.namespace else prefijo
+            yield from _recorrer_patrones(patron.url_patterns, namespace)
+        elif isinstance(patron, URLPattern):
+            yield prefijo, patron
+
+
+def _clase_vista(callback):
+    return getattr(callback, "cls", None) or getattr(callback, "view_class", None)
+
+
+def _metodos_get(callback):
+    """Indica si la ruta responde a GET (viewsets, APIView y @api_view)."""
+    acciones = getattr(callback, "actions", None)
+    if acciones is not None:
+        return "get" in acciones
+    clase = _clase_vista(callback)
+    return clase is not None and hasattr(clase, "get")
+
+
+def descubrir_rutas(urlconf="listado_publicaciones.urls"):
+    """
+    Retorna una lista de rutas con su nombre, kwargs requeridos y si se pueden
+    medir con GET. Se omiten los duplicados con sufijo de formato.
+    """
+    from importlib import import_module
+
+    modulo = import_module(urlconf)
+    rutas = []
+    vistos = set()
+    for prefijo, patron in _recorrer_patrones(modulo.urlpatterns):
+        if not patron.name or "format" in patron.pattern.regex.groupindex:
+            continue
+        nombre = f"{prefijo}{patron.name}"
+        if nombre in vistos:
+            continue
+        vistos.add(nombre)
+
+        clase = _clase_vista(patron.callback)
+        rutas.append({
+            "nombre": nombre,
+            "kwargs": sorted(patron.pattern.regex.groupindex),
+            "vista": clase.__name__ if clase else patron.callback.__name__,
+            "modelo": getattr(getattr(clase, "queryset", None), "model", None),
+            "medible": _metodos_get(patron.callback),
+        })
+    return rutas
+
+
+def _resolver_kwargs(ruta, muestras):
+    kwargs = {}
+    for nombre in ruta["kwargs"]:
+        if nombre == "pk":
+            modelo = ruta["modelo"]
+            if modelo is None:
+                return None
+            if modelo not in muestras:
+                muestras[modelo] = modelo.objects.order_by("-pk").values_list("pk", flat=True).first()
+            valor = muestras[modelo]
+        elif nombre == "publicacion_id":
+            if Publicacion not in muestras:
+                muestras[Publicacion] = Publicacion.objects.order_by("-pk").values_list("pk", flat=True).first()
+            valor = muestras[Publicacion]
+        elif nombre == "recurso":
+            valor = "publicaciones"
+        else:
+            return None
+        if valor is None:
+            return None
+        kwargs[nombre] = valor
+    return kwargs
+
+
+def medir_endpoints(usuario, repeticiones=3, rutas=None, filtro=None, parametros=None, log=None):
+    """
+    Ejecuta cada ruta GET autenticado como `usuario` y retorna el reporte.
+
+    - repeticiones: corridas cronometradas (se reporta la mediana)
+    - filtro: función opcional que recibe el nombre de la ruta y decide si se mide
+    """
+    log = log or (lambda mensaje: None)
+    parametros = PARAMETROS_POR_DEFECTO if parametros is None else parametros
+    # Un endpoint roto se registra con su status 500 en vez de abortar la corrida
+    cliente = APIClient(raise_request_exception=False)
+    cliente.force_authenticate(user=usuario)
+
+    muestras = {}
+    resultados = {}
+    omitidas = {}
+    for ruta in rutas if rutas is not None else descubrir_rutas():
+        nombre = ruta["nombre"]
+        if filtro and not filtro(nombre):
+            continue
+        if not ruta["medible"]:
+            omitidas[nombre] = "sin GET"
+            continue
+        kwargs = _resolver_kwargs(ruta, muestras)
+        if kwargs is None:
+            omitidas[nombre] = "sin datos para " + ", ".join(ruta["kwargs"])
+            continue
+
+        url = reverse(nombre, kwargs=kwargs)
+
+        # Calentamiento + conteo de consultas (determinista)
+        with CaptureQueriesContext(connection) as consultas:
+            respuesta = cliente.get(url, parametros)
+        # Se lee de inmediato: las siguientes peticiones reinician connection.queries
+        total_consultas = len(consultas)
+
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            cliente.get(url, parametros)
+            tiempos.append(time.perf_counter() - inicio)
+
+        # La memoria se mide en una pasada separada para no distorsionar los tiempos
+        tracemalloc.start()
+        cliente.get(url, parametros)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        resultados[nombre] = {
+            "url": url,
+            "status": respuesta.status_code,
+            "consultas": total_consultas,
+            "tiempo_ms": round(statistics.median(tiempos) * 1000, 3),
+            "memoria_pico_kb": round(pico / 1024, 1),
+            "bytes_respuesta": len(respuesta.content),
+        }
+        log(f"{nombre}: {resultados[nombre]['consultas']} consultas, {resultados[nombre]['tiempo_ms']} ms")
+
+    return {"endpoints": resultados, "omitidas": omitidas}
+
+
+def comparar_con_baseline(reporte, baseline, umbral_tiempo=1.5, umbral_memoria=1.5):
+    """
+    Compara un reporte con la línea base y retorna las diferencias por endpoint.
+
+    Cualquier aumento de consultas es regresión; tiempo y memoria lo son cuando
+    superan `umbral_*` veces el valor de la línea base.
+    """
+    actuales = reporte.get("endpoints", {})
+    anteriores = baseline.get("endpoints", {})
+    diferencias = {}
+    regresiones = []
+
+    for nombre, actual in actuales.items():
+        anterior = anteriores.get(nombre)
+        if anterior is None:
+            diferencias[nombre] = {"estado": "nuevo"}
+            continue
+
+        motivos = []
+        if actual["consultas"] > anterior["consultas"]:
+            motivos.append("consultas")
+        if anterior["tiempo_ms"] and actual["tiempo_ms"] > anterior["tiempo_ms"] * umbral_tiempo:
+            motivos.append("tiempo")
+        if anterior["memoria_pico_kb"] and actual["memoria_pico_kb"] > anterior["memoria_pico_kb"] * umbral_memoria:
+            motivos.append("memoria")
+        if actual["status"] != anterior["status"]:
+            motivos.append("status")
+
+        diferencias[nombre] = {
+            "estado": "regresion" if motivos else "ok",
+            "motivos": motivos,
+            "consultas": [anterior["consultas"], actual["consultas"]],
+            "tiempo_ms": [anterior["tiempo_ms"], actual["tiempo_ms"]],
+            "memoria_pico_kb": [anterior["memoria_pico_kb"], actual["memoria_pico_kb"]],
+            "bytes_respuesta": [anterior["bytes_respuesta"], actual["bytes_respuesta"]],
+        }
+        if motivos:
+            regresiones.append(nombre)
+
+    for nombre in anteriores.keys() - actuales.keys():
+        diferencias[nombre] = {"estado": "eliminado"}
+
+    return {"diferencias": diferencias, "regresiones": sorted(regresiones)}
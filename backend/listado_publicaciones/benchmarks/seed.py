@@ -0,0 +1,289 @@
+"""
+Generación de un municipio sintético para benchmarks.
+
+Todo se inserta con bulk_create en lotes, por lo que escala hasta ~1M de
+publicaciones sin cargar el conjunto completo en memoria.
+"""
+import random
+from contextlib import contextmanager
+from datetime import timedelta
+from django.db import connection, transaction
+from django.utils import timezone
+from ..models import (
+    Usuario,
+    DepartamentoMunicipal,
+    UsuarioDepartamento,
+    JuntaVecinal,
+    Categoria,
+    SituacionPublicacion,
+    Publicacion,
+    Evidencia,
+    RespuestaMunicipal,
+    HistorialModificaciones,
+    Auditoria,
+    AnuncioMunicipal,
+    Tablero,
+    Columna,
+    Tarea,
+    Comentario,
+    MarcaCambio,
+)
+from ..services.resumen_diario_service import ResumenDiarioService
+from ..signals import MODELOS_CON_MARCA
+
+# Las estadísticas dependen de estos IDs (4 = Pendiente)
+SITUACIONES = {1: "Resuelto", 2: "Recibido", 3: "En curso", 4: "Pendiente"}
+PESOS_SITUACION = [(1, 0.40), (2, 0.15), (3, 0.10), (4, 0.35)]
+
+DEPARTAMENTOS = [
+    "Obras", "Aseo y Ornato", "Seguridad", "Tránsito",
+    "Medio Ambiente", "Alumbrado", "Social", "Salud",
+]
+CATEGORIAS_POR_DEPARTAMENTO = 4
+TOTAL_JUNTAS = 60
+PERSONAL_POR_DEPARTAMENTO = 6
+
+# Centro aproximado de Calama
+LATITUD_BASE = -22.4560
+LONGITUD_BASE = -68.9290
+
+
+@contextmanager
+def base_de_datos_temporal():
+    """Crea una base de pruebas vacía (como manage.py test) y la elimina al salir."""
+    nombre_original = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(nombre_original, verbosity=0)
+
+
+def _elegir_situacion(rng):
+    r = rng.random()
+    acumulado = 0
+    for situacion_id, peso in PESOS_SITUACION:
+        acumulado += peso
+        if r < acumulado:
+            return situacion_id
+    return 4
+
+
+def _coordenada(rng, base):
+    return round(base + rng.uniform(-0.05, 0.05), 6)
+
+
+def sembrar_municipio(
+    publicaciones=1000,
+    semilla=42,
+    dias=730,
+    lote=5000,
+    respuestas_por_resuelta=1.2,
+    historial_por_publicacion=0.5,
+    auditorias_por_publicacion=1.0,
+    evidencias_por_publicacion=0.3,
+    log=None,
+):
+    """
+    Crea un municipio completo: departamentos, personal, juntas, categorías,
+    publicaciones y sus respuestas, historial, auditorías, evidencias, anuncios
+    y un tablero kanban por departamento.
+
+    Retorna un diccionario con la cantidad de filas creadas por modelo.
+    """
+    rng = random.Random(semilla)
+    ahora = timezone.now()
+    log = log or (lambda mensaje: None)
+    conteo = {}
+
+    with transaction.atomic():
+        for situacion_id, nombre in SITUACIONES.items():
+            SituacionPublicacion.objects.get_or_create(id=situacion_id, defaults={"nombre": nombre})
+
+        admin = Usuario.objects.create(
+            rut="1000000-0", email="admin@benchmark.cl", nombre="Admin Benchmark",
+            es_administrador=True, tipo_usuario="administrador", password="!",
+        )
+
+        jefes = Usuario.objects.bulk_create([
+            Usuario(
+                rut=f"{2000000 + i}-1", email=f"jefe{i}@benchmark.cl", nombre=f"Jefe {i}",
+                tipo_usuario="jefe_departamento", password="!",
+            )
+            for i in range(len(DEPARTAMENTOS))
+        ])
+        departamentos = DepartamentoMunicipal.objects.bulk_create([
+            DepartamentoMunicipal(nombre=nombre, jefe_departamento=jefe)
+            for nombre, jefe in zip(DEPARTAMENTOS, jefes)
+        ])
+
+        personal = Usuario.objects.bulk_create([
+            Usuario(
+                rut=f"{3000000 + i}-2", email=f"personal{i}@benchmark.cl", nombre=f"Funcionario {i}",
+                tipo_usuario="personal", password="!",
+            )
+            for i in range(len(DEPARTAMENTOS) * PERSONAL_POR_DEPARTAMENTO)
+        ])
+        UsuarioDepartamento.objects.bulk_create([
+            UsuarioDepartamento(usuario=funcionario, departamento=departamentos[i % len(departamentos)])
+            for i, funcionario in enumerate(personal)
+        ])
+
+        total_vecinos = max(10, min(publicaciones // 10, 50000))
+        vecinos = []
+        for inicio in range(0, total_vecinos, lote):
+            vecinos.extend(Usuario.objects.bulk_create([
+                Usuario(
+                    rut=f"{10000000 + i}-3", email=f"vecino{i}@benchmark.cl", nombre=f"Vecino {i}",
+                    password="!",
+                )
+                for i in range(inicio, min(inicio + lote, total_vecinos))
+            ]))
+
+        categorias = Categoria.objects.bulk_create([
+            Categoria(nombre=f"{depto.nombre} {j + 1}", departamento=depto)
+            for depto in departamentos
+            for j in range(CATEGORIAS_POR_DEPARTAMENTO)
+        ])
+        juntas = JuntaVecinal.objects.bulk_create([
+            JuntaVecinal(
+                nombre_junta=f"Junta Vecinal {i + 1}", nombre_calle=f"Calle {i + 1}", numero_calle=100 + i,
+                latitud=_coordenada(rng, LATITUD_BASE), longitud=_coordenada(rng, LONGITUD_BASE),
+            )
+            for i in range(TOTAL_JUNTAS)
+        ])
+        conteo.update({
+            "usuarios": 1 + len(jefes) + len(personal) + len(vecinos),
+            "departamentos": len(departamentos),
+            "categorias": len(categorias),
+            "juntas_vecinales": len(juntas),
+        })
+
+    creados = {"publicaciones": 0, "respuestas": 0, "historial": 0, "auditorias": 0, "evidencias": 0}
+    segundos_rango = dias * 24 * 3600
+
+    for inicio in range(0, publicaciones, lote):
+        fin = min(inicio + lote, publicaciones)
+        with transaction.atomic():
+            nuevas = []
+            for i in range(inicio, fin):
+                categoria = rng.choice(categorias)
+                situacion_id = _elegir_situacion(rng)
+                nuevas.append(Publicacion(
+                    codigo=f"P-BENCH-{i:010d}",
+                    usuario=rng.choice(vecinos),
+                    junta_vecinal=rng.choice(juntas),
+                    categoria=categoria,
+                    departamento_id=categoria.departamento_id,
+                    situacion_id=situacion_id,
+                    encargado=rng.choice(personal) if situacion_id != 4 else None,
+                    fecha_publicacion=ahora - timedelta(seconds=rng.randint(0, segundos_rango)),
+                    titulo=f"Publicación {i}",
+                    descripcion=f"Descripción de la publicación sintética {i}",
+                    ubicacion=f"Calle {rng.randint(1, 500)} #{rng.randint(1, 3000)}",
+                    latitud=_coordenada(rng, LATITUD_BASE),
+                    longitud=_coordenada(rng, LONGITUD_BASE),
+                    prioridad=rng.choice(["alta", "media", "baja"]),
+                ))
+            Publicacion.asignar_vencimientos(nuevas)
+            nuevas = Publicacion.objects.bulk_create(nuevas)
+
+            respuestas, historial, auditorias, evidencias = [], [], [], []
+            for pub in nuevas:
+                if pub.situacion_id != 4:
+                    for _ in range(int(respuestas_por_resuelta + rng.random())):
+                        segundos = rng.randint(3600, 40 * 24 * 3600)
+                        respuestas.append(RespuestaMunicipal(
+                            usuario=pub.encargado, publicacion=pub,
+                            fecha=min(pub.fecha_publicacion + timedelta(seconds=segundos), ahora),
+                            descripcion="Respuesta sintética", acciones="Visita a terreno",
+                            situacion_inicial="Pendiente", situacion_posterior=SITUACIONES[pub.situacion_id],
+                            puntuacion=rng.choice([0, 0, 1, 2, 3, 4, 5]),
+                        ))
+                if rng.random() < historial_por_publicacion:
+                    historial.append(HistorialModificaciones(
+                        publicacion=pub, autor=rng.choice(personal),
+                        fecha=pub.fecha_publicacion + timedelta(hours=rng.randint(1, 72)),
+                        campo_modificado="situacion_id", valor_anterior="4",
+                        valor_nuevo=str(pub.situacion_id),
+                    ))
+                if rng.random() < evidencias_por_publicacion:
+                    evidencias.append(Evidencia(
+                        publicacion=pub, archivo=f"evidencias/bench_{pub.id}.jpg",
+                        nombre="foto.jpg", peso=rng.randint(10000, 900000), extension="jpg",
+                    ))
+            for i in range(int((fin - inicio) * auditorias_por_publicacion)):
+                numero = inicio + i
+                auditorias.append(Auditoria(
+                    codigo=f"AUD-BENCH-{numero:010d}", autor=rng.choice(personal),
+                    accion=rng.choice(["CREATE", "READ", "UPDATE"]), modulo="Publicaciones",
+                    descripcion=f"Operación sintética {numero}",
+                    fecha=ahora - timedelta(seconds=rng.randint(0, segundos_rango)),
+                ))
+
+            RespuestaMunicipal.objects.bulk_create(respuestas, batch_size=lote)
+            HistorialModificaciones.objects.bulk_create(historial, batch_size=lote)
+            Auditoria.objects.bulk_create(auditorias, batch_size=lote)
+            Evidencia.objects.bulk_create(evidencias, batch_size=lote)
+
+        creados["publicaciones"] += len(nuevas)
+        creados["respuestas"] += len(respuestas)
+        creados["historial"] += len(historial)
+        creados["auditorias"] += len(auditorias)
+        creados["evidencias"] += len(evidencias)
+        log(f"Publicaciones sembradas: {creados['publicaciones']}/{publicaciones}")
+
+    conteo.update(creados)
+    conteo.update(_sembrar_anuncios_y_kanban(rng, admin, departamentos, categorias, personal))
+    # Las publicaciones se sembraron con bulk_create, sin mantener el rollup diario
+    conteo["resumenes"] = ResumenDiarioService.reconstruir()
+    return conteo
+
+
+def _sembrar_anuncios_y_kanban(rng, admin, departamentos, categorias, personal):
+    with transaction.atomic():
+        anuncios = AnuncioMunicipal.objects.bulk_create([
+            AnuncioMunicipal(
+                usuario=admin, titulo=f"Anuncio {i}", subtitulo="Subtítulo",
+                descripcion="Anuncio sintético", categoria=rng.choice(categorias),
+                estado=rng.choice(["Pendiente", "Publicado"]),
+            )
+            for i in range(30)
+        ])
+
+        tableros = Tablero.objects.bulk_create([
+            Tablero(titulo=f"Tablero {depto.nombre}", departamento=depto) for depto in departamentos
+        ])
+        columnas = Columna.objects.bulk_create([
+            Columna(titulo=titulo, tablero=tablero)
+            for tablero in tableros
+            for titulo in ("Por hacer", "En curso", "Hecho")
+        ])
+        tareas = Tarea.objects.bulk_create([
+            Tarea(
+                titulo=f"Tarea {i}", descripcion="Tarea sintética", columna=rng.choice(columnas),
+                encargado=rng.choice(personal), prioridad=rng.choice(["baja", "media", "alta"]),
+                categoria=rng.choice(categorias),
+            )
+            for i in range(len(columnas) * 5)
+        ])
+        ids_publicaciones = list(Publicacion.objects.order_by("-id").values_list("id", flat=True)[:500])
+        Tarea.publicaciones.through.objects.bulk_create([
+            Tarea.publicaciones.through(tarea_id=tarea.id, publicacion_id=publicacion_id)
+            for tarea in tareas
+            for publicacion_id in rng.sample(ids_publicaciones, min(3, len(ids_publicaciones)))
+        ])
+        comentarios = Comentario.objects.bulk_create([
+            Comentario(tarea=tarea, usuario=rng.choice(personal), contenido="Comentario sintético")
+            for tarea in tareas
+        ])
+
+        # bulk_create no emite señales: se marcan las tablas como modificadas
+        MarcaCambio.registrar_cambio(*MODELOS_CON_MARCA)
+
+    return {
+        "anuncios": len(anuncios),
+        "tableros": len(tableros),
+        "tareas": len(tareas),
+        "comentarios": len(comentarios),
+    }
@@ -0,0 +1,79 @@
+"""
+Throughput de la serialización compilada frente a DRF sobre los mismos
+querysets precargados.
+"""
+import time
+from rest_framework.renderers import JSONRenderer
+from ..models import Publicacion, AnuncioMunicipal, RespuestaMunicipal
+from ..serializers.compilado import serializar_compilado
+from ..serializers.v1 import (
+    PublicacionListSerializer,
+    PublicacionLiteSerializer,
+    AnuncioMunicipalListSerializer,
+    RespuestaMunicipalListSerializer,
+)
+
+
+def casos_listados(filas=100):
+    """(nombre, serializer, queryset) de los listados que usan el camino compilado"""
+    return [
+        (
+            "publicaciones",
+            PublicacionListSerializer,
+            PublicacionListSerializer.queryset_optimizado(Publicacion.objects.order_by("-id")[:filas]),
+        ),
+        (
+            "publicaciones_lite",
+            PublicacionLiteSerializer,
+            PublicacionLiteSerializer.queryset_optimizado(Publicacion.objects.order_by("-id"))[:filas],
+        ),
+        (
+            "anuncios",
+            AnuncioMunicipalListSerializer,
+            AnuncioMunicipalListSerializer.queryset_optimizado(AnuncioMunicipal.objects.order_by("-id")[:filas]),
+        ),
+        (
+            "respuestas",
+            RespuestaMunicipalListSerializer,
+            RespuestaMunicipalListSerializer.queryset_optimizado(RespuestaMunicipal.objects.order_by("-id")[:filas]),
+        ),
+    ]
+
+
+def _mejor_tiempo(funcion, repeticiones):
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        duracion = time.perf_counter() - inicio
+        mejor = duracion if mejor is None else min(mejor, duracion)
+    return mejor
+
+
+def medir_serializacion(filas=100, repeticiones=5):
+    """
+    Serializa cada caso con DRF y con el plan compilado (instancias ya en
+    memoria, sin consultas) y retorna filas por segundo y la aceleración.
+    También verifica que el JSON sea idéntico.
+    """
+    renderer = JSONRenderer()
+    resultados = {}
+    for nombre, serializer_class, queryset in casos_listados(filas):
+        instancias = list(queryset)
+        if not instancias:
+            continue
+
+        drf = serializer_class(instancias, many=True).data
+        compilado = serializar_compilado(serializer_class, instancias)
+        identico = renderer.render(drf) == renderer.render(compilado)
+
+        tiempo_drf = _mejor_tiempo(lambda: serializer_class(instancias, many=True).data, repeticiones)
+        tiempo_compilado = _mejor_tiempo(lambda: serializar_compilado(serializer_class, instancias), repeticiones)
+        resultados[nombre] = {
+            "filas": len(instancias),
+            "identico": identico,
+            "filas_por_segundo_drf": round(len(instancias) / tiempo_drf),
+            "filas_por_segundo_compilado": round(len(instancias) / tiempo_compilado),
+            "aceleracion": round(tiempo_drf / tiempo_compilado, 2),
+        }
+    return resultados
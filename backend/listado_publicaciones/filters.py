@@ -1,6 +1,17 @@
 import django_filters
-from .models import Publicacion, AnuncioMunicipal, Usuario, JuntaVecinal
-from django.db.models import Q
+from .models import (
+    Publicacion,
+    AnuncioMunicipal,
+    Usuario,
+    JuntaVecinal,
+    HistorialModificaciones,
+    RespuestaMunicipal,
+    Evidencia,
+    Tarea,
+    ResumenDiario,
+)
+from django.db.models import Q, Exists, OuterRef
+from .utils.referencias import MapaReferencias
 
 
 class PublicacionFilter(django_filters.FilterSet):
@@ -32,55 +43,66 @@ class PublicacionFilter(django_filters.FilterSet):
         django_filters.DateFromToRangeFilter()
     )  # Filtro de rango de fechas
     con_modificaciones = django_filters.BooleanFilter(
-        method="filter_con_modificaciones",
+        method="filter_existe_relacion",
         label="Indica si la publicación tiene modificaciones en su historial",
     )
+    con_respuesta = django_filters.BooleanFilter(
+        method="filter_existe_relacion",
+        label="Indica si la publicación tiene respuestas municipales",
+    )
+    con_evidencia = django_filters.BooleanFilter(
+        method="filter_existe_relacion",
+        label="Indica si la publicación tiene evidencias adjuntas",
+    )
+    en_tarea_kanban = django_filters.BooleanFilter(
+        method="filter_existe_relacion",
+        label="Indica si la publicación está asociada a una tarea del tablero kanban",
+    )
 
-    def filter_con_modificaciones(self, queryset, name, value):
-        """
-        Filtra las publicaciones basado en si tienen o no modificaciones.
-        'value' será True o False.
-        """
-        related_name = "historialmodificaciones"
+    # Filtro de existencia -> (modelo relacionado, FK a la publicación)
+    RELACIONES_EXISTENCIA = {
+        "con_modificaciones": (HistorialModificaciones, "publicacion"),
+        "con_respuesta": (RespuestaMunicipal, "publicacion"),
+        "con_evidencia": (Evidencia, "publicacion"),
+        "en_tarea_kanban": (Tarea.publicaciones.through, "publicacion"),
+    }
 
-        if value:
-            # Si ?con_modificaciones=true
-            return queryset.filter(**{f"{related_name}__isnull": False}).distinct()
+    @property
+    def referencias(self):
+        """Mapa nombre -> id de las tablas de referencia, uno por filtrado"""
+        if not hasattr(self, "_referencias"):
+            self._referencias = MapaReferencias()
+        return self._referencias
 
-        # Si es ?con_modificaciones=false
-        return queryset.filter(**{f"{related_name}__isnull": True}).distinct()
+    def filter_existe_relacion(self, queryset, name, value):
+        """
+        Filtra por existencia de filas relacionadas con un semi-join (EXISTS)
+        sobre la FK indexada: sin JOIN ni distinct(), así el orden, la
+        paginación y los conteos de las estadísticas no cambian.
+        """
+        modelo, campo = self.RELACIONES_EXISTENCIA[name]
+        existe = Exists(modelo.objects.filter(**{campo: OuterRef("pk")}))
+        return queryset.filter(existe if value else ~existe)
 
     def filter_junta_vecinal(self, queryset, name, value):
         if value:
-            # Dividimos los valores en caso de que lleguen como una cadena
-            junta_vecinal_list = value.split(",")
-            # Creamos una Q para filtrar usando OR
-            query = Q()
-            for junta in junta_vecinal_list:
-                query |= Q(junta_vecinal__nombre_junta__icontains=junta)
-            return queryset.filter(query)
+            # Los nombres (lista separada por comas) se resuelven a ids y se filtra por la FK
+            ids = self.referencias.ids_por_nombre("junta_vecinal", value)
+            return queryset.filter(junta_vecinal_id__in=ids)
         return queryset
 
     def filter_departamento_municipal(self, queryset, name, value):
         if value:
-            # Dividimos los valores en caso de que lleguen como una cadena
-            departamento_municipal_list = value.split(",")
-            # Creamos una Q para filtrar usando OR
-            query = Q()
-            for departamento in departamento_municipal_list:
-                query |= Q(departamento__nombre__icontains=departamento)
-            return queryset.filter(query)
+            # Los nombres (lista separada por comas) se resuelven a ids y se filtra por la FK
+            ids = self.referencias.ids_por_nombre("departamento", value)
+            return queryset.filter(departamento_id__in=ids)
         return queryset
 
     def filter_categoria(self, queryset, name, value):
         if value:
-            # Dividimos los valores en caso de que lleguen como una cadena
-            categoria_list = value.split(",")
-            # Creamos una Q para filtrar usando OR
-            query = Q()
-            for categoria in categoria_list:
-                query |= Q(categoria__nombre__icontains=categoria)
-            return queryset.filter(query)
+            # Los nombres (lista separada por comas) se resuelven a ids y se filtra por la FK
+            ids = self.referencias.ids_por_nombre("categoria", value)
+            return queryset.filter(categoria_id__in=ids)
         return queryset
 
     def filter_categoria_ids(self, queryset, name, value):
@@ -92,13 +114,9 @@ class PublicacionFilter(django_filters.FilterSet):
 
     def filter_situacion_publicacion(self, queryset, name, value):
         if value:
-            # Dividimos los valores en caso de que lleguen como una cadena
-            situacion_publicacion_list = value.split(",")
-            # Creamos una Q para filtrar usando OR
-            query = Q()
-            for situacion in situacion_publicacion_list:
-                query |= Q(situacion__nombre__icontains=situacion)
-            return queryset.filter(query)
+            # Los nombres (lista separada por comas) se resuelven a ids y se filtra por la FK
+            ids = self.referencias.ids_por_nombre("situacion", value)
+            return queryset.filter(situacion_id__in=ids)
         return queryset
 
     def filter_usuario_id(self, queryset, name, value):
@@ -131,6 +149,19 @@ class PublicacionFilter(django_filters.FilterSet):
         ]
 
 
+class ResumenDiarioFilter(PublicacionFilter):
+    """
+    Los filtros de PublicacionFilter sobre el rollup diario: las FKs tienen
+    los mismos nombres y el rango de fechas se aplica al día local.
+    """
+
+    fecha_publicacion = django_filters.DateFromToRangeFilter(field_name="dia")
+
+    class Meta:
+        model = ResumenDiario
+        fields = PublicacionFilter.Meta.fields
+
+
 class AnuncioMunicipalFilter(django_filters.FilterSet):
     categoria = django_filters.CharFilter(
         method="filter_categoria",
@@ -144,13 +175,8 @@ class AnuncioMunicipalFilter(django_filters.FilterSet):
 
     def filter_categoria(self, queryset, name, value):
         if value:
-            # Dividimos los valores en caso de que lleguen como una cadena
-            categoria_list = value.split(",")
-            # Creamos una Q para filtrar usando OR
-            query = Q()
-            for categoria in categoria_list:
-                query |= Q(categoria__nombre__icontains=categoria)
-            return queryset.filter(query)
+            ids = MapaReferencias().ids_por_nombre("categoria", value)
+            return queryset.filter(categoria_id__in=ids)
         return queryset
 
     def filter_estado(self, queryset, name, value):
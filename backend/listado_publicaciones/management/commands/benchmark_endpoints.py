@@ -0,0 +1,122 @@
+import json
+import re
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from ...benchmarks.seed import sembrar_municipio, base_de_datos_temporal
+from ...benchmarks.runner import medir_endpoints, comparar_con_baseline
+from ...models import Usuario
+
+
+class Command(BaseCommand):
+    help = (
+        "Siembra un municipio sintético y mide consultas SQL, tiempo, memoria y "
+        "tamaño de respuesta de cada endpoint GET. Compara contra una línea base."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--publicaciones", type=int, default=1000, help="Cantidad de publicaciones a sembrar (hasta 1M)")
+        parser.add_argument("--semilla", type=int, default=42)
+        parser.add_argument("--repeticiones", type=int, default=3)
+        parser.add_argument("--solo", help="Expresión regular: mide solo las rutas cuyo nombre coincida")
+        parser.add_argument("--excluir", help="Expresión regular: omite las rutas cuyo nombre coincida")
+        parser.add_argument("--salida", help="Archivo donde guardar el reporte JSON")
+        parser.add_argument("--baseline", help="Archivo JSON con la línea base a comparar")
+        parser.add_argument("--guardar-baseline", action="store_true", help="Sobrescribe --baseline con el reporte actual")
+        parser.add_argument("--umbral-tiempo", type=float, default=1.5)
+        parser.add_argument("--umbral-memoria", type=float, default=1.5)
+        parser.add_argument("--fallar-si-regresion", action="store_true", help="Termina con error si hay regresiones")
+        parser.add_argument(
+            "--usar-base-actual",
+            action="store_true",
+            help="Usa la base configurada en vez de una base de pruebas temporal (no siembra datos)",
+        )
+
+    def handle(self, *args, **options):
+        if options["publicaciones"] > 1_000_000:
+            raise CommandError("El máximo soportado es 1.000.000 de publicaciones")
+
+        if options["usar_base_actual"]:
+            return self._ejecutar(options, sembrar=False)
+
+        # Por defecto se trabaja sobre una base temporal para no tocar datos reales
+        with base_de_datos_temporal():
+            return self._ejecutar(options, sembrar=True)
+
+    def _ejecutar(self, options, sembrar):
+        if sembrar:
+            conteo = sembrar_municipio(
+                publicaciones=options["publicaciones"],
+                semilla=options["semilla"],
+                log=self._log,
+            )
+            self.stdout.write(f"Datos sembrados: {json.dumps(conteo)}")
+
+        usuario = Usuario.objects.filter(es_administrador=True).order_by("id").first()
+        if usuario is None:
+            raise CommandError("Se necesita un usuario administrador para medir los endpoints")
+
+        solo = re.compile(options["solo"]) if options["solo"] else None
+        excluir = re.compile(options["excluir"]) if options["excluir"] else None
+
+        def filtro(nombre):
+            if solo and not solo.search(nombre):
+                return False
+            return not (excluir and excluir.search(nombre))
+
+        reporte = medir_endpoints(usuario, repeticiones=options["repeticiones"], filtro=filtro, log=self._log)
+        reporte["parametros"] = {
+            "publicaciones": options["publicaciones"],
+            "semilla": options["semilla"],
+            "repeticiones": options["repeticiones"],
+            "motor": connection.vendor,
+        }
+
+        if options["salida"]:
+            self._guardar(options["salida"], reporte)
+
+        regresiones = []
+        if options["baseline"]:
+            if options["guardar_baseline"]:
+                self._guardar(options["baseline"], reporte)
+                self.stdout.write(self.style.SUCCESS(f"Línea base guardada en {options['baseline']}"))
+            else:
+                try:
+                    with open(options["baseline"], encoding="utf-8") as archivo:
+                        baseline = json.load(archivo)
+                except FileNotFoundError:
+                    raise CommandError(f"No existe la línea base {options['baseline']}")
+
+                comparacion = comparar_con_baseline(
+                    reporte,
+                    baseline,
+                    umbral_tiempo=options["umbral_tiempo"],
+                    umbral_memoria=options["umbral_memoria"],
+                )
+                reporte["comparacion"] = comparacion
+                regresiones = comparacion["regresiones"]
+                if options["salida"]:
+                    self._guardar(options["salida"], reporte)
+
+        if not options["salida"]:
+            self.stdout.write(json.dumps(reporte, indent=2, ensure_ascii=False))
+
+        if regresiones:
+            for nombre in regresiones:
+                detalle = reporte["comparacion"]["diferencias"][nombre]
+                self.stderr.write(f"REGRESIÓN {nombre}: {', '.join(detalle['motivos'])} {detalle['consultas']}")
+            if options["fallar_si_regresion"]:
+                raise CommandError(f"{len(regresiones)} endpoint(s) con regresiones")
+        elif "comparacion" in reporte:
+            self.stdout.write(self.style.SUCCESS("Sin regresiones"))
+
+    def _guardar(self, ruta, reporte):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(reporte, archivo, indent=2, ensure_ascii=False, sort_keys=True)
+
+    def _log(self, mensaje):
+        if self.verbosity > 1:
+            self.stdout.write(mensaje)
+
+    def execute(self, *args, **options):
+        self.verbosity = options.get("verbosity", 1)
+        return super().execute(*args, **options)
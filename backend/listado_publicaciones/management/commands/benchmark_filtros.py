@@ -0,0 +1,19 @@
+import json
+from django.core.management.base import BaseCommand
+from ...benchmarks.seed import sembrar_municipio, base_de_datos_temporal
+from ...benchmarks.filtros import medir_filtros
+
+
+class Command(BaseCommand):
+    help = "Compara estadísticas filtradas por nombre: filtro anterior (JOIN + ILIKE) frente a ids con IN."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--publicaciones", type=int, default=20000, help="Publicaciones a sembrar")
+        parser.add_argument("--repeticiones", type=int, default=5)
+        parser.add_argument("--semilla", type=int, default=42)
+
+    def handle(self, *args, **options):
+        with base_de_datos_temporal():
+            sembrar_municipio(publicaciones=options["publicaciones"], semilla=options["semilla"])
+            resultados = medir_filtros(repeticiones=options["repeticiones"])
+        self.stdout.write(json.dumps(resultados, indent=2, ensure_ascii=False))
@@ -0,0 +1,20 @@
+import json
+from django.core.management.base import BaseCommand
+from ...benchmarks.seed import sembrar_municipio, base_de_datos_temporal
+from ...benchmarks.serializacion import medir_serializacion
+
+
+class Command(BaseCommand):
+    help = "Compara el throughput de la serialización compilada con DRF en los listados principales."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--publicaciones", type=int, default=2000, help="Publicaciones a sembrar")
+        parser.add_argument("--filas", type=int, default=100, help="Filas por listado (tamaño de página)")
+        parser.add_argument("--repeticiones", type=int, default=5)
+        parser.add_argument("--semilla", type=int, default=42)
+
+    def handle(self, *args, **options):
+        with base_de_datos_temporal():
+            sembrar_municipio(publicaciones=options["publicaciones"], semilla=options["semilla"])
+            resultados = medir_serializacion(filas=options["filas"], repeticiones=options["repeticiones"])
+        self.stdout.write(json.dumps(resultados, indent=2, ensure_ascii=False))
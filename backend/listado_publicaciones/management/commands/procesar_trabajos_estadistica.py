@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from ...services.trabajos_estadistica_service import TrabajoEstadisticaService
+
+
+class Command(BaseCommand):
+    help = (
+        "Procesa la cola de trabajos de estadísticas (/estadisticas/trabajos/) en un pool de procesos. "
+        "Corre indefinidamente; con --una-vez termina cuando la cola queda vacía."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--procesos",
+            type=int,
+            default=settings.ESTADISTICAS_TRABAJOS_PROCESOS,
+            help="Procesos que atienden la cola (1 = en este mismo proceso)",
+        )
+        parser.add_argument("--una-vez", action="store_true", help="Terminar cuando no queden pendientes")
+
+    def handle(self, *args, **options):
+        procesos = options["procesos"]
+        if procesos < 1:
+            raise CommandError("--procesos debe ser al menos 1")
+
+        if procesos == 1:
+            procesados = TrabajoEstadisticaService.atender(options["una_vez"])
+        else:
+            procesados = TrabajoEstadisticaService.atender_en_procesos(procesos, options["una_vez"])
+        self.stdout.write(self.style.SUCCESS(f"Trabajos de estadísticas procesados: {procesados}"))
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from ...models import Publicacion, MarcaCambio
+from ...utils.dias_habiles import actualizar_vencimientos
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula fecha_vencimiento_legal de las publicaciones (PLAZO_LEGAL_DIAS hábiles con feriados). "
+        "Necesario tras cambiar PLAZO_LEGAL_DIAS o FERIADOS_ADICIONALES, o tras cargas con update()."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--solo-faltantes", action="store_true", help="Solo las publicaciones sin fecha de vencimiento"
+        )
+        parser.add_argument("--lote", type=int, default=2000, help="Publicaciones por lote")
+
+    def handle(self, *args, **options):
+        if options["lote"] < 1:
+            raise CommandError("--lote debe ser al menos 1")
+
+        actualizadas = actualizar_vencimientos(Publicacion, options["solo_faltantes"], options["lote"])
+        if actualizadas:
+            # bulk_update no emite señales: invalida los caches de estadísticas
+            MarcaCambio.registrar_cambio(Publicacion)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Vencimientos recalculados ({settings.PLAZO_LEGAL_DIAS} días hábiles): {actualizadas} publicaciones"
+            )
+        )
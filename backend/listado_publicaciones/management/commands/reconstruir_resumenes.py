@@ -0,0 +1,26 @@
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from ...services.resumen_diario_service import ResumenDiarioService
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye el rollup diario de estadísticas (ResumenDiario) desde las publicaciones, "
+        "completo o para un rango de días. Útil tras cargas masivas o correcciones con update()."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--desde", help="Primer día (AAAA-MM-DD), inclusive")
+        parser.add_argument("--hasta", help="Último día (AAAA-MM-DD), inclusive")
+
+    def handle(self, *args, **options):
+        try:
+            desde = date.fromisoformat(options["desde"]) if options["desde"] else None
+            hasta = date.fromisoformat(options["hasta"]) if options["hasta"] else None
+        except ValueError as error:
+            raise CommandError(f"Fecha inválida: {error}")
+        if desde and hasta and desde > hasta:
+            raise CommandError("--desde no puede ser posterior a --hasta")
+
+        celdas = ResumenDiarioService.reconstruir(desde, hasta)
+        self.stdout.write(self.style.SUCCESS(f"Rollup diario reconstruido: {celdas} celdas"))
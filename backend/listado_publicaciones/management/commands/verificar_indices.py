@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from ...benchmarks.seed import sembrar_municipio, base_de_datos_temporal
+from ...benchmarks.indices import verificar_indices
+
+
+class Command(BaseCommand):
+    help = "Verifica con EXPLAIN, sobre una base sembrada, que las consultas dominantes de Publicacion usan su índice."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--publicaciones", type=int, default=20000, help="Publicaciones a sembrar")
+        parser.add_argument("--semilla", type=int, default=42)
+        parser.add_argument("--planes", action="store_true", help="Muestra el plan completo de cada consulta")
+
+    def handle(self, *args, **options):
+        with base_de_datos_temporal():
+            sembrar_municipio(publicaciones=options["publicaciones"], semilla=options["semilla"])
+            resultados = verificar_indices()
+
+        sin_indice = []
+        for nombre, resultado in resultados.items():
+            estado = "OK" if resultado["usado"] else "SIN ÍNDICE"
+            self.stdout.write(f"{nombre}: {resultado['indice']} {estado}")
+            if options["planes"] or not resultado["usado"]:
+                self.stdout.write(resultado["plan"])
+            if not resultado["usado"]:
+                sin_indice.append(nombre)
+        if sin_indice:
+            raise CommandError(f"Consultas sin su índice: {', '.join(sin_indice)}")
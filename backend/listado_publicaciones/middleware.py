@@ -0,0 +1,253 @@
+"""
+Compresión negociada de respuestas (gzip, y brotli/zstd si están instalados).
+
+Se configura con settings.COMPRESION_RESPUESTAS (ver DEFAULTS_COMPRESION):
+niveles por algoritmo, tamaño mínimo y tipos de contenido permitidos. Cubre
+respuestas normales y en streaming. Los bytes ahorrados y el tiempo de CPU se
+acumulan en `estadisticas_compresion()`, se registran en el logger y se
+informan al cliente en la cabecera Server-Timing.
+"""
+import gzip
+import logging
+import threading
+import time
+import zlib
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # Dependencia opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Dependencia opcional
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS_COMPRESION = {
+    # Orden de preferencia del servidor ante igual calidad (q) del cliente
+    "ALGORITMOS": ["br", "zstd", "gzip"],
+    "NIVELES": {"br": 4, "zstd": 3, "gzip": 6},
+    # Bajo este tamaño (bytes) no conviene comprimir
+    "TAMANO_MINIMO": 1024,
+    # Prefijos de Content-Type comprimibles (xlsx y pdf ya van comprimidos)
+    "TIPOS_CONTENIDO": [
+        "application/json",
+        "application/vnd.oai.openapi",
+        "application/javascript",
+        "application/xml",
+        "text/",
+        "image/svg+xml",
+    ],
+}
+
+
+class _Gzip:
+    @staticmethod
+    def comprimir(datos, nivel):
+        return gzip.compress(datos, compresslevel=nivel, mtime=0)
+
+    def __init__(self, nivel):
+        self._compresor = zlib.compressobj(nivel, zlib.DEFLATED, 31)
+
+    def bloque(self, datos):
+        return self._compresor.compress(datos) + self._compresor.flush(zlib.Z_SYNC_FLUSH)
+
+    def terminar(self):
+        return self._compresor.flush()
+
+
+class _Brotli:
+    @staticmethod
+    def comprimir(datos, nivel):
+        return brotli.compress(datos, quality=nivel)
+
+    def __init__(self, nivel):
+        self._compresor = brotli.Compressor(quality=nivel)
+
+    def bloque(self, datos):
+        return self._compresor.process(datos) + self._compresor.flush()
+
+    def terminar(self):
+        return self._compresor.finish()
+
+
+class _Zstd:
+    @staticmethod
+    def comprimir(datos, nivel):
+        return zstandard.ZstdCompressor(level=nivel).compress(datos)
+
+    def __init__(self, nivel):
+        self._compresor = zstandard.ZstdCompressor(level=nivel).compressobj()
+
+    def bloque(self, datos):
+        return self._compresor.compress(datos) + self._compresor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def terminar(self):
+        return self._compresor.flush()
+
+
+COMPRESORES = {"gzip": _Gzip}
+if brotli is not None:
+    COMPRESORES["br"] = _Brotli
+if zstandard is not None:
+    COMPRESORES["zstd"] = _Zstd
+
+
+# Contadores del proceso (bytes antes/después y CPU usada al comprimir)
+_estadisticas = {}
+_estadisticas_lock = threading.Lock()
+
+
+def _registrar(algoritmo, original, comprimido, cpu_segundos):
+    with _estadisticas_lock:
+        datos = _estadisticas.setdefault(
+            algoritmo, {"respuestas": 0, "bytes_originales": 0, "bytes_comprimidos": 0, "cpu_segundos": 0.0}
+        )
+        datos["respuestas"] += 1
+        datos["bytes_originales"] += original
+        datos["bytes_comprimidos"] += comprimido
+        datos["cpu_segundos"] += cpu_segundos
+    logger.debug(
+        "Compresión %s: %d -> %d bytes (%.2f ms CPU)", algoritmo, original, comprimido, cpu_segundos * 1000
+    )
+
+
+def estadisticas_compresion(reiniciar=False):
+    """Totales por algoritmo, con los bytes ahorrados"""
+    with _estadisticas_lock:
+        resumen = {
+            algoritmo: dict(datos, bytes_ahorrados=datos["bytes_originales"] - datos["bytes_comprimidos"])
+            for algoritmo, datos in _estadisticas.items()
+        }
+        if reiniciar:
+            _estadisticas.clear()
+    return resumen
+
+
+def codificaciones_aceptadas(cabecera):
+    """Accept-Encoding -> {codificación: q}"""
+    aceptadas = {}
+    for parte in cabecera.split(","):
+        nombre, _, parametros = parte.partition(";")
+        nombre = nombre.strip().lower()
+        if not nombre:
+            continue
+        calidad = 1.0
+        for parametro in parametros.split(";"):
+            clave, _, valor = parametro.strip().partition("=")
+            if clave.strip().lower() == "q":
+                try:
+                    calidad = float(valor)
+                except ValueError:
+                    calidad = 0.0
+        aceptadas[nombre] = calidad
+    return aceptadas
+
+
+class CompresionRespuestaMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        configuracion = {**DEFAULTS_COMPRESION, **getattr(settings, "COMPRESION_RESPUESTAS", {})}
+        self.algoritmos = [a for a in configuracion["ALGORITMOS"] if a in COMPRESORES]
+        self.niveles = {**DEFAULTS_COMPRESION["NIVELES"], **configuracion["NIVELES"]}
+        self.tamano_minimo = configuracion["TAMANO_MINIMO"]
+        self.tipos_contenido = tuple(configuracion["TIPOS_CONTENIDO"])
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        return self.procesar(request, response)
+
+    def elegir_algoritmo(self, request):
+        aceptadas = codificaciones_aceptadas(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        comodin = aceptadas.get("*", 0.0)
+        mejor, mejor_calidad = None, 0.0
+        for algoritmo in self.algoritmos:
+            calidad = aceptadas.get(algoritmo, comodin)
+            if calidad > mejor_calidad:
+                mejor, mejor_calidad = algoritmo, calidad
+        return mejor
+
+    def es_comprimible(self, response):
+        if response.has_header("Content-Encoding"):
+            return False
+        tipo = response.get("Content-Type", "").split(";")[0].strip().lower()
+        if not tipo.startswith(self.tipos_contenido):
+            return False
+        return response.streaming or len(response.content) >= self.tamano_minimo
+
+    def procesar(self, request, response):
+        if not self.es_comprimible(response):
+            return response
+        # La representación depende de Accept-Encoding aunque esta vez no se comprima
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        algoritmo = self.elegir_algoritmo(request)
+        if algoritmo is None:
+            return response
+        compresor = COMPRESORES[algoritmo]
+        nivel = self.niveles[algoritmo]
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self._flujo_async(response.streaming_content, compresor, nivel, algoritmo)
+            else:
+                response.streaming_content = self._flujo(response.streaming_content, compresor, nivel, algoritmo)
+            del response.headers["Content-Length"]
+        else:
+            original = response.content
+            inicio = time.thread_time()
+            comprimido = compresor.comprimir(original, nivel)
+            cpu_segundos = time.thread_time() - inicio
+            if len(comprimido) >= len(original):
+                return response
+            _registrar(algoritmo, len(original), len(comprimido), cpu_segundos)
+            response.content = comprimido
+            response.headers["Content-Length"] = str(len(comprimido))
+            response.headers["Server-Timing"] = f'compresion;dur={cpu_segundos * 1000:.2f};desc="{algoritmo}"'
+
+        # El cuerpo cambió: un ETag fuerte deja de ser válido byte a byte
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = algoritmo
+        return response
+
+    @staticmethod
+    def _flujo(contenido, compresor, nivel, algoritmo):
+        flujo = compresor(nivel)
+        original = comprimido = 0
+        cpu_segundos = 0.0
+        for bloque in contenido:
+            inicio = time.thread_time()
+            salida = flujo.bloque(bloque)
+            cpu_segundos += time.thread_time() - inicio
+            original += len(bloque)
+            comprimido += len(salida)
+            if salida:
+                yield salida
+        final = flujo.terminar()
+        comprimido += len(final)
+        _registrar(algoritmo, original, comprimido, cpu_segundos)
+        yield final
+
+    @staticmethod
+    async def _flujo_async(contenido, compresor, nivel, algoritmo):
+        flujo = compresor(nivel)
+        original = comprimido = 0
+        cpu_segundos = 0.0
+        async for bloque in contenido:
+            inicio = time.thread_time()
+            salida = flujo.bloque(bloque)
+            cpu_segundos += time.thread_time() - inicio
+            original += len(bloque)
+            comprimido += len(salida)
+            if salida:
+                yield salida
+        final = flujo.terminar()
+        comprimido += len(final)
+        _registrar(algoritmo, original, comprimido, cpu_segundos)
+        yield final
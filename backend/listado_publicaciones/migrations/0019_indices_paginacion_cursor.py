@@ -0,0 +1,25 @@
+# Generated by Django 5.1.1 on 2026-10-17 03:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0018_alter_historialmodificaciones_publicacion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditoria',
+            index=models.Index(fields=['fecha', 'id'], name='idx_auditoria_fecha_id'),
+        ),
+        migrations.AddIndex(
+            model_name='historialmodificaciones',
+            index=models.Index(fields=['fecha', 'id'], name='idx_historial_fecha_id'),
+        ),
+        migrations.AddIndex(
+            model_name='publicacion',
+            index=models.Index(fields=['fecha_publicacion', 'id'], name='idx_pub_fecha_id'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.1 on 2026-10-17 03:26
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0019_indices_paginacion_cursor'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MarcaCambio',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tabla', models.CharField(max_length=100, unique=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('fecha', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
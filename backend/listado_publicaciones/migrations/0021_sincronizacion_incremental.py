@@ -0,0 +1,65 @@
+# Generated by Django 5.1.1 on 2026-10-17 03:28
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def inicializar_fecha_modificacion(apps, schema_editor):
+    """Las filas existentes parten con su fecha de creación"""
+    apps.get_model("listado_publicaciones", "Publicacion").objects.update(
+        fecha_modificacion=F("fecha_publicacion")
+    )
+    for modelo in ("AnuncioMunicipal", "RespuestaMunicipal"):
+        apps.get_model("listado_publicaciones", modelo).objects.update(fecha_modificacion=F("fecha"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0020_marcas_cambio'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegistroEliminacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tabla', models.CharField(max_length=100)),
+                ('objeto_id', models.BigIntegerField()),
+                ('fecha', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='anunciomunicipal',
+            name='fecha_modificacion',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='publicacion',
+            name='fecha_modificacion',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='respuestamunicipal',
+            name='fecha_modificacion',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(inicializar_fecha_modificacion, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='anunciomunicipal',
+            index=models.Index(fields=['fecha_modificacion', 'id'], name='idx_anuncio_fecha_mod_id'),
+        ),
+        migrations.AddIndex(
+            model_name='publicacion',
+            index=models.Index(fields=['fecha_modificacion', 'id'], name='idx_pub_fecha_mod_id'),
+        ),
+        migrations.AddIndex(
+            model_name='respuestamunicipal',
+            index=models.Index(fields=['fecha_modificacion', 'id'], name='idx_respuesta_fecha_mod_id'),
+        ),
+        migrations.AddIndex(
+            model_name='registroeliminacion',
+            index=models.Index(fields=['tabla', 'fecha'], name='idx_eliminacion_tabla_fecha'),
+        ),
+    ]
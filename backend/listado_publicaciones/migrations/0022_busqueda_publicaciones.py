@@ -0,0 +1,71 @@
+# Generated by Django 5.1.1 on 2026-10-17 12:10
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+TABLA = "listado_publicaciones_publicacion"
+
+# Pesos: A = título, B = descripción, C = ubicación
+EXPRESION_VECTOR = """
+    setweight(to_tsvector('pg_catalog.spanish', coalesce({fila}titulo, '')), 'A') ||
+    setweight(to_tsvector('pg_catalog.spanish', coalesce({fila}descripcion, '')), 'B') ||
+    setweight(to_tsvector('pg_catalog.spanish', coalesce({fila}ubicacion, '')), 'C')
+"""
+
+CREAR_BUSQUEDA = [
+    f"""
+    CREATE OR REPLACE FUNCTION publicacion_vector_busqueda() RETURNS trigger AS $$
+    BEGIN
+        NEW.vector_busqueda := {EXPRESION_VECTOR.format(fila="NEW.")};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    f"""
+    CREATE TRIGGER trg_publicacion_vector_busqueda
+    BEFORE INSERT OR UPDATE OF titulo, descripcion, ubicacion ON {TABLA}
+    FOR EACH ROW EXECUTE FUNCTION publicacion_vector_busqueda();
+    """,
+    f"UPDATE {TABLA} SET vector_busqueda = {EXPRESION_VECTOR.format(fila='')};",
+    f"CREATE INDEX idx_pub_vector_busqueda ON {TABLA} USING gin (vector_busqueda);",
+    f"CREATE INDEX idx_pub_titulo_trgm ON {TABLA} USING gin (titulo gin_trgm_ops);",
+]
+
+ELIMINAR_BUSQUEDA = [
+    "DROP INDEX IF EXISTS idx_pub_titulo_trgm;",
+    "DROP INDEX IF EXISTS idx_pub_vector_busqueda;",
+    f"DROP TRIGGER IF EXISTS trg_publicacion_vector_busqueda ON {TABLA};",
+    "DROP FUNCTION IF EXISTS publicacion_vector_busqueda();",
+]
+
+
+def _ejecutar_en_postgres(sentencias):
+    def ejecutar(apps, schema_editor):
+        # En SQLite (tests) la búsqueda usa el fallback con icontains
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for sentencia in sentencias:
+            schema_editor.execute(sentencia)
+
+    return ejecutar
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0021_sincronizacion_incremental'),
+    ]
+
+    operations = [
+        # CreateExtension no hace nada fuera de PostgreSQL
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='publicacion',
+            name='vector_busqueda',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            _ejecutar_en_postgres(CREAR_BUSQUEDA), _ejecutar_en_postgres(ELIMINAR_BUSQUEDA)
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.1 on 2026-10-17 03:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0022_busqueda_publicaciones'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='publicacion',
+            index=models.Index(fields=['departamento', 'situacion', 'fecha_publicacion'], name='idx_pub_depto_sit_fecha'),
+        ),
+        migrations.AddIndex(
+            model_name='publicacion',
+            index=models.Index(fields=['junta_vecinal', 'fecha_publicacion'], name='idx_pub_junta_fecha'),
+        ),
+        migrations.AddIndex(
+            model_name='publicacion',
+            index=models.Index(condition=models.Q(('situacion_id', 4)), fields=['fecha_publicacion'], name='idx_pub_pendiente_fecha'),
+        ),
+    ]
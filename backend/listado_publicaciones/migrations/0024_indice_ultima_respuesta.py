@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-17 03:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0023_indices_publicacion'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='respuestamunicipal',
+            index=models.Index(fields=['publicacion', '-fecha', 'id'], name='idx_respuesta_pub_fecha'),
+        ),
+    ]
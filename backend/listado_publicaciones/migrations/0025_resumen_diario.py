@@ -0,0 +1,91 @@
+# Generated by Django 5.1.1 on 2026-10-17 03:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+CAMPOS_CELDA = ("junta_vecinal_id", "categoria_id", "departamento_id", "situacion_id", "prioridad")
+
+
+def poblar_resumenes(apps, schema_editor):
+    """
+    Carga inicial del rollup con modelos históricos: la misma agregación que
+    ResumenDiarioService.reconstruir, que no se puede importar desde aquí.
+    """
+    Publicacion = apps.get_model("listado_publicaciones", "Publicacion")
+    RespuestaMunicipal = apps.get_model("listado_publicaciones", "RespuestaMunicipal")
+    ResumenDiario = apps.get_model("listado_publicaciones", "ResumenDiario")
+
+    ultima = RespuestaMunicipal.objects.filter(publicacion=models.OuterRef("pk")).order_by("-fecha", "id")
+    con_respuesta = models.Q(ultima_fecha__isnull=False)
+    puntuada = con_respuesta & models.Q(ultima_puntuacion__gt=0)
+    filas = (
+        Publicacion.objects.annotate(
+            ultima_fecha=models.Subquery(ultima.values("fecha")[:1]),
+            ultima_puntuacion=models.Subquery(ultima.values("puntuacion")[:1]),
+            dia_publicacion=TruncDate("fecha_publicacion"),
+            dia_respuesta=TruncDate("ultima_fecha"),
+            dia=TruncDate("fecha_publicacion"),
+        )
+        .values("dia", *CAMPOS_CELDA)
+        .annotate(
+            publicaciones=models.Count("id"),
+            con_respuesta=models.Count("id", filter=con_respuesta),
+            dias_respuesta=models.Sum(
+                models.ExpressionWrapper(
+                    models.F("dia_respuesta") - models.F("dia_publicacion"), output_field=models.DurationField()
+                ),
+                filter=con_respuesta & models.Q(dia_respuesta__gte=models.F("dia_publicacion")),
+            ),
+            puntuacion_suma=models.Sum("ultima_puntuacion", filter=puntuada),
+            puntuacion_cantidad=models.Count("id", filter=puntuada),
+        )
+        .order_by("dia")
+    )
+    ResumenDiario.objects.bulk_create(
+        [
+            ResumenDiario(
+                dia=fila["dia"],
+                publicaciones=fila["publicaciones"],
+                con_respuesta=fila["con_respuesta"],
+                dias_respuesta=fila["dias_respuesta"].days if fila["dias_respuesta"] else 0,
+                puntuacion_suma=fila["puntuacion_suma"] or 0,
+                puntuacion_cantidad=fila["puntuacion_cantidad"],
+                **{campo: fila[campo] for campo in CAMPOS_CELDA},
+            )
+            for fila in filas
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0024_indice_ultima_respuesta'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumenDiario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dia', models.DateField()),
+                ('prioridad', models.CharField(max_length=20)),
+                ('publicaciones', models.PositiveIntegerField(default=0)),
+                ('con_respuesta', models.PositiveIntegerField(default=0)),
+                ('dias_respuesta', models.PositiveIntegerField(default=0)),
+                ('puntuacion_suma', models.PositiveIntegerField(default=0)),
+                ('puntuacion_cantidad', models.PositiveIntegerField(default=0)),
+                ('categoria', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='listado_publicaciones.categoria')),
+                ('departamento', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='listado_publicaciones.departamentomunicipal')),
+                ('junta_vecinal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='listado_publicaciones.juntavecinal')),
+                ('situacion', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='listado_publicaciones.situacionpublicacion')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['dia'], name='idx_resumen_dia')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('situacion__isnull', False)), fields=('dia', 'junta_vecinal', 'categoria', 'departamento', 'situacion', 'prioridad'), name='uniq_resumen_diario'), models.UniqueConstraint(condition=models.Q(('situacion__isnull', True)), fields=('dia', 'junta_vecinal', 'categoria', 'departamento', 'prioridad'), name='uniq_resumen_diario_sin_situacion')],
+            },
+        ),
+        migrations.RunPython(poblar_resumenes, migrations.RunPython.noop),
+    ]
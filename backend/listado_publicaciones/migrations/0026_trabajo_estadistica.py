@@ -0,0 +1,41 @@
+# Generated by Django 5.1.1 on 2026-10-17 04:16
+
+import django.db.models.deletion
+import django.utils.timezone
+import rest_framework.utils.encoders
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0025_resumen_diario'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrabajoEstadistica',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('secciones', models.JSONField()),
+                ('filtros', models.JSONField(default=dict)),
+                ('clave', models.CharField(max_length=32)),
+                ('estado', models.CharField(choices=[('pendiente', 'Pendiente'), ('en_proceso', 'En proceso'), ('completado', 'Completado'), ('error', 'Error')], default='pendiente', max_length=20)),
+                ('progreso', models.PositiveSmallIntegerField(default=0)),
+                ('intentos', models.PositiveSmallIntegerField(default=0)),
+                ('version_datos', models.CharField(blank=True, max_length=32)),
+                ('resultado', models.JSONField(blank=True, encoder=rest_framework.utils.encoders.JSONEncoder, null=True)),
+                ('tiempos_ms', models.JSONField(default=dict)),
+                ('error', models.TextField(blank=True)),
+                ('fecha_creacion', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fecha_inicio', models.DateTimeField(blank=True, null=True)),
+                ('fecha_fin', models.DateTimeField(blank=True, null=True)),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trabajos_estadistica', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['estado', 'fecha_creacion'], name='idx_trabajo_estado_fecha'), models.Index(fields=['clave', 'estado'], name='idx_trabajo_clave_estado')],
+            },
+        ),
+    ]
@@ -0,0 +1,112 @@
+# Generated by Django 5.1.1 on 2026-10-17 04:20
+
+from datetime import date, timedelta
+import numpy as np
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+# Copia congelada del calendario de utils/dias_habiles.py (ver 0025: una
+# migración no importa código vivo). El plazo y los feriados extraordinarios
+# son configuración y se leen de settings. Si el calendario cambia después,
+# `python manage.py recalcular_vencimientos` actualiza las fechas.
+FERIADOS_FIJOS = [(1, 1), (5, 1), (5, 21), (7, 16), (8, 15), (9, 18), (9, 19), (11, 1), (12, 8), (12, 25)]
+SOLSTICIO_20_JUNIO = {2024, 2025, 2028, 2029, 2032, 2033}
+TAMANO_LOTE = 2000
+
+
+def _domingo_de_pascua(anio):
+    a = anio % 19
+    b, c = divmod(anio, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    mes, dia = divmod(h + l - 7 * m + 114, 31)
+    return date(anio, mes, dia + 1)
+
+
+def _trasladar_a_lunes(fecha):
+    dia_semana = fecha.weekday()
+    if dia_semana in (1, 2, 3):
+        return fecha - timedelta(days=dia_semana)
+    if dia_semana == 4:
+        return fecha + timedelta(days=3)
+    return fecha
+
+
+def _feriados_del_anio(anio):
+    feriados = {date(anio, mes, dia) for mes, dia in FERIADOS_FIJOS}
+    pascua = _domingo_de_pascua(anio)
+    feriados.update({pascua - timedelta(days=2), pascua - timedelta(days=1)})
+    if anio >= 2021:
+        feriados.add(date(anio, 6, 20 if anio in SOLSTICIO_20_JUNIO else 21))
+    feriados.add(_trasladar_a_lunes(date(anio, 6, 29)))
+    feriados.add(_trasladar_a_lunes(date(anio, 10, 12)))
+    if date(anio, 9, 17).weekday() == 0:
+        feriados.add(date(anio, 9, 17))
+    if date(anio, 9, 20).weekday() == 4:
+        feriados.add(date(anio, 9, 20))
+    reforma = date(anio, 10, 31)
+    if reforma.weekday() == 1:
+        reforma -= timedelta(days=4)
+    elif reforma.weekday() == 2:
+        reforma += timedelta(days=2)
+    feriados.add(reforma)
+    return feriados
+
+
+def poblar_vencimientos(apps, schema_editor):
+    """fecha_vencimiento_legal de las publicaciones existentes, por lotes de id"""
+    Publicacion = apps.get_model("listado_publicaciones", "Publicacion")
+    primera = Publicacion.objects.order_by("fecha_publicacion").values_list("fecha_publicacion", flat=True).first()
+    if primera is None:
+        return
+    plazo = settings.PLAZO_LEGAL_DIAS
+    hasta = timezone.localdate().year + plazo // 200 + 1
+    feriados = [fecha for anio in range(primera.year - 1, hasta + 1) for fecha in _feriados_del_anio(anio)]
+    feriados.extend(date.fromisoformat(fecha) for fecha in getattr(settings, "FERIADOS_ADICIONALES", ()))
+    calendario = np.busdaycalendar(weekmask="1111100", holidays=np.array(feriados, dtype="datetime64[D]"))
+
+    ultimo_id = 0
+    while True:
+        filas = list(
+            Publicacion.objects.filter(id__gt=ultimo_id)
+            .order_by("id")
+            .values_list("id", "fecha_publicacion")[:TAMANO_LOTE]
+        )
+        if not filas:
+            return
+        ultimo_id = filas[-1][0]
+        dias = np.array([timezone.localdate(fecha) for _, fecha in filas], dtype="datetime64[D]")
+        vencimientos = np.busday_offset(dias, plazo, roll="backward", busdaycal=calendario).tolist()
+        Publicacion.objects.bulk_update(
+            [
+                Publicacion(id=publicacion_id, fecha_vencimiento_legal=vencimiento)
+                for (publicacion_id, _), vencimiento in zip(filas, vencimientos)
+            ],
+            ["fecha_vencimiento_legal"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0026_trabajo_estadistica'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publicacion',
+            name='fecha_vencimiento_legal',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(poblar_vencimientos, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='publicacion',
+            index=models.Index(fields=['situacion', 'fecha_vencimiento_legal'], name='idx_pub_sit_vencimiento'),
+        ),
+    ]
@@ -0,0 +1,161 @@
+# Generated by Django 5.1.1 on 2026-10-17 04:44
+
+from django.db import migrations, models
+
+# Tablas sincronizadas (cambian con fecha_modificacion) y la de lápidas (solo altas)
+SINCRONIZADAS = {
+    modelo: f"listado_publicaciones_{modelo}"
+    for modelo in ("publicacion", "respuestamunicipal", "anunciomunicipal")
+}
+TODAS = {**SINCRONIZADAS, "registroeliminacion": "listado_publicaciones_registroeliminacion"}
+
+# PostgreSQL: el id (64 bits, sin vuelta) de la transacción que escribe la
+# fila. La sincronización lo compara con el xmin del snapshot, así que una
+# transacción que guarda antes y confirma después nunca queda detrás de una marca.
+CREAR_POSTGRES = [
+    """
+    CREATE OR REPLACE FUNCTION marcar_transaccion_sincronizacion() RETURNS trigger AS $$
+    BEGIN
+        NEW.transaccion := txid_current();
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    *[f"UPDATE {tabla} SET transaccion = txid_current();" for tabla in TODAS.values()],
+    *[
+        f"""
+        CREATE TRIGGER trg_{modelo}_transaccion_insert BEFORE INSERT ON {tabla}
+        FOR EACH ROW EXECUTE FUNCTION marcar_transaccion_sincronizacion();
+        """
+        for modelo, tabla in TODAS.items()
+    ],
+    *[
+        f"""
+        CREATE TRIGGER trg_{modelo}_transaccion_update BEFORE UPDATE OF fecha_modificacion ON {tabla}
+        FOR EACH ROW WHEN (NEW.fecha_modificacion IS DISTINCT FROM OLD.fecha_modificacion)
+        EXECUTE FUNCTION marcar_transaccion_sincronizacion();
+        """
+        for modelo, tabla in SINCRONIZADAS.items()
+    ],
+]
+
+ELIMINAR_POSTGRES = [
+    *[f"DROP TRIGGER IF EXISTS trg_{modelo}_transaccion_insert ON {tabla};" for modelo, tabla in TODAS.items()],
+    *[f"DROP TRIGGER IF EXISTS trg_{modelo}_transaccion_update ON {tabla};" for modelo, tabla in SINCRONIZADAS.items()],
+    "DROP FUNCTION IF EXISTS marcar_transaccion_sincronizacion();",
+]
+
+# SQLite (tests locales) no tiene ids de transacción, pero serializa a los
+# que escriben: un contador global que se incrementa al escribir cumple el
+# mismo papel. SQLite pierde estos triggers si una migración posterior
+# reconstruye alguna de estas tablas; habría que volver a crearlos.
+CONTADOR = "listado_publicaciones_contador_transaccion"
+
+
+def _marcar_sqlite(tabla):
+    return f"""
+        UPDATE {CONTADOR} SET valor = valor + 1;
+        UPDATE {tabla} SET transaccion = (SELECT valor FROM {CONTADOR}) WHERE id = NEW.id;
+    """
+
+
+CREAR_SQLITE = [
+    f"CREATE TABLE {CONTADOR} (valor integer NOT NULL);",
+    f"INSERT INTO {CONTADOR} (valor) VALUES (0);",
+    *[f"UPDATE {tabla} SET transaccion = 0;" for tabla in TODAS.values()],
+    *[
+        f"""
+        CREATE TRIGGER trg_{modelo}_transaccion_insert AFTER INSERT ON {tabla}
+        BEGIN {_marcar_sqlite(tabla)} END;
+        """
+        for modelo, tabla in TODAS.items()
+    ],
+    *[
+        f"""
+        CREATE TRIGGER trg_{modelo}_transaccion_update AFTER UPDATE OF fecha_modificacion ON {tabla}
+        WHEN NEW.fecha_modificacion IS NOT OLD.fecha_modificacion
+        BEGIN {_marcar_sqlite(tabla)} END;
+        """
+        for modelo, tabla in SINCRONIZADAS.items()
+    ],
+]
+
+ELIMINAR_SQLITE = [
+    *[f"DROP TRIGGER IF EXISTS trg_{modelo}_transaccion_insert;" for modelo in TODAS],
+    *[f"DROP TRIGGER IF EXISTS trg_{modelo}_transaccion_update;" for modelo in SINCRONIZADAS],
+    f"DROP TABLE IF EXISTS {CONTADOR};",
+]
+
+
+def _ejecutar(por_motor):
+    def ejecutar(apps, schema_editor):
+        for sentencia in por_motor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sentencia)
+
+    return ejecutar
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listado_publicaciones', '0027_fecha_vencimiento_legal'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='anunciomunicipal',
+            name='idx_anuncio_fecha_mod_id',
+        ),
+        migrations.RemoveIndex(
+            model_name='publicacion',
+            name='idx_pub_fecha_mod_id',
+        ),
+        migrations.RemoveIndex(
+            model_name='registroeliminacion',
+            name='idx_eliminacion_tabla_fecha',
+        ),
+        migrations.RemoveIndex(
+            model_name='respuestamunicipal',
+            name='idx_respuesta_fecha_mod_id',
+        ),
+        migrations.AddField(
+            model_name='anunciomunicipal',
+            name='transaccion',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='publicacion',
+            name='transaccion',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='registroeliminacion',
+            name='transaccion',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='respuestamunicipal',
+            name='transaccion',
+            field=models.BigIntegerField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            _ejecutar({"postgresql": CREAR_POSTGRES, "sqlite": CREAR_SQLITE}),
+            _ejecutar({"postgresql": ELIMINAR_POSTGRES, "sqlite": ELIMINAR_SQLITE}),
+        ),
+        migrations.AddIndex(
+            model_name='anunciomunicipal',
+            index=models.Index(fields=['transaccion', 'id'], name='idx_anuncio_transaccion_id'),
+        ),
+        migrations.AddIndex(
+            model_name='publicacion',
+            index=models.Index(fields=['transaccion', 'id'], name='idx_pub_transaccion_id'),
+        ),
+        migrations.AddIndex(
+            model_name='registroeliminacion',
+            index=models.Index(fields=['tabla', 'transaccion'], name='idx_eliminacion_tabla_trans'),
+        ),
+        migrations.AddIndex(
+            model_name='respuestamunicipal',
+            index=models.Index(fields=['transaccion', 'id'], name='idx_respuesta_transaccion_id'),
+        ),
+    ]
@@ -12,3 +12,5 @@ from .publicaciones import (
 )
 from .auditoria import HistorialModificaciones, Auditoria
 from .kanban import Tablero, Columna, Tarea, Comentario
+from .sincronizacion import MarcaCambio, RegistroEliminacion
+from .estadisticas import ResumenDiario, TrabajoEstadistica
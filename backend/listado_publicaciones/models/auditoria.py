@@ -15,6 +15,11 @@ class HistorialModificaciones(models.Model):
     valor_nuevo = models.TextField()
     autor = models.ForeignKey(Usuario, on_delete=models.RESTRICT)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["fecha", "id"], name="idx_historial_fecha_id"),
+        ]
+
     def __str__(self):
         return f"Historial de cambios para: {self.publicacion.titulo}"
 
@@ -28,6 +33,11 @@ class Auditoria(models.Model):
     descripcion = models.TextField()
     es_exitoso = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["fecha", "id"], name="idx_auditoria_fecha_id"),
+        ]
+
     def __str__(self):
         return f"Auditoría de cambios para: {self.codigo}"
 
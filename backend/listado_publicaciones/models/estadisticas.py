@@ -0,0 +1,106 @@
+import uuid
+from django.db import models
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+from .usuarios import Usuario
+from .organizaciones import DepartamentoMunicipal, JuntaVecinal
+from .publicaciones import Categoria, SituacionPublicacion
+
+
+class ResumenDiario(models.Model):
+    """
+    Rollup diario de publicaciones por (día local de publicación, junta,
+    categoría, departamento, situación, prioridad). Lo mantienen las señales
+    de Publicacion y RespuestaMunicipal (services/resumen_diario_service.py)
+    y se reconstruye con `manage.py reconstruir_resumenes`.
+
+    Los campos de respuesta siguen a la última respuesta de cada publicación:
+    días naturales hasta ella (días locales, como `dia` y _base_resolucion) y su
+    puntuación cuando es mayor que cero.
+    """
+
+    dia = models.DateField()
+    junta_vecinal = models.ForeignKey(JuntaVecinal, on_delete=models.CASCADE, related_name="+")
+    categoria = models.ForeignKey(Categoria, on_delete=models.CASCADE, related_name="+")
+    departamento = models.ForeignKey(DepartamentoMunicipal, on_delete=models.CASCADE, related_name="+")
+    situacion = models.ForeignKey(
+        SituacionPublicacion, on_delete=models.CASCADE, null=True, blank=True, related_name="+"
+    )
+    prioridad = models.CharField(max_length=20)
+    publicaciones = models.PositiveIntegerField(default=0)
+    con_respuesta = models.PositiveIntegerField(default=0)
+    dias_respuesta = models.PositiveIntegerField(default=0)
+    puntuacion_suma = models.PositiveIntegerField(default=0)
+    puntuacion_cantidad = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # NULL no se compara como igual en UNIQUE: la celda sin situación va aparte
+            models.UniqueConstraint(
+                fields=["dia", "junta_vecinal", "categoria", "departamento", "situacion", "prioridad"],
+                condition=models.Q(situacion__isnull=False),
+                name="uniq_resumen_diario",
+            ),
+            models.UniqueConstraint(
+                fields=["dia", "junta_vecinal", "categoria", "departamento", "prioridad"],
+                condition=models.Q(situacion__isnull=True),
+                name="uniq_resumen_diario_sin_situacion",
+            ),
+        ]
+        indexes = [models.Index(fields=["dia"], name="idx_resumen_dia")]
+
+    def __str__(self):
+        return f"{self.dia} junta {self.junta_vecinal_id}: {self.publicaciones}"
+
+
+class TrabajoEstadistica(models.Model):
+    """
+    Cálculo de estadísticas en segundo plano: secciones del dashboard sobre
+    los filtros de PublicacionFilter. La tabla es la cola: la API crea el
+    trabajo pendiente y `manage.py procesar_trabajos_estadistica` lo toma y
+    guarda el resultado (services/trabajos_estadistica_service.py).
+
+    `clave` identifica secciones y filtros; `version_datos` las marcas de
+    cambio con que se calculó, para reutilizar el resultado mientras los
+    datos no cambien.
+    """
+
+    PENDIENTE = "pendiente"
+    EN_PROCESO = "en_proceso"
+    COMPLETADO = "completado"
+    ERROR = "error"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    usuario = models.ForeignKey(Usuario, on_delete=models.CASCADE, related_name="trabajos_estadistica")
+    secciones = models.JSONField()
+    filtros = models.JSONField(default=dict)
+    clave = models.CharField(max_length=32)
+    estado = models.CharField(
+        max_length=20,
+        choices=[
+            (PENDIENTE, "Pendiente"),
+            (EN_PROCESO, "En proceso"),
+            (COMPLETADO, "Completado"),
+            (ERROR, "Error"),
+        ],
+        default=PENDIENTE,
+    )
+    progreso = models.PositiveSmallIntegerField(default=0)
+    intentos = models.PositiveSmallIntegerField(default=0)
+    version_datos = models.CharField(max_length=32, blank=True)
+    # Encoder de DRF: serializa igual que las respuestas de los endpoints
+    resultado = models.JSONField(null=True, blank=True, encoder=JSONEncoder)
+    tiempos_ms = models.JSONField(default=dict)
+    error = models.TextField(blank=True)
+    fecha_creacion = models.DateTimeField(default=timezone.now)
+    fecha_inicio = models.DateTimeField(null=True, blank=True)
+    fecha_fin = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["estado", "fecha_creacion"], name="idx_trabajo_estado_fecha"),
+            models.Index(fields=["clave", "estado"], name="idx_trabajo_clave_estado"),
+        ]
+
+    def __str__(self):
+        return f"Trabajo {self.id} ({self.estado}, {self.progreso}%)"
@@ -1,8 +1,10 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from cloudinary.models import CloudinaryField
 import uuid
 from datetime import datetime
+from ..utils.dias_habiles import vencimientos_legales
 from .usuarios import Usuario
 from .organizaciones import DepartamentoMunicipal, JuntaVecinal
 
@@ -26,6 +28,9 @@ class Categoria(models.Model):
 
     def get_cantidad_publicaciones(self):
         """Retorna la cantidad de publicaciones asociadas a esta categoría"""
+        # Si el queryset ya anotó el conteo, evitamos un COUNT por fila
+        if hasattr(self, "total_publicaciones"):
+            return self.total_publicaciones
         return Publicacion.objects.filter(categoria=self).count()
 
 
@@ -69,6 +74,37 @@ class Publicacion(models.Model):
         choices=[("alta", "Alta"), ("media", "Media"), ("baja", "Baja")],
         default="media",
     )
+    # Último día hábil del plazo legal (utils/dias_habiles.py); se calcula al
+    # guardar y `manage.py recalcular_vencimientos` lo rellena o lo actualiza
+    fecha_vencimiento_legal = models.DateField(null=True, blank=True, editable=False)
+    # Sincronización incremental (ver services/sincronizacion_service.py).
+    # `transaccion` la asigna un trigger (migración 0028) cuando cambia
+    # fecha_modificacion: es el id de la transacción que escribió la fila.
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+    transaccion = models.BigIntegerField(null=True, editable=False)
+    # Búsqueda de texto (ver services/busqueda_service.py). En PostgreSQL lo
+    # mantiene un trigger y tiene índice GIN; ambos se crean en la migración
+    # 0022 solo en ese motor, por eso no aparecen en Meta.indexes.
+    vector_busqueda = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Paginación por cursor (fecha_publicacion, id)
+            models.Index(fields=["fecha_publicacion", "id"], name="idx_pub_fecha_id"),
+            models.Index(fields=["transaccion", "id"], name="idx_pub_transaccion_id"),
+            # Dashboards: filtros por departamento y situación en un rango de fechas
+            models.Index(
+                fields=["departamento", "situacion", "fecha_publicacion"], name="idx_pub_depto_sit_fecha"
+            ),
+            # Dashboards por junta vecinal en un rango de fechas
+            models.Index(fields=["junta_vecinal", "fecha_publicacion"], name="idx_pub_junta_fecha"),
+            # Pendientes (situacion 4) por fecha: plazos vencidos sin recorrer las resueltas
+            models.Index(
+                fields=["fecha_publicacion"], condition=models.Q(situacion_id=4), name="idx_pub_pendiente_fecha"
+            ),
+            # Vencidas por situación: un rango sobre el plazo ya calculado
+            models.Index(fields=["situacion", "fecha_vencimiento_legal"], name="idx_pub_sit_vencimiento"),
+        ]
 
     def __str__(self):
         return (
@@ -77,15 +113,53 @@ class Publicacion(models.Model):
             + self.fecha_publicacion.strftime("%d/%m/%Y")
         )
 
+    @staticmethod
+    def generar_codigo():
+        current_year = str(datetime.now().year)
+        current_month = str(datetime.now().month)
+        return f"P-{current_year}-{current_month.zfill(2)}-{uuid.uuid4().hex[:8].upper()}"
+
+    @classmethod
+    def asignar_codigos(cls, publicaciones):
+        """
+        Asigna códigos únicos a un lote (para bulk_create, que no llama a save):
+        una consulta de colisiones por ronda en vez de una por publicación.
+        """
+        usados = set()
+        pendientes = [publicacion for publicacion in publicaciones if not publicacion.codigo]
+        while pendientes:
+            for publicacion in pendientes:
+                publicacion.codigo = cls.generar_codigo()
+            ocupados = set(
+                cls.objects.filter(codigo__in=[p.codigo for p in pendientes]).values_list("codigo", flat=True)
+            )
+            siguientes = []
+            for publicacion in pendientes:
+                if publicacion.codigo in ocupados or publicacion.codigo in usados:
+                    siguientes.append(publicacion)
+                else:
+                    usados.add(publicacion.codigo)
+            pendientes = siguientes
+
+    @staticmethod
+    def asignar_vencimientos(publicaciones):
+        """fecha_vencimiento_legal de un lote (para bulk_create), en una sola pasada con numpy"""
+        vencimientos = vencimientos_legales(publicacion.fecha_publicacion for publicacion in publicaciones)
+        for publicacion, vencimiento in zip(publicaciones, vencimientos):
+            publicacion.fecha_vencimiento_legal = vencimiento
+
     def save(self, *args, **kwargs):
         if not self.codigo:
-            current_year = str(datetime.now().year)
-            current_month = str(datetime.now().month)
             while True:
-                codigo_generado = f"P-{current_year}-{current_month.zfill(2)}-{uuid.uuid4().hex[:8].upper()}"
+                codigo_generado = Publicacion.generar_codigo()
                 if not Publicacion.objects.filter(codigo=codigo_generado).exists():
                     self.codigo = codigo_generado
                     break
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "fecha_publicacion" in update_fields:
+            self.fecha_vencimiento_legal = vencimientos_legales([self.fecha_publicacion])[0]
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "fecha_vencimiento_legal"}
         super().save(*args, **kwargs)
 
 
@@ -109,6 +183,13 @@ class AnuncioMunicipal(models.Model):
     descripcion = models.TextField()
     categoria = models.ForeignKey(Categoria, on_delete=models.RESTRICT)
     fecha = models.DateTimeField(default=timezone.now)
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+    transaccion = models.BigIntegerField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["transaccion", "id"], name="idx_anuncio_transaccion_id"),
+        ]
 
     def __str__(self):
         return self.titulo
@@ -139,6 +220,15 @@ class RespuestaMunicipal(models.Model):
         choices=[(i, f"{i} estrella{'s' if i != 1 else ''}") for i in range(1, 6)],
         help_text="Puntuación del 1 al 5",
     )
+    fecha_modificacion = models.DateTimeField(auto_now=True)
+    transaccion = models.BigIntegerField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["transaccion", "id"], name="idx_respuesta_transaccion_id"),
+            # Última respuesta de cada publicación (subconsulta de las estadísticas)
+            models.Index(fields=["publicacion", "-fecha", "id"], name="idx_respuesta_pub_fecha"),
+        ]
 
     def __str__(self):
         return f"Respuesta para: {self.publicacion.titulo}"
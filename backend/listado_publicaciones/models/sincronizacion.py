@@ -0,0 +1,122 @@
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+
+class IncrementoPendiente:
+    """
+    Incremento de marcas que espera el commit (ver MarcaCambio.registrar_cambio).
+    Agrupa los cambios seguidos de una misma transacción y recuerda la fecha
+    del último, para que la transacción que escribe vea sus propios cambios.
+    """
+
+    def __init__(self, tablas):
+        self.tablas = tablas
+        self.cantidad = 1
+        self.fecha = timezone.now()
+
+    def __call__(self):
+        MarcaCambio.incrementar(self.tablas, self.cantidad)
+
+
+class MarcaCambio(models.Model):
+    """
+    Marca de agua por tabla: versión y fecha del último cambio confirmado.
+    Se incrementa con las señales de guardado/eliminación (ver signals.py) y
+    permite responder GET condicionales sin recalcular los listados.
+    """
+
+    tabla = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    fecha = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.tabla} v{self.version}"
+
+    @staticmethod
+    def tabla_de(modelo):
+        return modelo._meta.label_lower
+
+    @classmethod
+    def registrar_cambio(cls, *modelos):
+        """
+        Incrementa la marca de cada modelo cuando confirma la transacción en
+        curso (de inmediato si no hay una). Con ATOMIC_REQUESTS un UPDATE
+        dentro del request dejaría la fila de la marca bloqueada hasta el
+        final y serializaría a todos los que escriben en la tabla; después
+        del commit cada incremento es una transacción corta, en orden de tabla.
+        """
+        tablas = tuple(sorted({cls.tabla_de(modelo) for modelo in modelos}))
+        conexion = transaction.get_connection()
+        if conexion.in_atomic_block and conexion.run_on_commit:
+            # Los guardados seguidos de la misma tabla comparten un incremento
+            # si un rollback los descartaría juntos (mismos savepoints)
+            savepoints, ultimo, _ = conexion.run_on_commit[-1]
+            if (
+                isinstance(ultimo, IncrementoPendiente)
+                and ultimo.tablas == tablas
+                and savepoints == set(conexion.savepoint_ids)
+            ):
+                ultimo.cantidad += 1
+                ultimo.fecha = timezone.now()
+                return
+        transaction.on_commit(IncrementoPendiente(tablas), robust=True)
+
+    @classmethod
+    def incrementar(cls, tablas, cantidad=1):
+        """Crea la fila de la marca la primera vez"""
+        ahora = timezone.now()
+        for tabla in tablas:
+            actualizadas = cls.objects.filter(tabla=tabla).update(
+                version=F("version") + cantidad, fecha=ahora
+            )
+            if not actualizadas:
+                marca, creada = cls.objects.get_or_create(
+                    tabla=tabla, defaults={"version": cantidad, "fecha": ahora}
+                )
+                if not creada:
+                    cls.objects.filter(pk=marca.pk).update(version=F("version") + cantidad, fecha=ahora)
+
+    @classmethod
+    def marcas(cls, modelos):
+        """
+        {tabla: (version, fecha)} para los modelos pedidos, en una sola
+        consulta. Dentro de una transacción que ya escribió, suma los
+        incrementos que esperan su commit: sus lecturas no reutilizan
+        respuestas ni resultados calculados sin esos cambios.
+        """
+        tablas = [cls.tabla_de(modelo) for modelo in modelos]
+        marcas = {
+            tabla: (version, fecha)
+            for tabla, version, fecha in cls.objects.filter(tabla__in=tablas).values_list(
+                "tabla", "version", "fecha"
+            )
+        }
+        for _, funcion, _ in transaction.get_connection().run_on_commit:
+            if isinstance(funcion, IncrementoPendiente):
+                for tabla in set(funcion.tablas).intersection(tablas):
+                    version, fecha = marcas.get(tabla, (0, None))
+                    fecha = funcion.fecha if fecha is None else max(fecha, funcion.fecha)
+                    marcas[tabla] = (version + funcion.cantidad, fecha)
+        return marcas
+
+
+class RegistroEliminacion(models.Model):
+    """
+    Lápida de una fila eliminada, para que la sincronización incremental de la
+    app móvil pueda informar las eliminaciones (ver signals.py).
+    """
+
+    tabla = models.CharField(max_length=100)
+    objeto_id = models.BigIntegerField()
+    fecha = models.DateTimeField(default=timezone.now)
+    # Id de la transacción que eliminó la fila (trigger de la migración 0028)
+    transaccion = models.BigIntegerField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["tabla", "transaccion"], name="idx_eliminacion_tabla_trans"),
+        ]
+
+    def __str__(self):
+        return f"{self.tabla} #{self.objeto_id} eliminado"
@@ -92,9 +92,13 @@ class Usuario(AbstractBaseUser, PermissionsMixin):
 
         # Si es personal municipal, buscar asignación activa
         if self.tipo_usuario in ["personal", "jefe_departamento"]:
-            asignacion_activa = self.asignaciones_departamento.filter(
-                estado="activo", fecha_fin_asignacion__isnull=True
-            ).first()
+            # Si el queryset precargó las asignaciones activas (to_attr), evitamos la consulta
+            if hasattr(self, "asignaciones_activas"):
+                asignacion_activa = next(iter(self.asignaciones_activas), None)
+            else:
+                asignacion_activa = self.asignaciones_departamento.filter(
+                    estado="activo", fecha_fin_asignacion__isnull=True
+                ).first()
             if asignacion_activa:
                 return asignacion_activa.departamento
 
@@ -1,4 +1,142 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginación por cursor sobre (campo, id), sin OFFSET ni COUNT(*).
+
+    La vista define `keyset_campo` (por ejemplo "fecha_publicacion"). Respeta
+    la dirección elegida con ?ordering= sobre ese campo; por defecto es
+    descendente. El id desempata filas con la misma fecha.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 5
+    page_size_query_param = "pagesize"
+    max_page_size = 100
+    invalid_cursor_message = "Cursor inválido"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.campo = getattr(view, "keyset_campo")
+        self.campo_modelo = queryset.model._meta.get_field(self.campo)
+        self.page_size = self.get_page_size(request)
+        self.descendente = self._es_descendente(queryset)
+
+        cursor = self.decode_cursor(request)
+        hacia_atras = bool(cursor and cursor["atras"])
+
+        # Al retroceder se recorre en sentido inverso y luego se invierte la página
+        descendente = self.descendente != hacia_atras
+        signo = "-" if descendente else ""
+        queryset = queryset.order_by(f"{signo}{self.campo}", f"{signo}id")
+        if cursor:
+            operador = "lt" if descendente else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{self.campo}__{operador}": cursor["valor"]})
+                | Q(**{self.campo: cursor["valor"], f"id__{operador}": cursor["id"]})
+            )
+
+        resultados = list(queryset[: self.page_size + 1])
+        hay_mas = len(resultados) > self.page_size
+        resultados = resultados[: self.page_size]
+        if hacia_atras:
+            resultados.reverse()
+
+        self.page = resultados
+        if hacia_atras:
+            self.hay_siguiente, self.hay_anterior = True, hay_mas
+        else:
+            self.hay_siguiente, self.hay_anterior = hay_mas, cursor is not None
+        return resultados
+
+    def get_page_size(self, request):
+        try:
+            valor = int(request.query_params[self.page_size_query_param])
+            if valor > 0:
+                return min(valor, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    def _es_descendente(self, queryset):
+        orden = queryset.query.order_by
+        if orden and orden[0].lstrip("-") == self.campo:
+            return orden[0].startswith("-")
+        return True
+
+    def decode_cursor(self, request):
+        codificado = request.query_params.get(self.cursor_query_param)
+        if not codificado:
+            return None
+        try:
+            datos = json.loads(base64.urlsafe_b64decode(codificado.encode("ascii")).decode("utf-8"))
+            # El valor se valida con el tipo del campo: un cursor alterado no debe
+            # llegar a la consulta (fallaría al evaluarla, con un 500)
+            valor = self.campo_modelo.to_python(datos["v"])
+            if valor is None:
+                raise ValueError
+            return {"valor": valor, "id": int(datos["id"]), "atras": bool(datos.get("r"))}
+        except (TypeError, ValueError, KeyError, UnicodeDecodeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instancia, atras=False):
+        valor = getattr(instancia, self.campo)
+        datos = {"v": valor.isoformat() if hasattr(valor, "isoformat") else valor, "id": instancia.id}
+        if atras:
+            datos["r"] = 1
+        codificado = base64.urlsafe_b64encode(json.dumps(datos).encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, codificado)
+
+    def get_next_link(self):
+        if not self.hay_siguiente or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self):
+        if not self.hay_anterior:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], atras=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    @classmethod
+    def solicitada(cls, request, view):
+        """Modo cursor opt-in: ?cursor=... o ?paginacion=cursor en vistas con `keyset_campo`."""
+        if not getattr(view, "keyset_campo", None):
+            return False
+        return (
+            cls.cursor_query_param in request.query_params
+            or request.query_params.get("paginacion") == "cursor"
+        )
 
 
 # Paginación de las publicaciones
@@ -6,3 +144,28 @@ class DynamicPageNumberPagination(PageNumberPagination):
     page_size = 5
     page_size_query_param = "pagesize"
     max_page_size = 100
+
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if KeysetPagination.solicitada(request, view):
+            self.keyset = KeysetPagination()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class CursorOpcionalPagination(DynamicPageNumberPagination):
+    """
+    Para endpoints que históricamente no paginan: sin parámetros responde la
+    lista completa y solo pagina cuando se pide el modo cursor.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not KeysetPagination.solicitada(request, view):
+            return None
+        return super().paginate_queryset(queryset, request, view)
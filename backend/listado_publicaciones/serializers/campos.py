@@ -0,0 +1,149 @@
+"""
+Campos dinámicos (?fields= / ?expand=) para los serializers de lectura.
+
+- ?fields=id,titulo,usuario           -> solo esos campos; las relaciones van como id
+- ?fields=id,usuario.nombre           -> la relación se expande con los subcampos pedidos
+- ?fields=id,usuario&expand=usuario   -> la relación se expande completa
+Sin ?fields= la representación es la de siempre.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.fields import SerializerMethodField
+
+# Marca para una relación que se expande con todos sus campos
+EXPANDIR = "__expandir__"
+
+
+def parsear_campos(fields, expand=None):
+    """
+    Convierte los parámetros en un árbol {campo: None | EXPANDIR | {subcampos}}.
+    Retorna None si no se pidió ?fields= (representación completa).
+    """
+    if not fields:
+        return None
+
+    arbol = {}
+    for ruta in fields.split(","):
+        partes = [parte.strip() for parte in ruta.split(".") if parte.strip()]
+        nodo = arbol
+        for i, parte in enumerate(partes):
+            if i == len(partes) - 1:
+                nodo.setdefault(parte, None)
+            else:
+                if not isinstance(nodo.get(parte), dict):
+                    nodo[parte] = {}
+                nodo = nodo[parte]
+
+    for ruta in (expand or "").split(","):
+        partes = [parte.strip() for parte in ruta.split(".") if parte.strip()]
+        nodo = arbol
+        for i, parte in enumerate(partes):
+            if i == len(partes) - 1:
+                if parte in nodo and nodo[parte] is None:
+                    nodo[parte] = EXPANDIR
+            elif isinstance(nodo.get(parte), dict):
+                nodo = nodo[parte]
+            else:
+                break
+    return arbol
+
+
+def campos_desde_request(request):
+    if request is None:
+        return None
+    return parsear_campos(
+        request.query_params.get("fields"), request.query_params.get("expand")
+    )
+
+
+class CamposDinamicosMixin:
+    """
+    Recibe `campos` (árbol de parsear_campos) y recorta los campos del
+    serializer. Las relaciones no expandidas se reemplazan por su id.
+    """
+
+    def __init__(self, *args, campos=None, **kwargs):
+        self._campos = campos
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._campos or self._campos == EXPANDIR:
+            return fields
+
+        seleccion = {}
+        for nombre, subcampos in self._campos.items():
+            if nombre not in fields:
+                continue
+            seleccion[nombre] = self._ajustar_relacion(nombre, fields[nombre], subcampos)
+        return seleccion
+
+    def _ajustar_relacion(self, nombre, campo, subcampos):
+        es_lista = isinstance(campo, serializers.ListSerializer)
+        anidado = campo.child if es_lista else campo
+        if not isinstance(anidado, serializers.BaseSerializer) or subcampos == EXPANDIR:
+            return campo
+
+        kwargs = {"read_only": True, "many": es_lista}
+        if campo.source and campo.source != nombre:
+            kwargs["source"] = campo.source
+
+        if subcampos is None:
+            return serializers.PrimaryKeyRelatedField(**kwargs)
+        if isinstance(anidado, CamposDinamicosMixin):
+            return type(anidado)(campos=subcampos, **kwargs)
+        return campo
+
+    @classmethod
+    def columnas_requeridas(cls, campos):
+        """
+        Columnas del modelo necesarias para los campos pedidos, para usar con
+        .only(). Retorna None si no se puede acotar (p. ej. SerializerMethodField).
+        """
+        if not campos:
+            return None
+
+        modelo = cls.Meta.model
+        declarados = cls().fields
+        columnas = {"id"}
+        for nombre in campos:
+            campo = declarados.get(nombre)
+            if campo is None:
+                continue
+            if isinstance(campo, SerializerMethodField):
+                return None
+
+            fuente = campo.source.split(".")[0]
+            if fuente.startswith("get_") and fuente.endswith("_display"):
+                fuente = fuente[len("get_"):-len("_display")]
+            try:
+                campo_modelo = modelo._meta.get_field(fuente)
+            except FieldDoesNotExist:
+                # Métodos o relaciones inversas: no agregan columnas propias
+                if not hasattr(modelo, fuente) or callable(getattr(modelo, fuente, None)):
+                    return None
+                continue
+            if campo_modelo.concrete:
+                columnas.add(campo_modelo.name)
+        return sorted(columnas)
+
+
+class PrimaryKeyPrecargadoField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField que, si el contexto trae `precargados`
+    ({nombre_campo: {pk: instancia}}, p. ej. con in_bulk para un lote completo),
+    resuelve la instancia sin consultar. Sin precarga se comporta igual que DRF.
+    """
+
+    def to_internal_value(self, data):
+        precargados = self.context.get("precargados", {}).get(self.field_name)
+        if precargados is None or isinstance(data, bool):
+            return super().to_internal_value(data)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            return super().to_internal_value(data)
+        instancia = precargados.get(pk)
+        if instancia is None:
+            self.fail("does_not_exist", pk_value=data)
+        return instancia
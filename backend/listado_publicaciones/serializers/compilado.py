@@ -0,0 +1,235 @@
+"""
+Serialización compilada para listados de solo lectura.
+
+Recorrer los campos de un ModelSerializer anidado, campo por campo, domina el
+CPU en los listados grandes. Aquí se precalcula por clase un "plan": para cada
+campo una función que lee el atributo y lo convierte, y para los serializers
+anidados su propio plan. El resultado es el mismo diccionario que entrega DRF
+(mismas claves, mismo orden, mismos valores) a partir de instancias ya
+precargadas con select_related/prefetch_related. Los serializers anidados con
+MemoRepresentacionMixin se serializan una sola vez por objeto y llamada.
+
+Los campos que el plan no reconoce usan la ruta normal de DRF para ese campo,
+así que la salida nunca difiere.
+"""
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.db.models import Manager
+from rest_framework import serializers
+from rest_framework.fields import SkipField, is_simple_callable
+from rest_framework.relations import PKOnlyObject
+from .memo import MemoRepresentacionMixin
+
+# Cache de planes por clase de serializer
+_planes = {}
+
+# (clase, atributo) -> si DRF llamaría al atributo (is_simple_callable usa inspect y es caro)
+_llamables = {}
+
+# Campos de valor simple cuyo atributo se puede leer directamente
+_CAMPOS_SIMPLES = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.FloatField,
+    serializers.DecimalField,
+    serializers.DateTimeField,
+    serializers.DateField,
+    serializers.ChoiceField,
+    serializers.ReadOnlyField,
+)
+
+
+def _lector(campo):
+    """
+    Función que obtiene el valor crudo del campo. Ante cualquier caso especial
+    (atributo faltante, relación nula intermedia) delega en DRF para respetar
+    default/allow_null/SkipField exactamente igual.
+    """
+    atributos = tuple(campo.source_attrs)
+
+    def leer(instancia):
+        valor = instancia
+        try:
+            for atributo in atributos:
+                padre = valor
+                valor = getattr(padre, atributo)
+                if callable(valor):
+                    clave = (type(padre), atributo)
+                    llamar = _llamables.get(clave)
+                    if llamar is None:
+                        llamar = not isinstance(valor, Manager) and is_simple_callable(valor)
+                        _llamables[clave] = llamar
+                    if llamar:
+                        valor = valor()
+        except ObjectDoesNotExist:
+            return None
+        except (AttributeError, KeyError):
+            return campo.get_attribute(instancia)
+        return valor
+
+    return leer
+
+
+def _conversor_simple(campo):
+    """Evita to_representation cuando el valor ya es del tipo nativo de salida."""
+    if type(campo) is serializers.CharField:
+        return lambda valor: valor if type(valor) is str else str(valor)
+    if type(campo) is serializers.BooleanField:
+        convertir = campo.to_representation
+        return lambda valor: valor if type(valor) is bool else convertir(valor)
+    if type(campo) is serializers.IntegerField:
+        return lambda valor: valor if type(valor) is int else int(valor)
+    return campo.to_representation
+
+
+class PlanSerializacion:
+    """Plan precalculado para una clase de serializer (sin estado por request)."""
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self.pasos = ()
+        self.metodos = ()
+
+    def construir(self):
+        prototipo = self.serializer_class()
+        pasos, metodos = [], []
+        for nombre, campo in prototipo.fields.items():
+            if campo.write_only:
+                continue
+            if isinstance(campo, serializers.SerializerMethodField):
+                metodos.append(campo.method_name)
+            pasos.append((nombre, self._paso(campo)))
+        self.pasos = tuple(pasos)
+        self.metodos = tuple(metodos)
+
+    def _paso(self, campo):
+        """Función (instancia, metodos) -> valor serializado para un campo enlazado."""
+        plan = self
+
+        if isinstance(campo, serializers.SerializerMethodField):
+            nombre_metodo = campo.method_name
+            return lambda instancia, metodos: metodos[plan][nombre_metodo](instancia)
+
+        if isinstance(campo, serializers.ListSerializer):
+            plan_hijo = compilar(type(campo.child))
+            serializar_hijo = plan_hijo.serializador_anidado()
+            leer = _lector(campo)
+
+            def serializar(instancia, metodos):
+                relacionados = leer(instancia)
+                if relacionados is None:
+                    return None
+                if isinstance(relacionados, Manager):
+                    relacionados = relacionados.all()
+                return [serializar_hijo(hijo, metodos) for hijo in relacionados]
+
+            return serializar
+
+        if isinstance(campo, serializers.BaseSerializer):
+            serializar_hijo = compilar(type(campo)).serializador_anidado()
+            leer = _lector(campo)
+
+            def serializar(instancia, metodos):
+                relacionado = leer(instancia)
+                if relacionado is None:
+                    return None
+                return serializar_hijo(relacionado, metodos)
+
+            return serializar
+
+        if (
+            isinstance(campo, serializers.PrimaryKeyRelatedField)
+            and campo.pk_field is None
+            and len(campo.source_attrs) == 1
+        ):
+            # FK como id: se lee la columna <campo>_id sin cargar el objeto relacionado
+            try:
+                columna = self.serializer_class.Meta.model._meta.get_field(campo.source_attrs[0]).attname
+            except (AttributeError, FieldDoesNotExist):
+                columna = None
+            if columna:
+                return lambda instancia, metodos: getattr(instancia, columna)
+
+        if isinstance(campo, _CAMPOS_SIMPLES):
+            leer = _lector(campo)
+            convertir = _conversor_simple(campo)
+
+            def serializar(instancia, metodos):
+                valor = leer(instancia)
+                return None if valor is None else convertir(valor)
+
+            return serializar
+
+        # Cualquier otro campo: exactamente la ruta de Serializer.to_representation
+        def serializar(instancia, metodos):
+            valor = campo.get_attribute(instancia)
+            vacio = valor.pk if isinstance(valor, PKOnlyObject) else valor
+            return None if vacio is None else campo.to_representation(valor)
+
+        return serializar
+
+    def serializar_uno(self, instancia, metodos):
+        resultado = {}
+        for nombre, serializar in self.pasos:
+            try:
+                resultado[nombre] = serializar(instancia, metodos)
+            except SkipField:
+                continue
+        return resultado
+
+    def serializar_memo(self, instancia, metodos):
+        """serializar_uno con identity map por (plan, pk) dentro de la llamada"""
+        pk = instancia.pk
+        if pk is None:
+            return self.serializar_uno(instancia, metodos)
+        clave = (self, pk)
+        resultado = metodos.representaciones.get(clave)
+        if resultado is None:
+            resultado = metodos.representaciones[clave] = self.serializar_uno(instancia, metodos)
+        return resultado
+
+    def serializador_anidado(self):
+        if issubclass(self.serializer_class, MemoRepresentacionMixin):
+            return self.serializar_memo
+        return self.serializar_uno
+
+
+class _MetodosPorPlan(dict):
+    """
+    SerializerMethodField necesita un serializer con contexto: se crea uno por
+    clase y por llamada (no por fila) y se guardan sus métodos enlazados.
+    También guarda las representaciones anidadas ya calculadas en la llamada.
+    """
+
+    def __init__(self, contexto):
+        super().__init__()
+        self.contexto = contexto
+        self.representaciones = {}
+
+    def __missing__(self, plan):
+        serializer = plan.serializer_class(context=self.contexto)
+        metodos = {nombre: getattr(serializer, nombre) for nombre in plan.metodos}
+        self[plan] = metodos
+        return metodos
+
+
+def compilar(serializer_class):
+    """Plan cacheado por clase; se construye la primera vez que se usa."""
+    plan = _planes.get(serializer_class)
+    if plan is None:
+        plan = PlanSerializacion(serializer_class)
+        # Se registra antes de construir por si hay serializers recursivos
+        _planes[serializer_class] = plan
+        try:
+            plan.construir()
+        except Exception:
+            del _planes[serializer_class]
+            raise
+    return plan
+
+
+def serializar_compilado(serializer_class, instancias, contexto=None):
+    """Equivalente a serializer_class(instancias, many=True, context=contexto).data"""
+    plan = compilar(serializer_class)
+    metodos = _MetodosPorPlan(contexto or {})
+    return [plan.serializar_uno(instancia, metodos) for instancia in instancias]
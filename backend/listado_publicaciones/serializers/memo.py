@@ -0,0 +1,35 @@
+"""
+Identity map de representaciones anidadas dentro de una misma respuesta.
+
+En una página de publicaciones, historial o tareas se repiten los mismos
+usuarios, categorías, departamentos y juntas. Con este mixin cada objeto
+anidado se serializa (y se consulta, p. ej. get_departamento_asignado) una
+sola vez por respuesta: la representación queda en el contexto del serializer
+raíz, que vive lo que dura la respuesta.
+"""
+
+# Clave del contexto donde se guardan las representaciones ya calculadas
+CLAVE_MEMO = "_representaciones"
+
+
+class MemoRepresentacionMixin:
+    """Para serializers usados como campo anidado (no cambia la salida)."""
+
+    def _memo(self):
+        # El serializer raíz y las filas de un listado raíz no se repiten
+        if self.root is self or self.root is self.parent:
+            return None
+        return self.context.setdefault(CLAVE_MEMO, {})
+
+    def to_representation(self, instance):
+        pk = getattr(instance, "pk", None)
+        memo = self._memo() if pk is not None else None
+        if memo is None:
+            return super().to_representation(instance)
+
+        # Los campos dinámicos (?fields=) cambian la representación: son parte de la clave
+        clave = (type(self), repr(getattr(self, "_campos", None)), instance._meta.label, pk)
+        representacion = memo.get(clave)
+        if representacion is None:
+            representacion = memo[clave] = super().to_representation(instance)
+        return representacion
@@ -1,13 +1,16 @@
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.db.models import Count, Prefetch
 from ..models import *
 from ..services.geo_service import GeoService
 from ..services.media_service import MediaService
 from ..utils.validators import validar_rut, validar_email_unico
+from .campos import CamposDinamicosMixin, PrimaryKeyPrecargadoField
+from .memo import MemoRepresentacionMixin
 
 
 # Serializer para Usuario
-class UsuarioListSerializer(serializers.ModelSerializer):
+class UsuarioListSerializer(MemoRepresentacionMixin, CamposDinamicosMixin, serializers.ModelSerializer):
     tipo_usuario_display = serializers.CharField(
         source="get_tipo_usuario_display", read_only=True
     )
@@ -30,6 +33,25 @@ class UsuarioListSerializer(serializers.ModelSerializer):
             "departamento_asignado",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset=None):
+        """
+        Precarga lo que usa get_departamento_asignado (departamento dirigido y
+        asignación activa) para no consultar por cada usuario serializado.
+        """
+        queryset = Usuario.objects.all() if queryset is None else queryset
+        return queryset.select_related("departamento_dirigido").prefetch_related(
+            Prefetch(
+                "asignaciones_departamento",
+                queryset=UsuarioDepartamento.objects.filter(
+                    estado="activo", fecha_fin_asignacion__isnull=True
+                )
+                .select_related("departamento")
+                .order_by("id"),
+                to_attr="asignaciones_activas",
+            )
+        )
+
     def get_departamento_asignado(self, obj):
         """Retorna el departamento asignado del usuario o 'No aplica'"""
         departamento = obj.get_departamento_asignado()
@@ -176,7 +198,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
 
 # Serializer para Departamento Municipal (versión simple para evitar referencias circulares)
-class DepartamentoMunicipalSimpleSerializer(serializers.ModelSerializer):
+class DepartamentoMunicipalSimpleSerializer(MemoRepresentacionMixin, CamposDinamicosMixin, serializers.ModelSerializer):
     estado_display = serializers.CharField(source="get_estado_display", read_only=True)
 
     class Meta:
@@ -260,7 +282,7 @@ class UsuarioDepartamentoCreateUpdateSerializer(serializers.ModelSerializer):
 
 
 # Serializer para Categoria
-class CategoriaSerializer(serializers.ModelSerializer):
+class CategoriaSerializer(MemoRepresentacionMixin, CamposDinamicosMixin, serializers.ModelSerializer):
     departamento = DepartamentoMunicipalSimpleSerializer(read_only=True)
     estado_display = serializers.CharField(source="get_estado_display", read_only=True)
     cantidad_publicaciones = serializers.IntegerField(
@@ -280,6 +302,14 @@ class CategoriaSerializer(serializers.ModelSerializer):
             "fecha_creacion",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset=None):
+        """Categorías con el departamento y el conteo de publicaciones en una sola consulta"""
+        queryset = Categoria.objects.all() if queryset is None else queryset
+        return queryset.select_related("departamento").annotate(
+            total_publicaciones=Count("publicacion")
+        )
+
     def get_cantidad_publicaciones(self):
         return self.get_cantidad_publicaciones()
 
@@ -298,7 +328,7 @@ class CategoriaCreateUpdateSerializer(serializers.ModelSerializer):
 
 
 # Serializer para Junta Vecinal
-class JuntaVecinalSerializer(serializers.ModelSerializer):
+class JuntaVecinalSerializer(MemoRepresentacionMixin, CamposDinamicosMixin, serializers.ModelSerializer):
     estado_display = serializers.CharField(source="get_estado_display", read_only=True)
 
     class Meta:
@@ -317,14 +347,14 @@ class JuntaVecinalSerializer(serializers.ModelSerializer):
 
 
 # Serializer para Situacion de Publicacion
-class SituacionPublicacionSerializer(serializers.ModelSerializer):
+class SituacionPublicacionSerializer(MemoRepresentacionMixin, CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = SituacionPublicacion
         fields = ["id", "nombre", "descripcion"]
 
 
 # Serializer para Evidencia
-class EvidenciaSerializer(serializers.ModelSerializer):
+class EvidenciaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     publicacion_id = serializers.PrimaryKeyRelatedField(
         queryset=Publicacion.objects.all()
     )
@@ -360,7 +390,7 @@ class EvidenciaSerializer(serializers.ModelSerializer):
 
 
 # Serializer para Publicacion
-class PublicacionListSerializer(serializers.ModelSerializer):
+class PublicacionListSerializer(MemoRepresentacionMixin, CamposDinamicosMixin, serializers.ModelSerializer):
     usuario = UsuarioListSerializer(read_only=True)
     junta_vecinal = JuntaVecinalSerializer(read_only=True)
     categoria = CategoriaSerializer(read_only=True)
@@ -395,9 +425,99 @@ class PublicacionListSerializer(serializers.ModelSerializer):
             "evidencias",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset, campos=None):
+        """
+        Aplica select_related/Prefetch para que serializar una página de
+        publicaciones use un número constante de consultas.
+
+        Con `campos` (ver serializers/campos.py) solo se leen las columnas y
+        relaciones que se van a serializar.
+        """
+        relacionados = {"junta_vecinal", "departamento", "situacion"}
+        precargas = {
+            "usuario": Prefetch("usuario", queryset=UsuarioListSerializer.queryset_optimizado()),
+            "encargado": Prefetch("encargado", queryset=UsuarioListSerializer.queryset_optimizado()),
+            "categoria": Prefetch("categoria", queryset=CategoriaSerializer.queryset_optimizado()),
+            "evidencias": "evidencia_set",
+        }
+        if campos is None:
+            return queryset.select_related(*relacionados).prefetch_related(*precargas.values())
+
+        expandidos = {nombre for nombre, subcampos in campos.items() if subcampos is not None}
+        columnas = PublicacionListSerializer.columnas_requeridas(campos)
+        if columnas is not None:
+            # fecha_publicacion siempre se lee: es el orden por defecto y la clave del cursor
+            queryset = queryset.only(*columnas, "fecha_publicacion")
+
+        prefetch = [precargas[nombre] for nombre in precargas if nombre in expandidos]
+        if "evidencias" in campos and "evidencias" not in expandidos:
+            prefetch.append(
+                Prefetch("evidencia_set", queryset=Evidencia.objects.only("id", "publicacion_id"))
+            )
+        # select_related() sin argumentos seguiría todas las FK: solo se llama si hay alguna
+        if relacionados & expandidos:
+            queryset = queryset.select_related(*(relacionados & expandidos))
+        return queryset.prefetch_related(*prefetch)
+
+
+class PublicacionLiteSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+    """
+    Representación compacta (?perfil=lite) para el historial de la app móvil:
+    sin objetos anidados, solo los nombres de las relaciones.
+    """
+
+    situacion_nombre = serializers.CharField(source="situacion.nombre", read_only=True, default=None)
+    categoria_nombre = serializers.CharField(source="categoria.nombre", read_only=True)
+    departamento_nombre = serializers.CharField(source="departamento.nombre", read_only=True)
+    junta_vecinal_nombre = serializers.CharField(source="junta_vecinal.nombre_junta", read_only=True)
+    prioridad_display = serializers.CharField(
+        source="get_prioridad_display", read_only=True
+    )
+
+    class Meta:
+        model = Publicacion
+        fields = [
+            "id",
+            "codigo",
+            "titulo",
+            "fecha_publicacion",
+            "situacion",
+            "situacion_nombre",
+            "categoria_nombre",
+            "departamento_nombre",
+            "junta_vecinal_nombre",
+            "prioridad",
+            "prioridad_display",
+            "latitud",
+            "longitud",
+        ]
+
+    @staticmethod
+    def queryset_optimizado(queryset):
+        """Una sola consulta con solo las columnas que usa el perfil lite"""
+        return queryset.select_related(
+            "situacion", "categoria", "departamento", "junta_vecinal"
+        ).only(
+            "id",
+            "codigo",
+            "titulo",
+            "fecha_publicacion",
+            "prioridad",
+            "latitud",
+            "longitud",
+            "situacion__nombre",
+            "categoria__nombre",
+            "departamento__nombre",
+            "junta_vecinal__nombre_junta",
+        )
+
 
 class PublicacionCreateUpdateSerializer(serializers.ModelSerializer):
-    junta_vecinal = serializers.PrimaryKeyRelatedField(
+    # Las relaciones se pueden resolver desde context["precargados"] (creación por lote)
+    serializer_related_field = PrimaryKeyPrecargadoField
+
+    junta_vecinal = PrimaryKeyPrecargadoField(
         queryset=JuntaVecinal.objects.filter(estado="habilitado"),
         required=False,
         allow_null=True,
@@ -475,7 +595,7 @@ class PublicacionCreateUpdateSerializer(serializers.ModelSerializer):
             # Auto-detección para creación
             if auto_detectar and not data.get("junta_vecinal"):
                 junta_mas_cercana = GeoService.encontrar_junta_vecinal_mas_cercana(
-                    latitud, longitud
+                    latitud, longitud, self.context.get("juntas_vecinales")
                 )
                 if junta_mas_cercana:
                     data["junta_vecinal"] = junta_mas_cercana
@@ -664,6 +784,15 @@ class AnuncioMunicipalListSerializer(serializers.ModelSerializer):
             "imagenes",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset):
+        """Usuario, categoría e imágenes precargados para el listado de anuncios"""
+        return queryset.prefetch_related(
+            Prefetch("usuario", queryset=UsuarioListSerializer.queryset_optimizado()),
+            Prefetch("categoria", queryset=CategoriaSerializer.queryset_optimizado()),
+            "imagenanuncio_set",
+        )
+
 
 class AnuncioMunicipalCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -745,6 +874,18 @@ class RespuestaMunicipalListSerializer(serializers.ModelSerializer):
             "evidencias",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset):
+        """Respuestas con su autor, la publicación completa y evidencias precargadas"""
+        return queryset.prefetch_related(
+            Prefetch("usuario", queryset=UsuarioListSerializer.queryset_optimizado()),
+            Prefetch(
+                "publicacion",
+                queryset=PublicacionListSerializer.queryset_optimizado(Publicacion.objects.all()),
+            ),
+            "evidencias",
+        )
+
     def get_puntuacion_display(self, obj):
         if obj.puntuacion:
             return f"{obj.puntuacion} estrella{'s' if obj.puntuacion != 1 else ''}"
@@ -779,6 +920,17 @@ class HistorialModificacionesSerializer(serializers.ModelSerializer):
             "autor",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset):
+        """Publicación (con sus relaciones) y autor precargados para el listado de historial"""
+        return queryset.prefetch_related(
+            Prefetch(
+                "publicacion",
+                queryset=PublicacionListSerializer.queryset_optimizado(Publicacion.objects.all()),
+            ),
+            Prefetch("autor", queryset=UsuarioListSerializer.queryset_optimizado()),
+        )
+
 
 # Serializer para Auditoría
 class AuditoriaSerializer(serializers.ModelSerializer):
@@ -799,7 +951,7 @@ class AuditoriaSerializer(serializers.ModelSerializer):
 
 
 # Serializers para Kanban
-class ColumnaSimpleSerializer(serializers.ModelSerializer):
+class ColumnaSimpleSerializer(MemoRepresentacionMixin, serializers.ModelSerializer):
     tareas_count = serializers.SerializerMethodField()
 
     class Meta:
@@ -814,11 +966,14 @@ class ColumnaSimpleSerializer(serializers.ModelSerializer):
         ]
 
     def get_tareas_count(self, obj):
+        # Si el queryset ya anotó el conteo, evitamos un COUNT por columna
+        if hasattr(obj, "total_tareas"):
+            return obj.total_tareas
         return obj.tareas.count()
 
 
 # Serializer simple para Publicacion (para evitar referencias circulares)
-class PublicacionSimpleSerializer(serializers.ModelSerializer):
+class PublicacionSimpleSerializer(MemoRepresentacionMixin, serializers.ModelSerializer):
     usuario_nombre = serializers.CharField(source="usuario.nombre", read_only=True)
     categoria_nombre = serializers.CharField(source="categoria.nombre", read_only=True)
     prioridad_display = serializers.CharField(
@@ -866,6 +1021,19 @@ class TareaListSerializer(serializers.ModelSerializer):
             "publicaciones",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset):
+        """Columna (con su conteo), encargado, categoría y publicaciones precargados"""
+        return queryset.prefetch_related(
+            Prefetch("columna", queryset=Columna.objects.annotate(total_tareas=Count("tareas"))),
+            Prefetch("encargado", queryset=UsuarioListSerializer.queryset_optimizado()),
+            Prefetch("categoria", queryset=CategoriaSerializer.queryset_optimizado()),
+            Prefetch(
+                "publicaciones",
+                queryset=Publicacion.objects.select_related("usuario", "categoria").order_by("id"),
+            ),
+        )
+
 
 class ColumnaSerializer(serializers.ModelSerializer):
     tareas_count = serializers.SerializerMethodField()
@@ -883,6 +1051,13 @@ class ColumnaSerializer(serializers.ModelSerializer):
             "tareas",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset):
+        """Tareas precargadas: tareas_count usa el mismo prefetch"""
+        return queryset.prefetch_related(
+            Prefetch("tareas", queryset=TareaListSerializer.queryset_optimizado(Tarea.objects.all()))
+        )
+
     def get_tareas_count(self, obj):
         return obj.tareas.count()
 
@@ -917,6 +1092,13 @@ class ComentarioSerializer(serializers.ModelSerializer):
             "fecha_creacion",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset):
+        return queryset.prefetch_related(
+            Prefetch("tarea", queryset=TareaListSerializer.queryset_optimizado(Tarea.objects.all())),
+            Prefetch("usuario", queryset=UsuarioListSerializer.queryset_optimizado()),
+        )
+
 
 class TableroSerializer(serializers.ModelSerializer):
     columnas = ColumnaSerializer(many=True, read_only=True)
@@ -933,6 +1115,12 @@ class TableroSerializer(serializers.ModelSerializer):
             "columnas",
         ]
 
+    @staticmethod
+    def queryset_optimizado(queryset):
+        return queryset.select_related("departamento").prefetch_related(
+            Prefetch("columnas", queryset=ColumnaSerializer.queryset_optimizado(Columna.objects.all()))
+        )
+
 
 class PublicacionConHistorialSerializer(PublicacionListSerializer):
     """
@@ -962,3 +1150,23 @@ class PublicacionConHistorialSerializer(PublicacionListSerializer):
             return obj.historialmodificaciones.count()
         # Fallback por si no se hizo prefetch (menos eficiente)
         return obj.historialmodificaciones.count()
+
+
+class TrabajoEstadisticaSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TrabajoEstadistica
+        fields = [
+            "id",
+            "estado",
+            "progreso",
+            "secciones",
+            "filtros",
+            "resultado",
+            "tiempos_ms",
+            "error",
+            "intentos",
+            "fecha_creacion",
+            "fecha_inicio",
+            "fecha_fin",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,64 @@
+"""
+Búsqueda de publicaciones por texto en titulo, descripcion y ubicacion.
+
+En PostgreSQL usa `vector_busqueda` (mantenido por un trigger, con índice GIN)
+y websearch_to_tsquery en español, más similitud de trigramas sobre el título
+(operador %>, índice gin_trgm_ops) para tolerar errores de tipeo. El puntaje
+suma el rango del texto completo y la similitud de los títulos que pasan el
+umbral de %> (por debajo solo es ruido frente a los pesos A/B/C). En otros
+motores (SQLite en los tests) cada palabra se busca con icontains y el
+puntaje pondera el campo donde aparece.
+"""
+from django.db import connections
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+
+CONFIGURACION_BUSQUEDA = "spanish"
+LONGITUD_MINIMA_BUSQUEDA = 2
+
+# Mismos pesos relativos que A/B/C en el vector de PostgreSQL
+PESOS_CAMPOS = {"titulo": 1.0, "descripcion": 0.4, "ubicacion": 0.2}
+
+
+class BusquedaPublicacionesService:
+    @staticmethod
+    def buscar(queryset, texto):
+        """
+        Filtra `queryset` por `texto` y lo ordena por relevancia (anota `puntaje`).
+        Se aplica después de los filtros, así que acepta los de PublicacionFilter.
+        """
+        texto = (texto or "").strip()
+        if connections[queryset.db].vendor == "postgresql":
+            queryset = BusquedaPublicacionesService._buscar_postgres(queryset, texto)
+        else:
+            queryset = BusquedaPublicacionesService._buscar_simple(queryset, texto)
+        return queryset.order_by("-puntaje", "-fecha_publicacion", "-id")
+
+    @staticmethod
+    def _buscar_postgres(queryset, texto):
+        consulta = SearchQuery(texto, config=CONFIGURACION_BUSQUEDA, search_type="websearch")
+        similar = Q(titulo__trigram_word_similar=texto)
+        similitud = Case(
+            When(similar, then=TrigramWordSimilarity(texto, "titulo")),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+        return queryset.filter(Q(vector_busqueda=consulta) | similar).annotate(
+            puntaje=SearchRank(F("vector_busqueda"), consulta) + similitud
+        )
+
+    @staticmethod
+    def _buscar_simple(queryset, texto):
+        palabras = texto.split()
+        puntaje = Value(0.0, output_field=FloatField())
+        for palabra in palabras:
+            coincide = Q()
+            for campo, peso in PESOS_CAMPOS.items():
+                coincide |= Q(**{f"{campo}__icontains": palabra})
+                puntaje = puntaje + Case(
+                    When(**{f"{campo}__icontains": palabra}, then=Value(peso)),
+                    default=Value(0.0),
+                    output_field=FloatField(),
+                )
+            queryset = queryset.filter(coincide)
+        return queryset.annotate(puntaje=puntaje)
@@ -0,0 +1,112 @@
+"""
+Dashboard de estadísticas en una sola llamada (/estadisticas/dashboard/).
+
+Todas las secciones parten de la misma base filtrada, que se resuelve una vez:
+el rollup diario para los conteos (services/resumen_diario_service.py) y el
+conjunto de publicaciones compartido (utils/conjuntos_filtrados.py) para los
+análisis por junta. Las secciones son independientes y se reparten en un
+ThreadPoolExecutor de settings.ESTADISTICAS_DASHBOARD_HILOS hilos; cada hilo
+usa su propia conexión de Django y la cierra al terminar. En PostgreSQL cada
+sección corre en su propio backend; en SQLite las funciones de fecha se
+evalúan en Python con el GIL y conviene ESTADISTICAS_DASHBOARD_HILOS=1.
+
+Dentro de una transacción abierta (tests, o una vista con ATOMIC_REQUESTS) las
+conexiones de otros hilos no verían sus escrituras, así que se calcula en
+secuencia.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connection
+from ..utils.conjuntos_filtrados import queryset_filtrado
+from .resumen_diario_service import ResumenDiarioService
+from .statistics_service import StatisticsService
+
+BASE_RESUMEN = "resumen"
+BASE_PUBLICACIONES = "publicaciones"
+
+# Sección -> (base, cálculo). Cada cálculo devuelve lo mismo que su endpoint
+# individual; criticidad, eficiencia y frio son los de /publicaciones-junta/,
+# /junta-eficiente/ y /resueltas-junta/.
+SECCIONES = {
+    "resumen": (BASE_RESUMEN, StatisticsService.get_resumen_estadisticas),
+    "mes_categoria": (BASE_RESUMEN, StatisticsService.get_publicaciones_por_mes_categoria),
+    "categorias": (BASE_RESUMEN, lambda qs: list(StatisticsService.get_publicaciones_por_categoria(qs))),
+    "resueltos_mes": (BASE_RESUMEN, StatisticsService.get_resueltos_por_mes),
+    "tasa_departamento": (BASE_RESUMEN, StatisticsService.get_tasa_resolucion_departamento),
+    "criticidad": (BASE_PUBLICACIONES, StatisticsService.get_analisis_criticidad_juntas),
+    "eficiencia": (BASE_PUBLICACIONES, StatisticsService.get_estadisticas_eficiencia_completa),
+    "frio": (BASE_PUBLICACIONES, StatisticsService.get_analisis_frio_juntas),
+}
+
+
+def _milisegundos(inicio):
+    return round((time.perf_counter() - inicio) * 1000, 1)
+
+
+class DashboardService:
+    @staticmethod
+    def secciones_desconocidas(secciones):
+        return [seccion for seccion in secciones if seccion not in SECCIONES]
+
+    @staticmethod
+    def bases(filterset, secciones):
+        """Querysets base que necesitan las secciones, resueltos una sola vez"""
+        usadas = {SECCIONES[seccion][0] for seccion in secciones}
+        bases = {}
+        if BASE_PUBLICACIONES in usadas:
+            bases[BASE_PUBLICACIONES] = queryset_filtrado(filterset)
+        if BASE_RESUMEN in usadas:
+            resumen = ResumenDiarioService.queryset_filtrado(filterset)
+            if resumen is None:
+                resumen = bases[BASE_PUBLICACIONES] if BASE_PUBLICACIONES in bases else queryset_filtrado(filterset)
+            bases[BASE_RESUMEN] = resumen
+        return bases
+
+    @staticmethod
+    def calcular_seccion(seccion, base):
+        inicio = time.perf_counter()
+        datos = SECCIONES[seccion][1](base.all())
+        return datos, _milisegundos(inicio)
+
+    @staticmethod
+    def _calcular_en_hilo(seccion, base):
+        try:
+            return DashboardService.calcular_seccion(seccion, base)
+        finally:
+            # La conexión pertenece al hilo del pool, que no la vuelve a usar
+            connection.close()
+
+    @staticmethod
+    def calcular(filterset, secciones=None):
+        """
+        Secciones pedidas (todas por defecto) sobre un PublicacionFilter ya
+        validado: {"secciones", "tiempos_ms", "tiempo_total_ms", "en_paralelo"}.
+        """
+        inicio = time.perf_counter()
+        secciones = list(dict.fromkeys(secciones or SECCIONES))
+        bases = DashboardService.bases(filterset, secciones)
+        tiempos = {"base_filtrada": _milisegundos(inicio)}
+
+        hilos = min(settings.ESTADISTICAS_DASHBOARD_HILOS, len(secciones))
+        en_paralelo = hilos > 1 and not connection.in_atomic_block
+        if en_paralelo:
+            with ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="dashboard") as pool:
+                futuros = {
+                    seccion: pool.submit(DashboardService._calcular_en_hilo, seccion, bases[SECCIONES[seccion][0]])
+                    for seccion in secciones
+                }
+                resultados = {seccion: futuro.result() for seccion, futuro in futuros.items()}
+        else:
+            resultados = {
+                seccion: DashboardService.calcular_seccion(seccion, bases[SECCIONES[seccion][0]])
+                for seccion in secciones
+            }
+
+        tiempos.update({seccion: tiempo for seccion, (_, tiempo) in resultados.items()})
+        return {
+            "secciones": {seccion: datos for seccion, (datos, _) in resultados.items()},
+            "tiempos_ms": tiempos,
+            "tiempo_total_ms": _milisegundos(inicio),
+            "en_paralelo": en_paralelo,
+        }
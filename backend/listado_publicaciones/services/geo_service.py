@@ -27,14 +27,18 @@ class GeoService:
         return c * r
 
     @staticmethod
-    def encontrar_junta_vecinal_mas_cercana(latitud, longitud):
+    def encontrar_junta_vecinal_mas_cercana(latitud, longitud, juntas_vecinales=None):
         """
         Encuentra la junta vecinal más cercana a las coordenadas dadas.
         Retorna la instancia de JuntaVecinal más cercana.
+        `juntas_vecinales` permite pasar las juntas habilitadas ya cargadas
+        (p. ej. al procesar un lote) para no consultarlas en cada llamada.
         """
-        juntas_vecinales = JuntaVecinal.objects.filter(estado="habilitado")
-
-        if not juntas_vecinales.exists():
+        if juntas_vecinales is None:
+            juntas_vecinales = JuntaVecinal.objects.filter(estado="habilitado")
+            if not juntas_vecinales.exists():
+                return None
+        elif not juntas_vecinales:
             return None
 
         distancia_minima = float("inf")
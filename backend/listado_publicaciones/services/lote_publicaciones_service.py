@@ -0,0 +1,89 @@
+from django.db import transaction
+from ..models import Publicacion, JuntaVecinal, MarcaCambio
+from ..serializers.campos import PrimaryKeyPrecargadoField
+from ..serializers.v1 import PublicacionCreateUpdateSerializer
+from .resumen_diario_service import ResumenDiarioService
+
+# Máximo de publicaciones por envío (cola offline de la app móvil)
+TAMANO_MAXIMO_LOTE = 100
+
+
+class LotePublicacionesService:
+    @staticmethod
+    def _ids(items, nombre):
+        ids = set()
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            valor = item.get(nombre)
+            if isinstance(valor, bool):
+                continue
+            try:
+                ids.add(int(valor))
+            except (TypeError, ValueError):
+                continue
+        return ids
+
+    @staticmethod
+    def contexto_precargado(items, contexto=None):
+        """
+        Contexto para validar todo el lote sin consultas por ítem: cada relación
+        (respetando el queryset del campo) con un in_bulk, y las juntas
+        habilitadas una sola vez para la detección automática.
+        """
+        contexto = dict(contexto or {})
+        prototipo = PublicacionCreateUpdateSerializer(context=contexto)
+        precargados = {}
+        for nombre, campo in prototipo.fields.items():
+            if isinstance(campo, PrimaryKeyPrecargadoField) and not campo.read_only:
+                ids = LotePublicacionesService._ids(items, nombre)
+                precargados[nombre] = campo.get_queryset().in_bulk(ids) if ids else {}
+        contexto["precargados"] = precargados
+        contexto["juntas_vecinales"] = list(JuntaVecinal.objects.filter(estado="habilitado"))
+        return contexto
+
+    @staticmethod
+    def crear(items, contexto=None):
+        """
+        Valida cada ítem con PublicacionCreateUpdateSerializer, inserta los
+        válidos con un solo bulk_create y retorna un resultado por ítem (en el
+        mismo orden). Los ítems inválidos no impiden crear el resto.
+        """
+        contexto = LotePublicacionesService.contexto_precargado(items, contexto)
+
+        resultados = []
+        nuevas = []
+        for indice, item in enumerate(items):
+            resultado = {"indice": indice}
+            if isinstance(item, dict) and "id_local" in item:
+                resultado["id_local"] = item["id_local"]
+
+            serializer = PublicacionCreateUpdateSerializer(data=item, context=contexto)
+            if not serializer.is_valid():
+                resultado.update({"estado": "error", "errores": serializer.errors})
+            else:
+                datos = dict(serializer.validated_data)
+                # Igual que PublicacionCreateUpdateSerializer.create: el departamento sale de la categoría
+                datos["departamento_id"] = datos["categoria"].departamento_id
+                nuevas.append((resultado, Publicacion(**datos)))
+            resultados.append(resultado)
+
+        if nuevas:
+            publicaciones = [publicacion for _, publicacion in nuevas]
+            with transaction.atomic():
+                Publicacion.asignar_codigos(publicaciones)
+                Publicacion.asignar_vencimientos(publicaciones)
+                Publicacion.objects.bulk_create(publicaciones)
+                # bulk_create no emite señales
+                MarcaCambio.registrar_cambio(Publicacion)
+                ResumenDiarioService.recalcular_al_confirmar(ResumenDiarioService.clave(p) for p in publicaciones)
+
+            for resultado, publicacion in nuevas:
+                resultado.update({
+                    "estado": "creada",
+                    "id": publicacion.id,
+                    "codigo": publicacion.codigo,
+                    "junta_vecinal": publicacion.junta_vecinal_id,
+                })
+
+        return resultados, len(nuevas)
@@ -0,0 +1,246 @@
+"""
+Mantenimiento del rollup diario de publicaciones (models/estadisticas.py).
+
+Cada celda (día local, junta, categoría, departamento, situación, prioridad)
+se recalcula completa desde Publicacion al guardar o eliminar una publicación
+o una respuesta: es una agregación acotada a los días y juntas afectados
+(idx_pub_junta_fecha) y, al no sumar deltas, una celda no arrastra errores
+de una señal perdida (bulk_create, update()) más allá de su próxima
+escritura. Las filas se bloquean con select_for_update mientras se reescriben.
+
+Las señales no recalculan dentro de la transacción que escribe: con
+ATOMIC_REQUESTS los bloqueos de las celdas durarían todo el request y
+serializarían a las escrituras de la misma junta y día. Las celdas se juntan
+en un RecalculoPendiente que corre al confirmar, en su propia transacción
+corta, y lee lo ya confirmado. Si la misma transacción lee después el rollup
+(queryset_filtrado), sus celdas pendientes se recalculan antes de leer.
+
+La marca de Publicacion sube antes que el recálculo (sus señales se conectan
+primero), así que entre ambos el cache de estadísticas podría guardar
+celdas viejas con la clave nueva. Cada reescritura del rollup incrementa
+además la marca de ResumenDiario, que está en TABLAS_ESTADISTICAS: lo
+guardado en ese intervalo queda inalcanzable.
+
+Las estadísticas que solo cuentan publicaciones (resumen, por mes, por
+categoría, por departamento y por junta) leen el rollup con los mismos
+filtros de PublicacionFilter; con filtros que el rollup no tiene (usuario,
+relaciones) se sigue consultando Publicacion.
+"""
+from datetime import datetime, time, timedelta
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from ..filters import ResumenDiarioFilter
+from ..models import MarcaCambio, Publicacion, ResumenDiario
+from ..utils.conjuntos_filtrados import filtros_normalizados
+from .statistics_service import StatisticsService
+
+CAMPOS_CELDA = ("junta_vecinal_id", "categoria_id", "departamento_id", "situacion_id", "prioridad")
+# Campos de Publicacion que mueven una publicación de celda
+CAMPOS_CLAVE = {"fecha_publicacion", "junta_vecinal", "categoria", "departamento", "situacion", "prioridad"}
+# Filtros de PublicacionFilter que el rollup puede responder
+FILTROS_RESUMEN = {"junta_vecinal", "departamento", "categoria", "categoria_ids", "situacion", "fecha_publicacion"}
+CONTADORES = ["publicaciones", "con_respuesta", "dias_respuesta", "puntuacion_suma", "puntuacion_cantidad"]
+TAMANO_LOTE_RESUMEN = 1000
+
+
+class RecalculoPendiente:
+    """Celdas del rollup que esperan el commit (ver ResumenDiarioService.recalcular_al_confirmar)"""
+
+    def __init__(self):
+        self.claves = set()
+
+    def __call__(self):
+        # None: ya corrió y no admite más celdas
+        claves, self.claves = self.claves, None
+        ResumenDiarioService.recalcular(claves)
+
+
+class ResumenDiarioService:
+    @staticmethod
+    def clave(publicacion):
+        """(día local, junta, categoría, departamento, situación, prioridad) de una publicación"""
+        return (timezone.localdate(publicacion.fecha_publicacion),) + tuple(
+            getattr(publicacion, campo) for campo in CAMPOS_CELDA
+        )
+
+    @staticmethod
+    def claves_de(publicacion_ids):
+        filas = Publicacion.objects.filter(id__in=publicacion_ids).values_list("fecha_publicacion", *CAMPOS_CELDA)
+        return {(timezone.localdate(fila[0]),) + tuple(fila[1:]) for fila in filas}
+
+    @staticmethod
+    def _agregados(queryset):
+        """
+        Queryset con la última respuesta anotada y los contadores del rollup.
+        Los días de respuesta son locales, como `dia` y StatisticsService._base_resolucion.
+        """
+        queryset = StatisticsService.anotar_ultima_respuesta(queryset.order_by()).annotate(
+            dia_publicacion=TruncDate("fecha_publicacion"),
+            dia_respuesta=TruncDate("ultima_respuesta_fecha"),
+        )
+        con_respuesta = Q(ultima_respuesta_fecha__isnull=False)
+        puntuada = con_respuesta & Q(ultima_respuesta_puntuacion__gt=0)
+        return queryset, {
+            "publicaciones": Count("id"),
+            "con_respuesta": Count("id", filter=con_respuesta),
+            "dias_respuesta": Sum(
+                ExpressionWrapper(F("dia_respuesta") - F("dia_publicacion"), output_field=DurationField()),
+                filter=con_respuesta & Q(dia_respuesta__gte=F("dia_publicacion")),
+            ),
+            "puntuacion_suma": Sum("ultima_respuesta_puntuacion", filter=puntuada),
+            "puntuacion_cantidad": Count("id", filter=puntuada),
+        }
+
+    @staticmethod
+    def _celdas_agregadas(publicaciones):
+        """{clave: contadores} de las publicaciones, agrupadas por celda"""
+        queryset, agregados = ResumenDiarioService._agregados(publicaciones)
+        filas = (
+            queryset.annotate(dia=TruncDate("fecha_publicacion"))
+            .values("dia", *CAMPOS_CELDA)
+            .annotate(**agregados)
+        )
+        celdas = {}
+        for fila in filas:
+            dias = fila["dias_respuesta"]
+            celdas[(fila["dia"],) + tuple(fila[campo] for campo in CAMPOS_CELDA)] = {
+                "publicaciones": fila["publicaciones"],
+                "con_respuesta": fila["con_respuesta"],
+                "dias_respuesta": dias.days if dias else 0,
+                "puntuacion_suma": fila["puntuacion_suma"] or 0,
+                "puntuacion_cantidad": fila["puntuacion_cantidad"],
+            }
+        return celdas
+
+    @staticmethod
+    def _rango_dia(dia):
+        inicio = timezone.make_aware(datetime.combine(dia, time.min))
+        fin = timezone.make_aware(datetime.combine(dia + timedelta(days=1), time.min))
+        return inicio, fin
+
+    @staticmethod
+    def recalcular(claves):
+        """
+        Reescribe las celdas indicadas (claves de ResumenDiarioService.clave)
+        con un número fijo de consultas, sea una publicación o un lote.
+        """
+        claves = set(claves)
+        if not claves:
+            return
+        try:
+            with transaction.atomic():
+                ResumenDiarioService._recalcular_celdas(claves)
+                MarcaCambio.registrar_cambio(ResumenDiario)
+        except IntegrityError:
+            # Otra transacción creó alguna celda: ahora existe y se puede bloquear
+            with transaction.atomic():
+                ResumenDiarioService._recalcular_celdas(claves)
+                MarcaCambio.registrar_cambio(ResumenDiario)
+
+    @staticmethod
+    def recalcular_al_confirmar(claves):
+        """
+        Recalcula las celdas cuando confirma la transacción en curso (de
+        inmediato si no hay una). Las celdas de una misma transacción se
+        recalculan juntas; se suman a un pendiente que un rollback solo
+        descartaría junto con estas escrituras (sus savepoints están abiertos).
+        """
+        conexion = transaction.get_connection()
+        savepoints = set(conexion.savepoint_ids)
+        if conexion.in_atomic_block:
+            for registrados, funcion, _ in conexion.run_on_commit:
+                if (
+                    isinstance(funcion, RecalculoPendiente)
+                    and funcion.claves is not None
+                    and registrados <= savepoints
+                ):
+                    funcion.claves.update(claves)
+                    return
+        pendiente = RecalculoPendiente()
+        pendiente.claves.update(claves)
+        transaction.on_commit(pendiente, robust=True)
+
+    @staticmethod
+    def aplicar_pendientes():
+        """Recalcula ya las celdas que la transacción en curso dejó para el commit"""
+        for _, funcion, _ in transaction.get_connection().run_on_commit:
+            if isinstance(funcion, RecalculoPendiente) and funcion.claves:
+                ResumenDiarioService.recalcular(funcion.claves)
+                funcion.claves = set()
+
+    @staticmethod
+    def _recalcular_celdas(claves):
+        dias = {clave[0] for clave in claves}
+        juntas = {clave[1] for clave in claves}
+        existentes = {
+            (fila.dia,) + tuple(getattr(fila, campo) for campo in CAMPOS_CELDA): fila
+            for fila in ResumenDiario.objects.select_for_update().filter(dia__in=dias, junta_vecinal_id__in=juntas)
+        }
+        en_los_dias = Q()
+        for dia in dias:
+            inicio, fin = ResumenDiarioService._rango_dia(dia)
+            en_los_dias |= Q(fecha_publicacion__gte=inicio, fecha_publicacion__lt=fin)
+        calculadas = ResumenDiarioService._celdas_agregadas(
+            Publicacion.objects.filter(en_los_dias, junta_vecinal_id__in=juntas)
+        )
+
+        vacias, actualizadas, nuevas = [], [], []
+        for clave in claves:
+            fila, contadores = existentes.get(clave), calculadas.get(clave)
+            if contadores is None:
+                if fila is not None:
+                    vacias.append(fila.id)
+            elif fila is not None:
+                for campo, valor in contadores.items():
+                    setattr(fila, campo, valor)
+                actualizadas.append(fila)
+            else:
+                nuevas.append(ResumenDiario(dia=clave[0], **dict(zip(CAMPOS_CELDA, clave[1:])), **contadores))
+
+        if vacias:
+            ResumenDiario.objects.filter(id__in=vacias).delete()
+        if actualizadas:
+            ResumenDiario.objects.bulk_update(actualizadas, CONTADORES, batch_size=TAMANO_LOTE_RESUMEN)
+        if nuevas:
+            ResumenDiario.objects.bulk_create(nuevas, batch_size=TAMANO_LOTE_RESUMEN)
+
+    @staticmethod
+    def reconstruir(desde=None, hasta=None):
+        """
+        Regenera el rollup de los días locales [desde, hasta] (todo si no se
+        indican) con una consulta agrupada. Retorna la cantidad de celdas.
+        """
+        publicaciones = Publicacion.objects.all()
+        resumenes = ResumenDiario.objects.all()
+        if desde is not None:
+            publicaciones = publicaciones.filter(fecha_publicacion__gte=ResumenDiarioService._rango_dia(desde)[0])
+            resumenes = resumenes.filter(dia__gte=desde)
+        if hasta is not None:
+            publicaciones = publicaciones.filter(fecha_publicacion__lt=ResumenDiarioService._rango_dia(hasta)[1])
+            resumenes = resumenes.filter(dia__lte=hasta)
+
+        celdas = [
+            ResumenDiario(dia=clave[0], **dict(zip(CAMPOS_CELDA, clave[1:])), **contadores)
+            for clave, contadores in ResumenDiarioService._celdas_agregadas(publicaciones).items()
+        ]
+        with transaction.atomic():
+            resumenes.delete()
+            ResumenDiario.objects.bulk_create(celdas, batch_size=TAMANO_LOTE_RESUMEN)
+            MarcaCambio.registrar_cambio(ResumenDiario)
+        return len(celdas)
+
+    @staticmethod
+    def queryset_filtrado(filterset):
+        """
+        Rollup filtrado igual que `filterset` (un PublicacionFilter validado),
+        o None si tiene filtros activos que el rollup no puede responder.
+        """
+        activos = {nombre for nombre, _ in filtros_normalizados(filterset)}
+        if activos - FILTROS_RESUMEN:
+            return None
+        ResumenDiarioService.aplicar_pendientes()
+        filtro = ResumenDiarioFilter(filterset.data, queryset=ResumenDiario.objects.all())
+        filtro.is_valid()
+        return filtro.qs
@@ -0,0 +1,124 @@
+import base64
+import json
+from django.db import connection
+from django.db.models import Q
+from ..models import Publicacion, RespuestaMunicipal, AnuncioMunicipal, MarcaCambio, RegistroEliminacion
+from ..serializers.compilado import serializar_compilado
+from ..serializers.v1 import (
+    PublicacionListSerializer,
+    RespuestaMunicipalListSerializer,
+    AnuncioMunicipalListSerializer,
+)
+
+# Recurso de la API -> (modelo, serializer de listado)
+RECURSOS_SINCRONIZABLES = {
+    "publicaciones": (Publicacion, PublicacionListSerializer),
+    "respuestas": (RespuestaMunicipal, RespuestaMunicipalListSerializer),
+    "anuncios": (AnuncioMunicipal, AnuncioMunicipalListSerializer),
+}
+
+# Cada fila sincronizable guarda en `transaccion` el id de la transacción
+# que la escribió (trigger de la migración 0028). La marca del cliente no es
+# una fecha sino un piso de transacciones: todas las anteriores ya habían
+# terminado cuando se leyó, así que una transacción que guarda antes y
+# confirma después de una sincronización aparece en la siguiente.
+PISO_TRANSACCIONES = {
+    "postgresql": "SELECT txid_snapshot_xmin(txid_current_snapshot())",
+    # Sin ids de transacción: contador global que incrementan los triggers
+    "sqlite": "SELECT valor + 1 FROM listado_publicaciones_contador_transaccion",
+}
+
+
+class MarcaInvalida(ValueError):
+    pass
+
+
+class SincronizacionService:
+    @staticmethod
+    def piso_transacciones():
+        """Menor id de transacción que aún puede estar en curso"""
+        with connection.cursor() as cursor:
+            cursor.execute(PISO_TRANSACCIONES[connection.vendor])
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def codificar_marca(desde, inicio=None, ultima=None):
+        """
+        `desde`: piso de la sincronización anterior. Si la página se cortó,
+        `inicio` es el piso de esta pasada y `ultima` la (transaccion, id) de
+        la última fila entregada.
+        """
+        datos = {"d": desde}
+        if ultima is not None:
+            datos.update({"i": inicio, "t": ultima[0], "id": ultima[1]})
+        return base64.urlsafe_b64encode(json.dumps(datos).encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decodificar_marca(marca):
+        """(desde, inicio, ultima); inicio y ultima son None si la pasada anterior terminó"""
+        try:
+            datos = json.loads(base64.urlsafe_b64decode(marca.encode("ascii")).decode("utf-8"))
+            if "f" in datos:
+                # Marca por fecha (anterior a la migración 0028): se reenvía todo
+                return 0, None, None
+            valores = [datos["d"]]
+            if "t" in datos:
+                valores += [datos["i"], datos["t"], datos["id"]]
+            if not all(isinstance(valor, int) and not isinstance(valor, bool) for valor in valores):
+                raise ValueError
+            if len(valores) == 1:
+                return valores[0], None, None
+            return valores[0], valores[1], (valores[2], valores[3])
+        except (TypeError, ValueError, KeyError, UnicodeDecodeError, AttributeError):
+            raise MarcaInvalida("Marca de sincronización inválida")
+
+    @staticmethod
+    def cambios(recurso, marca=None, limite=200, contexto=None):
+        """
+        Filas creadas/modificadas por transacciones desde `marca`, en orden
+        (transaccion, id), y en la última página los ids eliminados. Sin marca
+        entrega todo (sincronización inicial). La entrega es "al menos una
+        vez": una fila puede repetirse en la sincronización siguiente.
+        Retorna la nueva marca para la siguiente llamada y si quedan cambios.
+        """
+        modelo, serializer_class = RECURSOS_SINCRONIZABLES[recurso]
+        desde, inicio, ultima = 0, None, None
+        if marca:
+            desde, inicio, ultima = SincronizacionService.decodificar_marca(marca)
+        if inicio is None:
+            # Se lee antes que las filas: lo que confirme después queda sobre el piso
+            inicio = SincronizacionService.piso_transacciones()
+
+        queryset = modelo.objects.filter(transaccion__gte=desde)
+        if ultima is not None:
+            transaccion, ultimo_id = ultima
+            queryset = queryset.filter(
+                Q(transaccion__gt=transaccion) | Q(transaccion=transaccion, id__gt=ultimo_id)
+            )
+
+        filas = list(serializer_class.queryset_optimizado(queryset.order_by("transaccion", "id"))[: limite + 1])
+        hay_mas = len(filas) > limite
+        filas = filas[:limite]
+
+        eliminados = []
+        if hay_mas:
+            nueva_marca = SincronizacionService.codificar_marca(
+                desde, inicio, (filas[-1].transaccion, filas[-1].id)
+            )
+        else:
+            nueva_marca = SincronizacionService.codificar_marca(inicio)
+            # Las lápidas van al cerrar la pasada; la sincronización inicial no las necesita
+            if marca:
+                eliminados = list(
+                    RegistroEliminacion.objects.filter(tabla=MarcaCambio.tabla_de(modelo), transaccion__gte=desde)
+                    .order_by("transaccion", "id")
+                    .values_list("objeto_id", flat=True)
+                )
+
+        return {
+            "recurso": recurso,
+            "marca": nueva_marca,
+            "hay_mas": hay_mas,
+            "actualizados": serializar_compilado(serializer_class, filas, contexto),
+            "eliminados": eliminados,
+        }
@@ -1,6 +1,10 @@
-import pandas as pd
-from django.db.models import Count, Q, Case, When, F, FloatField, ExpressionWrapper, Avg, Prefetch
-from django.db.models.functions import TruncMonth
+import numpy as np
+from django.conf import settings
+from django.db.models import (
+    Count, Q, Case, When, F, FloatField, ExpressionWrapper, Avg, Prefetch,
+    Sum, Min, Max, Value, DateField, DurationField, OuterRef, Subquery,
+)
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from ..models import (
     Publicacion,
@@ -12,19 +16,36 @@ from ..models import (
     HistorialModificaciones,
     Usuario,
 )
+from ..utils.cache_estadisticas import cache_estadisticas
+from ..utils import distribucion_tiempos, series_tiempo
 from ..utils.constants import MESES_ESPANOL
+from ..utils.dias_habiles import dias_habiles_entre, corte_vencimiento, limite_plazo_vencido
 
 
 class StatisticsService:
+    """
+    Los métodos get_* guardan su resultado en el cache de estadísticas
+    (utils/cache_estadisticas.py), que se invalida con cada escritura.
+    """
+
     MESES_ESPANOL = MESES_ESPANOL
 
+    # Los conteos por mes, categoría, departamento y junta aceptan también el
+    # rollup diario (ResumenDiario), que suma `publicaciones` en vez de contar filas
+
     @staticmethod
+    def _conteo(qs, filtro=None):
+        return series_tiempo.conteo(qs, filtro)
+
+    @staticmethod
+    @cache_estadisticas
     def get_resumen_estadisticas(queryset_filtro=None):
         queryset_filtro = Publicacion.objects.all() if queryset_filtro is None else queryset_filtro
+        conteo = StatisticsService._conteo
         data = queryset_filtro.aggregate(
-            total=Count("id"),
-            resueltos=Count("id", filter=Q(situacion__nombre="Resuelto")),
-            pendientes=Count("id", filter=Q(situacion__nombre="Pendiente")),
+            total=conteo(queryset_filtro),
+            resueltos=conteo(queryset_filtro, Q(situacion__nombre="Resuelto")),
+            pendientes=conteo(queryset_filtro, Q(situacion__nombre="Pendiente")),
         )
 
         total = data["total"] or 0
@@ -39,103 +60,69 @@ class StatisticsService:
         }
 
     @staticmethod
+    @cache_estadisticas
     def get_publicaciones_por_mes_categoria(queryset_filtro=None):
         qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
-
-        datos = (
-            qs.annotate(mes=TruncMonth("fecha_publicacion"))
-            .values("mes", "categoria__nombre")
-            .annotate(total=Count("id"))
-            .order_by("mes")
-        )
-
-        meses_dict = {}
-        for dato in datos:
-            if not dato["mes"]: continue
-            mes_nombre = StatisticsService.MESES_ESPANOL[dato["mes"].month]
-            if mes_nombre not in meses_dict:
-                meses_dict[mes_nombre] = {"name": mes_nombre}
-
-            meses_dict[mes_nombre][dato["categoria__nombre"]] = dato["total"]
-
-        return list(meses_dict.values())
+        datos = series_tiempo.serie(qs, "mes", ["total"], agrupar_por="categoria")
+        return [
+            {"name": etiqueta, **{categoria: columnas["total"][i] for categoria, columnas in datos["series"].items()}}
+            for i, etiqueta in enumerate(datos["etiquetas"])
+        ]
 
     @staticmethod
+    @cache_estadisticas
     def get_publicaciones_por_categoria(queryset_filtro=None):
         qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
         return (
             qs.values("categoria__nombre")
-            .annotate(total=Count("id"))
+            .annotate(total=StatisticsService._conteo(qs))
             .order_by("-total")
         )
 
     @staticmethod
+    @cache_estadisticas
     def get_resueltos_por_mes(queryset_filtro=None):
         qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
-
-        datos = (
-            qs
-            .annotate(mes=TruncMonth("fecha_publicacion"))
-            .values("mes")
-            .annotate(
-                recibidos=Count("id", filter=Q(situacion__nombre="Recibido")),
-                resueltos=Count("id", filter=Q(situacion__nombre="Resuelto")),
-                en_curso=Count("id", filter=Q(situacion__nombre="En curso")),
-            )
-            .order_by("mes")
-        )
-
-        respuesta = []
-        for dato in datos:
-            if not dato["mes"]: continue
-            respuesta.append(
-                {
-                    "name": StatisticsService.MESES_ESPANOL[dato["mes"].month],
-                    "recibidos": dato["recibidos"],
-                    "resueltos": dato["resueltos"],
-                    "en_curso": dato["en_curso"],
-                }
-            )
-        return respuesta
+        metricas = ["recibidos", "resueltos", "en_curso"]
+        datos = series_tiempo.serie(qs, "mes", metricas)
+        return [
+            {"name": etiqueta, **{metrica: datos["series"][metrica][i] for metrica in metricas}}
+            for i, etiqueta in enumerate(datos["etiquetas"])
+        ]
 
     @staticmethod
+    @cache_estadisticas
     def get_tasa_resolucion_departamento(queryset_filtro=None):
         qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
-        datos = (
-            qs.annotate(
-                mes=TruncMonth("fecha_publicacion"),
-                departamento_nombre=F("departamento__nombre"),
-            )
-            .values("mes", "departamento_nombre")
-            .annotate(
-                total=Count("id"),
-                resueltos=Count("id", filter=Q(situacion__nombre="Resuelto")),
-            )
-            .order_by("mes", "departamento_nombre")
-        )
+        datos = series_tiempo.serie(qs, "mes", ["total", "resueltos"], agrupar_por="departamento")
         respuesta = {}
-        for dato in datos:
-            if not dato["mes"]: continue
-            mes_nombre = StatisticsService.MESES_ESPANOL[dato["mes"].month]
-            depto = dato["departamento_nombre"]
-            total = dato["total"]
-            resueltos = dato["resueltos"]
-            tasa = (resueltos / total * 100) if total > 0 else 0
-            if depto not in respuesta:
-                respuesta[depto] = {}
-            respuesta[depto][mes_nombre] = {
-                "total": total,
-                "resueltos": resueltos,
-                "tasa_resolucion": round(tasa, 2),
-            }
+        for depto, columnas in datos["series"].items():
+            respuesta[depto] = {}
+            for etiqueta, total, resueltos in zip(datos["etiquetas"], columnas["total"], columnas["resueltos"]):
+                tasa = (resueltos / total * 100) if total > 0 else 0
+                respuesta[depto][etiqueta] = {
+                    "total": total,
+                    "resueltos": resueltos,
+                    "tasa_resolucion": round(tasa, 2),
+                }
         return respuesta
 
     @staticmethod
+    @cache_estadisticas
+    def get_serie_temporal(
+        queryset_filtro=None, granularidad="mes", metricas=("total",), agrupar_por=None, desde=None, hasta=None
+    ):
+        """Serie columnar con periodos por año y sin huecos (utils/series_tiempo.py)"""
+        qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
+        return series_tiempo.serie(qs, granularidad, list(metricas), agrupar_por, desde, hasta)
+
+    @staticmethod
+    @cache_estadisticas
     def get_publicaciones_por_junta_vecinal(queryset_filtro=None):
         qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
         return (
             qs.values("junta_vecinal__nombre_junta")
-            .annotate(total=Count("id"))
+            .annotate(total=StatisticsService._conteo(qs))
             .order_by("-total")[:10]
         )
 
@@ -144,44 +131,65 @@ class StatisticsService:
     # -------------------------------------------------------
 
     @staticmethod
+    @cache_estadisticas
     def get_analisis_criticidad_juntas(queryset_filtro=None):
+        """
+        Conteos por junta con agregación condicional en la base de datos: una
+        consulta por junta y otra por (junta, categoría), sin instanciar
+        publicaciones. Vencida = pendiente con más de PLAZO_LEGAL_DIAS hábiles:
+        un rango sobre fecha_vencimiento_legal, calculada al guardar
+        (utils/dias_habiles.py) e indexada junto a la situación. Las filas
+        sin esa fecha (cargas con update() aún no recalculadas) se cuentan
+        por fecha_publicacion.
+        """
         qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
-        qs = qs.select_related('junta_vecinal', 'situacion', 'categoria')
+        qs = qs.order_by()
 
-        juntas_data = {}
         ahora = timezone.now()
-        DIAS_HABILES_LIMITE = 20
-
-        for pub in qs:
-            junta = pub.junta_vecinal
-            if not junta: continue
-
-            if junta.id not in juntas_data:
-                juntas_data[junta.id] = {
-                    "junta_obj": junta,
-                    "total": 0,
-                    "pendientes": 0,
-                    "vencidas": 0,
-                    "dias_pendientes_acum": 0,
-                    "categorias_conteo": {}
-                }
-            
-            data = juntas_data[junta.id]
-            data["total"] += 1
-            cat_name = pub.categoria.nombre
-            data["categorias_conteo"][cat_name] = data["categorias_conteo"].get(cat_name, 0) + 1
-
-            if pub.situacion_id == 4 or pub.situacion is None:
-                data["pendientes"] += 1
-                try:
-                    dias_naturales = (ahora.date() - pub.fecha_publicacion.date()).days
-                    data["dias_pendientes_acum"] += dias_naturales
-                    rango = pd.bdate_range(start=pub.fecha_publicacion.date(), end=ahora.date())
-                    dias_habiles = len(rango) - 1
-                    if dias_habiles > DIAS_HABILES_LIMITE:
-                        data["vencidas"] += 1
-                except Exception:
-                    pass
+        corte = corte_vencimiento(ahora)
+        pendiente = Q(situacion_id=4) | Q(situacion__isnull=True)
+        vencida = Q(fecha_vencimiento_legal__lt=corte) | Q(
+            fecha_vencimiento_legal__isnull=True, fecha_publicacion__lt=limite_plazo_vencido(ahora=ahora)
+        )
+        # Días naturales locales, como _base_resolucion y el rollup diario
+        dias_pendiente = ExpressionWrapper(
+            Value(timezone.localdate(ahora), output_field=DateField()) - TruncDate("fecha_publicacion"),
+            output_field=DurationField(),
+        )
+
+        conteos = (
+            qs.values("junta_vecinal_id")
+            .annotate(
+                total=Count("id"),
+                pendientes=Count("id", filter=pendiente),
+                vencidas=Count("id", filter=pendiente & vencida),
+                dias_pendientes_acum=Sum(dias_pendiente, filter=pendiente),
+                # Orden de primera aparición, para desempatar igual que antes
+                primera=Min("id"),
+            )
+            .order_by("primera")
+        )
+        juntas = JuntaVecinal.objects.in_bulk([fila["junta_vecinal_id"] for fila in conteos])
+
+        juntas_data = {}
+        for fila in conteos:
+            acumulado = fila["dias_pendientes_acum"]
+            juntas_data[fila["junta_vecinal_id"]] = {
+                "junta_obj": juntas[fila["junta_vecinal_id"]],
+                "total": fila["total"],
+                "pendientes": fila["pendientes"],
+                "vencidas": fila["vencidas"],
+                "dias_pendientes_acum": acumulado.days if acumulado else 0,
+                "categorias_conteo": {},
+            }
+
+        categorias = (
+            qs.values("junta_vecinal_id", "categoria__nombre")
+            .annotate(total=Count("id"), primera=Min("id"))
+            .order_by("junta_vecinal_id", "primera")
+        )
+        for fila in categorias:
+            juntas_data[fila["junta_vecinal_id"]]["categorias_conteo"][fila["categoria__nombre"]] = fila["total"]
 
         resultados = []
         for j_id, d in juntas_data.items():
@@ -215,6 +223,7 @@ class StatisticsService:
         return resultados
 
     @staticmethod
+    @cache_estadisticas
     def get_estadisticas_criticidad_completa(queryset_filtro=None):
         ranking = StatisticsService.get_analisis_criticidad_juntas(queryset_filtro)
         
@@ -260,41 +269,86 @@ class StatisticsService:
     # -------------------------------------------------------
 
     @staticmethod
+    def anotar_ultima_respuesta(queryset):
+        """
+        Fecha y puntuación de la última respuesta de cada publicación como
+        subconsultas correlacionadas (índice idx_respuesta_pub_fecha), en vez de
+        precargar todas las respuestas y ordenarlas en Python.
+        """
+        ultima = RespuestaMunicipal.objects.filter(publicacion=OuterRef("pk")).order_by("-fecha", "id")
+        return queryset.annotate(
+            ultima_respuesta_fecha=Subquery(ultima.values("fecha")[:1]),
+            ultima_respuesta_puntuacion=Subquery(ultima.values("puntuacion")[:1]),
+        )
+
+    @staticmethod
+    def _base_resolucion(qs):
+        """
+        Queryset con la última respuesta anotada y las expresiones comunes de
+        frío y eficiencia: (queryset, resuelta, con_respuesta, días de resolución).
+        Los días naturales usan fechas locales, como el plazo legal de la
+        eficiencia y el día del rollup, y solo cuentan si no son negativos.
+        """
+        qs = StatisticsService.anotar_ultima_respuesta(qs).annotate(
+            dia_publicacion=TruncDate("fecha_publicacion"),
+            dia_respuesta=TruncDate("ultima_respuesta_fecha"),
+        )
+        resuelta = Q(situacion__isnull=False) & ~Q(situacion_id=4)
+        con_respuesta = resuelta & Q(ultima_respuesta_fecha__isnull=False)
+        dias_resolucion = Sum(
+            ExpressionWrapper(F("dia_respuesta") - F("dia_publicacion"), output_field=DurationField()),
+            filter=con_respuesta & Q(dia_respuesta__gte=F("dia_publicacion")),
+        )
+        return qs, resuelta, con_respuesta, dias_resolucion
+
+    @staticmethod
+    @cache_estadisticas
     def get_analisis_frio_juntas(queryset_filtro=None):
         qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
-        qs = qs.select_related('junta_vecinal', 'situacion', 'categoria').prefetch_related('respuestamunicipal_set')
+        qs = qs.order_by()
+
+        base, resuelta, con_respuesta, dias_resolucion = StatisticsService._base_resolucion(qs)
+        puntuada = con_respuesta & Q(ultima_respuesta_puntuacion__gt=0)
+        # Una fila por junta, en orden de primera aparición (desempate del ranking)
+        conteos = (
+            base.values("junta_vecinal_id")
+            .annotate(
+                total=Count("id"),
+                resueltas=Count("id", filter=resuelta),
+                alta_prioridad_resueltas=Count("id", filter=resuelta & Q(prioridad="alta")),
+                dias_resolucion=dias_resolucion,
+                suma_puntuacion=Sum("ultima_respuesta_puntuacion", filter=puntuada),
+                count_puntuacion=Count("id", filter=puntuada),
+                ultima_resolucion=Max("ultima_respuesta_fecha", filter=con_respuesta),
+                primera=Min("id"),
+            )
+            .order_by("primera")
+        )
+        juntas = JuntaVecinal.objects.in_bulk([fila["junta_vecinal_id"] for fila in conteos])
 
         juntas_data = {}
-        for pub in qs:
-            junta = pub.junta_vecinal
-            if not junta: continue
-            
-            if junta.id not in juntas_data:
-                juntas_data[junta.id] = {
-                    "junta": junta, "total": 0, "resueltas": 0, "alta_prioridad_resueltas": 0,
-                    "dias_resolucion_sum": 0, "suma_puntuacion": 0, "count_puntuacion": 0,
-                    "ultima_resolucion": None, "categorias": {}
-                }
-            d = juntas_data[junta.id]
-            d["total"] += 1
-            
-            if pub.situacion_id != 4 and pub.situacion is not None:
-                d["resueltas"] += 1
-                cat = pub.categoria.nombre
-                d["categorias"][cat] = d["categorias"].get(cat, 0) + 1
-                if pub.prioridad == 'alta': d["alta_prioridad_resueltas"] += 1
-                
-                respuestas = list(pub.respuestamunicipal_set.all())
-                if respuestas:
-                    respuestas.sort(key=lambda r: r.fecha, reverse=True)
-                    ultima = respuestas[0]
-                    if d["ultima_resolucion"] is None or ultima.fecha > d["ultima_resolucion"]:
-                        d["ultima_resolucion"] = ultima.fecha
-                    dias = (ultima.fecha.date() - pub.fecha_publicacion.date()).days
-                    if dias >= 0: d["dias_resolucion_sum"] += dias
-                    if ultima.puntuacion > 0:
-                        d["suma_puntuacion"] += ultima.puntuacion
-                        d["count_puntuacion"] += 1
+        for fila in conteos:
+            juntas_data[fila["junta_vecinal_id"]] = {
+                "junta": juntas[fila["junta_vecinal_id"]],
+                "total": fila["total"],
+                "resueltas": fila["resueltas"],
+                "alta_prioridad_resueltas": fila["alta_prioridad_resueltas"],
+                "dias_resolucion_sum": fila["dias_resolucion"].days if fila["dias_resolucion"] else 0,
+                "suma_puntuacion": fila["suma_puntuacion"] or 0,
+                "count_puntuacion": fila["count_puntuacion"],
+                "ultima_resolucion": fila["ultima_resolucion"],
+                "categorias": {},
+            }
+
+        categorias = (
+            qs.filter(situacion__isnull=False)
+            .exclude(situacion_id=4)
+            .values("junta_vecinal_id", "categoria__nombre")
+            .annotate(total=Count("id"), primera=Min("id"))
+            .order_by("junta_vecinal_id", "primera")
+        )
+        for fila in categorias:
+            juntas_data[fila["junta_vecinal_id"]]["categorias"][fila["categoria__nombre"]] = fila["total"]
 
         resultados = []
         for j_id, d in juntas_data.items():
@@ -327,43 +381,61 @@ class StatisticsService:
         return resultados
 
     @staticmethod
+    @cache_estadisticas
     def get_analisis_eficiencia_juntas(queryset_filtro=None):
         """
-        Lógica para calcular la junta más eficiente considerando Plazo Legal (20 días hábiles).
-        Esta es la función que faltaba y causaba el AttributeError.
+        Lógica para calcular la junta más eficiente considerando Plazo Legal
+        (settings.PLAZO_LEGAL_DIAS días hábiles, con feriados).
+
+        Los conteos salen de una consulta agrupada por junta. El cumplimiento
+        del plazo se evalúa por par distinto (día de publicación, día de la
+        última respuesta) de cada junta, con un solo conteo de días hábiles.
         """
         qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
-        qs = qs.select_related('junta_vecinal').prefetch_related('respuestamunicipal_set')
+        qs = qs.order_by()
+
+        base, resuelta, _, dias_resolucion = StatisticsService._base_resolucion(qs)
+        conteos = (
+            base.values("junta_vecinal_id")
+            .annotate(
+                total=Count("id"),
+                resueltas=Count("id", filter=resuelta),
+                dias_resolucion=dias_resolucion,
+                primera=Min("id"),
+            )
+            .order_by("primera")
+        )
+        juntas = JuntaVecinal.objects.in_bulk([fila["junta_vecinal_id"] for fila in conteos])
 
         juntas_data = {}
-        DIAS_HABILES_LIMITE = 20
-        
-        for pub in qs:
-            junta = pub.junta_vecinal
-            if not junta: continue
-            
-            if junta.id not in juntas_data:
-                juntas_data[junta.id] = {
-                    "junta": junta, "total": 0, "resueltas_en_plazo": 0,
-                    "dias_resolucion_acum": 0, "total_resueltas": 0
-                }
-            d = juntas_data[junta.id]
-            d["total"] += 1
-
-            # Si no es pendiente
-            if pub.situacion_id != 4 and pub.situacion is not None:
-                d["total_resueltas"] += 1
-                respuestas = list(pub.respuestamunicipal_set.all())
-                if respuestas:
-                    respuesta = sorted(respuestas, key=lambda x: x.fecha, reverse=True)[0]
-                    try:
-                        rango = pd.bdate_range(start=pub.fecha_publicacion.date(), end=respuesta.fecha.date())
-                        if (len(rango) - 1) <= DIAS_HABILES_LIMITE:
-                            d["resueltas_en_plazo"] += 1
-                        
-                        dias_nat = (respuesta.fecha.date() - pub.fecha_publicacion.date()).days
-                        if dias_nat >= 0: d["dias_resolucion_acum"] += dias_nat
-                    except Exception: pass
+        for fila in conteos:
+            juntas_data[fila["junta_vecinal_id"]] = {
+                "junta": juntas[fila["junta_vecinal_id"]],
+                "total": fila["total"],
+                "resueltas_en_plazo": 0,
+                "dias_resolucion_acum": fila["dias_resolucion"].days if fila["dias_resolucion"] else 0,
+                "total_resueltas": fila["resueltas"],
+            }
+
+        # Fechas locales, como en utils/dias_habiles.py
+        pares = (
+            StatisticsService.anotar_ultima_respuesta(qs.filter(situacion__isnull=False).exclude(situacion_id=4))
+            .filter(ultima_respuesta_fecha__isnull=False)
+            .values(
+                "junta_vecinal_id",
+                dia_publicacion=TruncDate("fecha_publicacion"),
+                dia_respuesta=TruncDate("ultima_respuesta_fecha"),
+            )
+            .annotate(cantidad=Count("id"))
+            .order_by()
+        )
+        pares = list(pares)
+        dias_habiles = dias_habiles_entre(
+            [par["dia_publicacion"] for par in pares], [par["dia_respuesta"] for par in pares]
+        )
+        for par, dias in zip(pares, dias_habiles):
+            if dias <= settings.PLAZO_LEGAL_DIAS:
+                juntas_data[par["junta_vecinal_id"]]["resueltas_en_plazo"] += par["cantidad"]
 
         resultados = []
         for j_id, d in juntas_data.items():
@@ -399,6 +471,64 @@ class StatisticsService:
         return resultados
 
     @staticmethod
+    @cache_estadisticas
+    def get_distribucion_tiempos(queryset_filtro=None, agrupar_por="departamento"):
+        """
+        Percentiles e histograma, en días, del tiempo hasta la primera
+        respuesta y hasta la resolución (última respuesta de una publicación
+        resuelta, como _base_resolucion), por grupo y en total. Una consulta de
+        filas (id de grupo, segundos, segundos) y otra de nombres; el resto es
+        numpy (utils/distribucion_tiempos.py).
+        """
+        qs = queryset_filtro if queryset_filtro is not None else Publicacion.objects.all()
+        campo_grupo, modelo_grupo, campo_nombre = distribucion_tiempos.AGRUPACIONES[agrupar_por]
+
+        primera = RespuestaMunicipal.objects.filter(publicacion=OuterRef("pk")).order_by("fecha", "id")
+        resuelta = Q(situacion__isnull=False) & ~Q(situacion_id=4)
+        filas = (
+            StatisticsService.anotar_ultima_respuesta(qs.order_by())
+            .annotate(primera_respuesta_fecha=Subquery(primera.values("fecha")[:1]))
+            .filter(primera_respuesta_fecha__isnull=False)
+            .annotate(
+                hasta_primera=distribucion_tiempos.SegundosEntre("primera_respuesta_fecha", "fecha_publicacion"),
+                hasta_resolucion=Case(
+                    When(
+                        resuelta,
+                        then=distribucion_tiempos.SegundosEntre("ultima_respuesta_fecha", "fecha_publicacion"),
+                    ),
+                    output_field=FloatField(),
+                ),
+            )
+            .values_list(campo_grupo, "hasta_primera", "hasta_resolucion")
+        )
+        # None (sin resolución) -> NaN
+        matriz = np.array(list(filas), dtype=float).reshape(-1, 3)
+        ids, grupos = np.unique(matriz[:, 0].astype(np.int64), return_inverse=True)
+        nombres = dict(modelo_grupo.objects.filter(id__in=ids.tolist()).values_list("id", campo_nombre))
+
+        primera_respuesta, total_primera = distribucion_tiempos.resumir(grupos, matriz[:, 1], len(ids))
+        resolucion, total_resolucion = distribucion_tiempos.resumir(grupos, matriz[:, 2], len(ids))
+        resultados = [
+            {
+                "id": int(grupo_id),
+                "nombre": nombres.get(int(grupo_id)),
+                "primera_respuesta": primera_respuesta[indice],
+                "resolucion": resolucion[indice],
+            }
+            for indice, grupo_id in enumerate(ids)
+        ]
+        resultados.sort(key=lambda grupo: grupo["nombre"] or "")
+        return {
+            "agrupar_por": agrupar_por,
+            "unidad": "dias",
+            "percentiles": list(distribucion_tiempos.PERCENTILES),
+            "histograma": distribucion_tiempos.etiquetas_histograma(),
+            "grupos": resultados,
+            "total": {"primera_respuesta": total_primera, "resolucion": total_resolucion},
+        }
+
+    @staticmethod
+    @cache_estadisticas
     def get_estadisticas_eficiencia_completa(request_filters=None):
         # Usamos el método que acabamos de restaurar
         ranking = StatisticsService.get_analisis_eficiencia_juntas(request_filters)
@@ -418,6 +548,7 @@ class StatisticsService:
     # -------------------------------------------------------
 
     @staticmethod
+    @cache_estadisticas
     def get_estadisticas_departamentos():
         departamentos = DepartamentoMunicipal.objects.annotate(
             total_funcionarios=Count("usuariodepartamento", filter=Q(usuariodepartamento__estado="activo")),
@@ -435,6 +566,7 @@ class StatisticsService:
         return stats
     
     @staticmethod
+    @cache_estadisticas
     def get_estadisticas_kanban(departamento_id=None):
         tableros_query = Tablero.objects.all()
         if departamento_id:
@@ -456,6 +588,7 @@ class StatisticsService:
         return stats
 
     @staticmethod
+    @cache_estadisticas
     def get_estadisticas_respuestas():
         qs = RespuestaMunicipal.objects.exclude(puntuacion=0)
         if not qs.exists(): return None
@@ -480,6 +613,7 @@ class StatisticsService:
         }
 
     @staticmethod
+    @cache_estadisticas
     def get_estadisticas_gestion_datos():
         return {
             "juntasVecinales": {"total": JuntaVecinal.objects.count(), "habilitados": JuntaVecinal.objects.filter(estado="habilitado").count(), "pendientes": JuntaVecinal.objects.filter(estado="pendiente").count(), "deshabilitados": JuntaVecinal.objects.filter(estado="deshabilitado").count()},
@@ -488,6 +622,7 @@ class StatisticsService:
         }
 
     @staticmethod
+    @cache_estadisticas
     def get_estadisticas_historial_modificaciones(usuario):
         es_jefe = usuario.tipo_usuario == "jefe_departamento"
         departamento = usuario.get_departamento_asignado()
@@ -0,0 +1,193 @@
+"""
+Trabajos de estadísticas en segundo plano (/estadisticas/trabajos/).
+
+Los análisis por junta de varios años pueden pasar el timeout de gunicorn.
+La API deja un TrabajoEstadistica pendiente y responde con su id. Los
+procesos de `manage.py procesar_trabajos_estadistica` toman los pendientes
+con un UPDATE condicional, sin broker: un trabajo lo toma un solo proceso. Las
+secciones del dashboard se calculan una a una, informando el progreso, y el
+resultado queda guardado en la fila.
+
+Un trabajo completado con la misma clave (secciones y filtros) y la misma
+versión de los datos (utils/cache_estadisticas.version_datos) se reutiliza en
+vez de encolar otro. Un trabajo en proceso por más de
+ESTADISTICAS_TRABAJOS_TIEMPO_MAXIMO segundos se da por abandonado (su proceso
+murió) y vuelve a la cola, hasta MAXIMO_INTENTOS veces.
+"""
+import hashlib
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+import django
+from django.conf import settings
+from django.db import close_old_connections, connection, connections
+from django.db.models import F, Q
+from django.http import QueryDict
+from django.utils import timezone
+from ..filters import PublicacionFilter
+from ..models import Publicacion, TrabajoEstadistica
+from ..utils.cache_estadisticas import version_datos
+from .dashboard_service import DashboardService, SECCIONES
+
+logger = logging.getLogger(__name__)
+
+MAXIMO_INTENTOS = 3
+# Candidatos que se intentan tomar por vuelta (otros procesos compiten por ellos)
+CANDIDATOS_POR_VUELTA = 10
+
+
+def _milisegundos(inicio):
+    return round((time.perf_counter() - inicio) * 1000, 1)
+
+
+def _atender_en_proceso(una_vez):
+    try:
+        return TrabajoEstadisticaService.atender(una_vez)
+    finally:
+        connections.close_all()
+
+
+class TrabajoEstadisticaService:
+    @staticmethod
+    def filterset(filtros):
+        """PublicacionFilter sin validar para los filtros guardados de un trabajo"""
+        datos = QueryDict(mutable=True)
+        datos.update(filtros)
+        return PublicacionFilter(datos, queryset=Publicacion.objects.all())
+
+    @staticmethod
+    def clave(secciones, filtros):
+        firma = json.dumps([sorted(secciones), sorted(filtros.items())])
+        return hashlib.md5(firma.encode()).hexdigest()
+
+    @staticmethod
+    def encolar(usuario, secciones, filtros):
+        """
+        Trabajo para `secciones` sobre `filtros` (ya validados): uno completado
+        con los datos vigentes, uno pendiente o en proceso con la misma clave,
+        o uno nuevo. Retorna (trabajo, reutilizado).
+        """
+        clave = TrabajoEstadisticaService.clave(secciones, filtros)
+        existente = (
+            TrabajoEstadistica.objects.filter(clave=clave)
+            .filter(
+                Q(estado=TrabajoEstadistica.COMPLETADO, version_datos=version_datos())
+                | Q(estado__in=[TrabajoEstadistica.PENDIENTE, TrabajoEstadistica.EN_PROCESO])
+            )
+            .order_by("-fecha_creacion")
+            .first()
+        )
+        if existente:
+            return existente, True
+        trabajo = TrabajoEstadistica.objects.create(
+            usuario=usuario, secciones=secciones, filtros=filtros, clave=clave
+        )
+        return trabajo, False
+
+    @staticmethod
+    def liberar_abandonados():
+        """Devuelve a la cola (o da por fallidos) los trabajos en proceso hace demasiado"""
+        limite = timezone.now() - timedelta(seconds=settings.ESTADISTICAS_TRABAJOS_TIEMPO_MAXIMO)
+        abandonados = TrabajoEstadistica.objects.filter(
+            estado=TrabajoEstadistica.EN_PROCESO, fecha_inicio__lt=limite
+        )
+        abandonados.filter(intentos__gte=MAXIMO_INTENTOS).update(
+            estado=TrabajoEstadistica.ERROR,
+            error=f"Abandonado tras {MAXIMO_INTENTOS} intentos",
+            fecha_fin=timezone.now(),
+        )
+        abandonados.update(estado=TrabajoEstadistica.PENDIENTE, progreso=0)
+
+    @staticmethod
+    def tomar_siguiente():
+        """El pendiente más antiguo que este proceso logra marcar en proceso, o None"""
+        candidatos = list(
+            TrabajoEstadistica.objects.filter(estado=TrabajoEstadistica.PENDIENTE)
+            .order_by("fecha_creacion")
+            .values_list("id", flat=True)[:CANDIDATOS_POR_VUELTA]
+        )
+        for trabajo_id in candidatos:
+            tomados = TrabajoEstadistica.objects.filter(
+                id=trabajo_id, estado=TrabajoEstadistica.PENDIENTE
+            ).update(
+                estado=TrabajoEstadistica.EN_PROCESO,
+                fecha_inicio=timezone.now(),
+                intentos=F("intentos") + 1,
+                progreso=0,
+            )
+            if tomados:
+                return TrabajoEstadistica.objects.get(id=trabajo_id)
+        return None
+
+    @staticmethod
+    def procesar(trabajo):
+        """Calcula las secciones del trabajo y guarda el resultado o el error"""
+        trabajos = TrabajoEstadistica.objects.filter(id=trabajo.id)
+        try:
+            # Versión leída antes de calcular: si los datos cambian durante el
+            # cálculo, el resultado no se reutilizará
+            version = version_datos()
+            filterset = TrabajoEstadisticaService.filterset(trabajo.filtros)
+            if not filterset.is_valid():
+                raise ValueError(json.dumps(filterset.errors))
+
+            inicio = time.perf_counter()
+            bases = DashboardService.bases(filterset, trabajo.secciones)
+            tiempos = {"base_filtrada": _milisegundos(inicio)}
+            resultado = {}
+            for numero, seccion in enumerate(trabajo.secciones, start=1):
+                resultado[seccion], tiempos[seccion] = DashboardService.calcular_seccion(
+                    seccion, bases[SECCIONES[seccion][0]]
+                )
+                if numero < len(trabajo.secciones):
+                    trabajos.update(progreso=numero * 100 // len(trabajo.secciones), tiempos_ms=tiempos)
+
+            trabajos.update(
+                estado=TrabajoEstadistica.COMPLETADO,
+                progreso=100,
+                resultado=resultado,
+                tiempos_ms=tiempos,
+                version_datos=version,
+                fecha_fin=timezone.now(),
+            )
+        except Exception as error:
+            logger.exception("Falló el trabajo de estadísticas %s", trabajo.id)
+            trabajos.update(estado=TrabajoEstadistica.ERROR, error=str(error), fecha_fin=timezone.now())
+        trabajo.refresh_from_db()
+        return trabajo
+
+    @staticmethod
+    def atender(una_vez=False, intervalo=None):
+        """
+        Toma y procesa trabajos. Con `una_vez` termina cuando la cola queda
+        vacía; si no, espera `intervalo` segundos entre consultas. Retorna los
+        trabajos procesados.
+        """
+        intervalo = settings.ESTADISTICAS_TRABAJOS_INTERVALO if intervalo is None else intervalo
+        procesados = 0
+        while True:
+            # Como al final de cada request: descarta conexiones caídas o viejas.
+            # Dentro de una transacción (atender desde un test o un shell) no:
+            # Django cierra la conexión si no está en autocommit y la perdería
+            if not connection.in_atomic_block:
+                close_old_connections()
+            TrabajoEstadisticaService.liberar_abandonados()
+            trabajo = TrabajoEstadisticaService.tomar_siguiente()
+            if trabajo is None:
+                if una_vez:
+                    return procesados
+                time.sleep(intervalo)
+                continue
+            TrabajoEstadisticaService.procesar(trabajo)
+            procesados += 1
+
+    @staticmethod
+    def atender_en_procesos(procesos, una_vez=False):
+        """`atender` en un pool de `procesos` procesos; retorna el total procesado"""
+        # Los hijos no deben heredar los sockets de las conexiones del padre
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=procesos, initializer=django.setup) as pool:
+            futuros = [pool.submit(_atender_en_proceso, una_vez) for _ in range(procesos)]
+            return sum(futuro.result() for futuro in futuros)
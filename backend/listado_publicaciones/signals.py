@@ -1,7 +1,44 @@
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 from cloudinary.uploader import destroy
-from .models import ImagenAnuncio
+from .models import (
+    ImagenAnuncio,
+    Publicacion,
+    Evidencia,
+    AnuncioMunicipal,
+    RespuestaMunicipal,
+    EvidenciaRespuesta,
+    Categoria,
+    SituacionPublicacion,
+    JuntaVecinal,
+    DepartamentoMunicipal,
+    UsuarioDepartamento,
+    Usuario,
+    MarcaCambio,
+    RegistroEliminacion,
+    HistorialModificaciones,
+    Tablero,
+    Columna,
+    Tarea,
+)
+from .services.resumen_diario_service import ResumenDiarioService, CAMPOS_CLAVE
+
+# Modelos cuya marca de cambio usan los GET condicionales (views/mixins.py)
+MODELOS_CON_MARCA = (
+    Publicacion,
+    Evidencia,
+    AnuncioMunicipal,
+    ImagenAnuncio,
+    RespuestaMunicipal,
+    EvidenciaRespuesta,
+    Categoria,
+    SituacionPublicacion,
+    JuntaVecinal,
+    DepartamentoMunicipal,
+    UsuarioDepartamento,
+    Usuario,
+)
 
 
 @receiver(post_delete, sender=ImagenAnuncio)
@@ -15,4 +52,96 @@ def eliminar_imagen_cloudinary(sender, instance, **kwargs):
             public_id = instance.imagen.public_id
             destroy(public_id)  # Elimina la imagen de Cloudinary
         except Exception as e:
-            print(f"Error al eliminar la imagen en Cloudinary: {e}")
\ No newline at end of file
+            print(f"Error al eliminar la imagen en Cloudinary: {e}")
+
+
+def registrar_marca_cambio(sender, update_fields=None, raw=False, **kwargs):
+    """Incrementa la marca de agua de la tabla modificada"""
+    if raw:
+        return
+    # El login solo actualiza last_login, que no aparece en ningún listado
+    if sender is Usuario and update_fields and set(update_fields) <= {"last_login"}:
+        return
+    MarcaCambio.registrar_cambio(sender)
+
+
+for modelo in MODELOS_CON_MARCA:
+    post_save.connect(registrar_marca_cambio, sender=modelo, dispatch_uid=f"marca_save_{modelo._meta.label_lower}")
+    post_delete.connect(registrar_marca_cambio, sender=modelo, dispatch_uid=f"marca_delete_{modelo._meta.label_lower}")
+
+
+# Tablas que solo lee el cache de estadísticas (utils/cache_estadisticas.py);
+# las demás de TABLAS_ESTADISTICAS ya tienen marca
+MODELOS_CON_MARCA_ESTADISTICAS = (HistorialModificaciones, Tablero, Columna, Tarea)
+
+for modelo in MODELOS_CON_MARCA_ESTADISTICAS:
+    post_save.connect(registrar_marca_cambio, sender=modelo, dispatch_uid=f"marca_save_{modelo._meta.label_lower}")
+    post_delete.connect(registrar_marca_cambio, sender=modelo, dispatch_uid=f"marca_delete_{modelo._meta.label_lower}")
+
+
+@receiver(m2m_changed, sender=Tarea.publicaciones.through, dispatch_uid="marca_tarea_publicaciones")
+def registrar_cambio_tarea_publicaciones(sender, action, **kwargs):
+    """Asociar o quitar publicaciones cambia el filtro en_tarea_kanban"""
+    if action in ("post_add", "post_remove", "post_clear"):
+        MarcaCambio.registrar_cambio(Tarea)
+
+# Sincronización incremental (services/sincronizacion_service.py): lápidas de
+# eliminación y fecha_modificacion del padre cuando cambian sus adjuntos
+MODELOS_SINCRONIZADOS = (Publicacion, RespuestaMunicipal, AnuncioMunicipal)
+ADJUNTOS_SINCRONIZADOS = {
+    Evidencia: (Publicacion, "publicacion_id"),
+    ImagenAnuncio: (AnuncioMunicipal, "anuncio_id"),
+    EvidenciaRespuesta: (RespuestaMunicipal, "respuesta_id"),
+}
+
+
+def registrar_eliminacion(sender, instance, **kwargs):
+    RegistroEliminacion.objects.create(tabla=MarcaCambio.tabla_de(sender), objeto_id=instance.pk)
+
+
+def tocar_padre(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    modelo_padre, campo = ADJUNTOS_SINCRONIZADOS[sender]
+    modelo_padre.objects.filter(pk=getattr(instance, campo)).update(fecha_modificacion=timezone.now())
+
+
+for modelo in MODELOS_SINCRONIZADOS:
+    post_delete.connect(registrar_eliminacion, sender=modelo, dispatch_uid=f"lapida_{modelo._meta.label_lower}")
+
+for modelo in ADJUNTOS_SINCRONIZADOS:
+    post_save.connect(tocar_padre, sender=modelo, dispatch_uid=f"tocar_save_{modelo._meta.label_lower}")
+    post_delete.connect(tocar_padre, sender=modelo, dispatch_uid=f"tocar_delete_{modelo._meta.label_lower}")
+
+
+# Rollup diario de estadísticas (services/resumen_diario_service.py): al
+# confirmar se recalculan la celda anterior y la nueva de la publicación afectada
+def recordar_celda_resumen(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not set(update_fields) & CAMPOS_CLAVE:
+        return
+    instance._celdas_resumen = ResumenDiarioService.claves_de([instance.pk])
+
+
+def actualizar_resumen_publicacion(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not set(update_fields) & CAMPOS_CLAVE:
+        return
+    celdas = getattr(instance, "_celdas_resumen", set())
+    instance._celdas_resumen = set()
+    ResumenDiarioService.recalcular_al_confirmar(celdas | {ResumenDiarioService.clave(instance)})
+
+
+def actualizar_resumen_respuesta(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    ResumenDiarioService.recalcular_al_confirmar(ResumenDiarioService.claves_de([instance.publicacion_id]))
+
+
+pre_save.connect(recordar_celda_resumen, sender=Publicacion, dispatch_uid="resumen_pre_save_publicacion")
+post_save.connect(actualizar_resumen_publicacion, sender=Publicacion, dispatch_uid="resumen_save_publicacion")
+post_delete.connect(actualizar_resumen_publicacion, sender=Publicacion, dispatch_uid="resumen_delete_publicacion")
+post_save.connect(actualizar_resumen_respuesta, sender=RespuestaMunicipal, dispatch_uid="resumen_save_respuesta")
+post_delete.connect(actualizar_resumen_respuesta, sender=RespuestaMunicipal, dispatch_uid="resumen_delete_respuesta")
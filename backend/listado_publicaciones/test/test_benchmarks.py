@@ -0,0 +1,48 @@
+from django.test import TestCase
+from ..benchmarks.seed import sembrar_municipio
+from ..benchmarks.runner import descubrir_rutas, medir_endpoints, comparar_con_baseline
+from ..models import Publicacion, RespuestaMunicipal, Auditoria, Usuario
+
+
+class BenchmarkEndpointsTest(TestCase):
+    """Prueba el harness de benchmarks con un municipio mínimo."""
+
+    def test_siembra_determinista(self):
+        conteo = sembrar_municipio(publicaciones=30, semilla=7, lote=10)
+        self.assertEqual(conteo["publicaciones"], 30)
+        self.assertEqual(Publicacion.objects.count(), 30)
+        self.assertEqual(RespuestaMunicipal.objects.count(), conteo["respuestas"])
+        self.assertEqual(Auditoria.objects.count(), 30)
+        self.assertTrue(Publicacion.objects.filter(codigo="P-BENCH-0000000029").exists())
+
+    def test_mide_todas_las_rutas_get(self):
+        sembrar_municipio(publicaciones=20, semilla=1, lote=10)
+        admin = Usuario.objects.get(es_administrador=True)
+        rutas = descubrir_rutas()
+        nombres = {ruta["nombre"] for ruta in rutas}
+        self.assertIn("publicacion-list", nombres)
+        self.assertIn("publicacion-detail", nombres)
+
+        reporte = medir_endpoints(
+            admin, repeticiones=1, rutas=rutas,
+            filtro=lambda nombre: nombre.startswith(("publicacion-", "respuestamunicipal-")),
+        )
+        listado = reporte["endpoints"]["publicacion-list"]
+        self.assertEqual(listado["status"], 200)
+        self.assertGreater(listado["consultas"], 0)
+        self.assertGreater(listado["bytes_respuesta"], 0)
+        self.assertIn("publicacion-detail", reporte["endpoints"])
+        # Las rutas sin GET se informan como omitidas
+        self.assertIn("token_obtain_pair", {r["nombre"] for r in rutas if not r["medible"]})
+
+    def test_aumento_de_consultas_es_regresion(self):
+        base = {"consultas": 10, "tiempo_ms": 5.0, "memoria_pico_kb": 100.0, "bytes_respuesta": 500, "status": 200}
+        actual = dict(base, consultas=11)
+        comparacion = comparar_con_baseline(
+            {"endpoints": {"publicacion-list": actual, "nuevo": base}},
+            {"endpoints": {"publicacion-list": base, "eliminado": base}},
+        )
+        self.assertEqual(comparacion["regresiones"], ["publicacion-list"])
+        self.assertEqual(comparacion["diferencias"]["publicacion-list"]["motivos"], ["consultas"])
+        self.assertEqual(comparacion["diferencias"]["nuevo"]["estado"], "nuevo")
+        self.assertEqual(comparacion["diferencias"]["eliminado"]["estado"], "eliminado")
@@ -0,0 +1,58 @@
+from rest_framework.test import APITestCase
+from ..models import Usuario, DepartamentoMunicipal, Categoria, JuntaVecinal, SituacionPublicacion, Publicacion
+
+URL = "/api/v1/publicaciones/buscar/"
+
+
+class BusquedaPublicacionesTest(APITestCase):
+    """Búsqueda por texto (fallback de SQLite) combinada con PublicacionFilter."""
+
+    def setUp(self):
+        self.personal = Usuario.objects.create(
+            rut="11111111-1", email="personal@muni.cl", nombre="Personal", tipo_usuario="personal"
+        )
+        self.vecino = Usuario.objects.create(
+            rut="22222222-2", email="vecino@muni.cl", nombre="Vecino", tipo_usuario="vecino"
+        )
+        self.client.force_authenticate(user=self.personal)
+        obras = DepartamentoMunicipal.objects.create(nombre="Obras")
+        aseo = DepartamentoMunicipal.objects.create(nombre="Aseo")
+        junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+
+        def publicacion(titulo, departamento, descripcion="N/A", ubicacion=None):
+            return Publicacion.objects.create(
+                usuario=self.vecino, junta_vecinal=junta, departamento=departamento,
+                categoria=Categoria.objects.get_or_create(nombre="General", departamento=departamento)[0],
+                titulo=titulo, descripcion=descripcion, ubicacion=ubicacion, latitud=0, longitud=0,
+            )
+
+        self.en_titulo = publicacion("Bache en pasaje Los Aromos", obras)
+        self.en_descripcion = publicacion("Calle dañada", obras, descripcion="Hay un bache profundo")
+        self.en_ubicacion = publicacion("Basura acumulada", aseo, ubicacion="Pasaje del bache")
+        publicacion("Luminaria apagada", obras)
+
+    def ids(self, response):
+        return [fila["id"] for fila in response.data["results"]]
+
+    def test_orden_por_relevancia(self):
+        response = self.client.get(URL, {"q": "bache"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.ids(response), [self.en_titulo.id, self.en_descripcion.id, self.en_ubicacion.id])
+
+    def test_todas_las_palabras(self):
+        response = self.client.get(URL, {"q": "bache aromos"})
+        self.assertEqual(self.ids(response), [self.en_titulo.id])
+
+    def test_acepta_filtros(self):
+        response = self.client.get(URL, {"q": "bache", "departamento": "Aseo"})
+        self.assertEqual(self.ids(response), [self.en_ubicacion.id])
+
+    def test_validaciones(self):
+        self.assertEqual(self.client.get(URL, {"q": "b"}).status_code, 400)
+        # El cursor ordena por (fecha, id), no por relevancia
+        self.assertEqual(self.client.get(URL, {"q": "bache", "paginacion": "cursor"}).status_code, 400)
+        self.assertEqual(self.client.get(URL, {"q": "bache", "cursor": "x"}).status_code, 400)
+        self.assertEqual(self.client.get(URL, {"q": "bache", "page": 1}).status_code, 200)
+        self.client.force_authenticate(user=self.vecino)
+        self.assertEqual(self.client.get(URL, {"q": "bache"}).status_code, 403)
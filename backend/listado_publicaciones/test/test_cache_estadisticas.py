@@ -0,0 +1,96 @@
+import tempfile
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from ..models import (
+    Usuario,
+    DepartamentoMunicipal,
+    Categoria,
+    JuntaVecinal,
+    SituacionPublicacion,
+    Publicacion,
+    HistorialModificaciones,
+    Tablero,
+    Columna,
+    Tarea,
+)
+from ..services.statistics_service import StatisticsService
+from ..utils.cache_estadisticas import cache_estadisticas_backend, contadores_cache
+
+URL_CONTADORES = "/api/v1/estadisticas/cache/"
+
+
+class CacheEstadisticasTest(APITestCase):
+    """Cache de StatisticsService invalidado por las señales de escritura."""
+
+    def setUp(self):
+        cache_estadisticas_backend().clear()
+        self.admin = Usuario.objects.create(
+            rut="11111111-1", email="admin@muni.cl", nombre="Admin", tipo_usuario="administrador",
+            es_administrador=True,
+        )
+        self.depto = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.categoria = Categoria.objects.create(nombre="Baches", departamento=self.depto)
+        self.junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+        self.publicar()
+
+    def publicar(self):
+        return Publicacion.objects.create(
+            usuario=self.admin, junta_vecinal=self.junta, departamento=self.depto, categoria=self.categoria,
+            titulo="Bache", latitud=0, longitud=0,
+        )
+
+    def test_acierto_sin_recalcular(self):
+        primero = StatisticsService.get_resumen_estadisticas()
+        # Solo se consultan las marcas de cambio
+        with self.assertNumQueries(1):
+            self.assertEqual(StatisticsService.get_resumen_estadisticas(), primero)
+        contadores = contadores_cache()["metodos"]["get_resumen_estadisticas"]
+        self.assertEqual([contadores["aciertos"], contadores["fallos"]], [1, 1])
+
+    def test_argumentos_en_la_clave(self):
+        todas = StatisticsService.get_publicaciones_por_categoria()
+        ninguna = StatisticsService.get_publicaciones_por_categoria(Publicacion.objects.none())
+        self.assertEqual(todas, [{"categoria__nombre": "Baches", "total": 1}])
+        self.assertEqual(ninguna, [])
+
+    def test_escrituras_invalidan(self):
+        self.assertEqual(StatisticsService.get_resumen_estadisticas()["total_publicaciones"], 1)
+        self.publicar()
+        self.assertEqual(StatisticsService.get_resumen_estadisticas()["total_publicaciones"], 2)
+
+        HistorialModificaciones.objects.create(
+            publicacion=Publicacion.objects.first(), autor=self.admin, campo_modificado="titulo",
+            valor_anterior="Bache", valor_nuevo="Bache grande",
+        )
+        tablero = Tablero.objects.create(titulo="Obras", departamento=self.depto)
+        Tarea.objects.create(
+            titulo="Bachear", descripcion="Pasaje Los Aromos", encargado=self.admin, prioridad="alta",
+            categoria=self.categoria, columna=Columna.objects.create(titulo="Por hacer", tablero=tablero),
+        )
+        StatisticsService.get_resumen_estadisticas()
+
+        contadores = contadores_cache()["metodos"]["get_resumen_estadisticas"]
+        self.assertEqual([contadores["aciertos"], contadores["fallos"]], [0, 3])
+
+    def test_backend_de_archivos(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            cache_archivos = {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": directorio,
+            }
+            with override_settings(CACHES={"default": cache_archivos, "estadisticas": cache_archivos}):
+                primero = StatisticsService.get_resumen_estadisticas()
+                self.assertEqual(StatisticsService.get_resumen_estadisticas(), primero)
+                self.assertEqual(contadores_cache()["totales"]["aciertos"], 1)
+
+    def test_endpoint_contadores(self):
+        self.client.force_authenticate(user=self.admin)
+        self.client.get("/api/v1/estadisticas/resumen/")
+        self.client.get("/api/v1/estadisticas/resumen/")
+        datos = self.client.get(URL_CONTADORES).data
+        self.assertEqual(datos["backend"], "LocMemCache")
+        self.assertEqual(datos["metodos"]["get_resumen_estadisticas"]["tasa_aciertos"], 50.0)
+
+        self.assertEqual(self.client.delete(URL_CONTADORES).status_code, 204)
+        self.assertEqual(self.client.get(URL_CONTADORES).data["totales"]["aciertos"], 0)
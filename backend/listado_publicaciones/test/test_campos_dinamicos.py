@@ -0,0 +1,93 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from ..models import (
+    Publicacion, Usuario, Categoria, DepartamentoMunicipal, JuntaVecinal,
+    SituacionPublicacion, Evidencia
+)
+from ..serializers.campos import parsear_campos, EXPANDIR
+
+
+class CamposDinamicosTest(APITestCase):
+    """?fields=, ?expand= y ?perfil=lite en el listado de publicaciones."""
+
+    def setUp(self):
+        self.admin = Usuario.objects.create(
+            rut="11111111-1", email="admin@muni.cl", nombre="Admin",
+            es_administrador=True, tipo_usuario="administrador"
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.depto = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.categoria = Categoria.objects.create(nombre="Baches", departamento=self.depto)
+        self.junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        self.situacion = SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+        for i in range(3):
+            pub = Publicacion.objects.create(
+                usuario=self.admin, junta_vecinal=self.junta, categoria=self.categoria,
+                departamento=self.depto, situacion=self.situacion if i else None,
+                titulo=f"Pub {i}", latitud=0, longitud=0, descripcion="Texto largo",
+            )
+            Evidencia.objects.create(publicacion=pub, archivo="evidencias/foto.jpg", extension="jpg")
+
+    def listar(self, parametros):
+        with CaptureQueriesContext(connection) as consultas:
+            response = self.client.get("/api/v1/publicaciones/", parametros)
+        self.assertEqual(response.status_code, 200)
+        # Solo lecturas: ATOMIC_REQUESTS agrega SAVEPOINT/RELEASE alrededor de la vista
+        lecturas = [consulta for consulta in consultas.captured_queries if consulta["sql"].startswith("SELECT")]
+        return response.data["results"], lecturas
+
+    def test_parsear_campos(self):
+        self.assertIsNone(parsear_campos(None, "usuario"))
+        self.assertEqual(
+            parsear_campos("id, usuario.nombre,categoria,evidencias", "categoria"),
+            {"id": None, "usuario": {"nombre": None}, "categoria": EXPANDIR, "evidencias": None},
+        )
+
+    def test_solo_campos_pedidos_y_columnas_acotadas(self):
+        resultados, consultas = self.listar({"fields": "id,titulo"})
+        self.assertEqual(set(resultados[0]), {"id", "titulo"})
+        # marcas de cambio (ETag) + count + select, sin precargas de relaciones que no se serializan
+        self.assertEqual(len(consultas), 3)
+        self.assertNotIn('"descripcion"', consultas[-1]["sql"])
+
+    def test_relaciones_no_expandidas_van_como_id(self):
+        resultados, _ = self.listar({"fields": "id,usuario,categoria,evidencias"})
+        publicacion = Publicacion.objects.get(id=resultados[0]["id"])
+        self.assertEqual(resultados[0]["usuario"], self.admin.id)
+        self.assertEqual(resultados[0]["categoria"], self.categoria.id)
+        self.assertEqual(
+            resultados[0]["evidencias"],
+            list(publicacion.evidencia_set.values_list("id", flat=True)),
+        )
+
+    def test_expand_y_subcampos(self):
+        completos, _ = self.listar({})
+        resultados, _ = self.listar({"fields": "id,categoria,usuario.nombre", "expand": "categoria"})
+        self.assertEqual(resultados[0]["categoria"], completos[0]["categoria"])
+        self.assertEqual(resultados[0]["usuario"], {"nombre": "Admin"})
+
+    def test_sin_fields_representacion_completa(self):
+        resultados, _ = self.listar({"expand": "usuario"})
+        self.assertIn("descripcion", resultados[0])
+        self.assertIsInstance(resultados[0]["usuario"], dict)
+        self.assertIsInstance(resultados[0]["evidencias"][0], dict)
+
+    def test_perfil_lite(self):
+        resultados, consultas = self.listar({"perfil": "lite", "ordering": "fecha_publicacion"})
+        self.assertEqual(len(consultas), 3)
+        primera = resultados[0]
+        self.assertEqual(primera["categoria_nombre"], "Baches")
+        self.assertEqual(primera["departamento_nombre"], "Obras")
+        self.assertEqual(primera["junta_vecinal_nombre"], "Centro")
+        self.assertIsNone(primera["situacion_nombre"])
+        self.assertEqual(resultados[1]["situacion_nombre"], "Pendiente")
+        self.assertNotIn("usuario", primera)
+
+        resultados, _ = self.listar({"perfil": "lite", "fields": "id,categoria_nombre"})
+        self.assertEqual(set(resultados[0]), {"id", "categoria_nombre"})
+
+    def test_detalle_con_fields(self):
+        publicacion = Publicacion.objects.first()
+        response = self.client.get(f"/api/v1/publicaciones/{publicacion.id}/", {"fields": "id,codigo"})
+        self.assertEqual(response.data, {"id": publicacion.id, "codigo": publicacion.codigo})
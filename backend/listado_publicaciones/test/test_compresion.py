@@ -0,0 +1,93 @@
+import gzip
+import json
+import unittest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework.test import APITestCase
+from ..middleware import (
+    CompresionRespuestaMiddleware,
+    codificaciones_aceptadas,
+    estadisticas_compresion,
+    brotli,
+)
+from ..models import Usuario, JuntaVecinal
+
+
+class CompresionApiTest(APITestCase):
+    """Compresión negociada sobre un listado grande sin paginar."""
+
+    def setUp(self):
+        self.admin = Usuario.objects.create(
+            rut="11111111-1", email="admin@muni.cl", nombre="Admin",
+            es_administrador=True, tipo_usuario="administrador"
+        )
+        self.client.force_authenticate(user=self.admin)
+        JuntaVecinal.objects.bulk_create([
+            JuntaVecinal(nombre_junta=f"Junta {i}", nombre_calle="Calle", latitud=0, longitud=0, numero_calle=i)
+            for i in range(40)
+        ])
+
+    def test_gzip(self):
+        plano = self.client.get("/api/v1/juntas-vecinales/")
+        self.assertNotIn("Content-Encoding", plano)
+
+        estadisticas_compresion(reiniciar=True)
+        response = self.client.get("/api/v1/juntas-vecinales/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertIn("compresion;dur=", response["Server-Timing"])
+        self.assertEqual(gzip.decompress(response.content), plano.content)
+        self.assertEqual(int(response["Content-Length"]), len(response.content))
+
+        totales = estadisticas_compresion()["gzip"]
+        self.assertEqual(totales["respuestas"], 1)
+        self.assertEqual(totales["bytes_originales"], len(plano.content))
+        self.assertGreater(totales["bytes_ahorrados"], 0)
+
+    @unittest.skipIf(brotli is None, "brotli no instalado")
+    def test_brotli_preferido(self):
+        plano = self.client.get("/api/v1/juntas-vecinales/")
+        response = self.client.get("/api/v1/juntas-vecinales/", HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), plano.content)
+
+        response = self.client.get("/api/v1/juntas-vecinales/", HTTP_ACCEPT_ENCODING="br;q=0, gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+
+class CompresionMiddlewareTest(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.cuerpo = json.dumps([{"id": i, "nombre": "Publicación municipal"} for i in range(200)]).encode()
+
+    def procesar(self, response, aceptar="gzip"):
+        middleware = CompresionRespuestaMiddleware(lambda request: response)
+        return middleware(self.factory.get("/", HTTP_ACCEPT_ENCODING=aceptar))
+
+    def test_umbral_y_tipos(self):
+        pequena = self.procesar(HttpResponse(b'{"ok": true}', content_type="application/json"))
+        self.assertNotIn("Content-Encoding", pequena)
+
+        pdf = self.procesar(HttpResponse(self.cuerpo, content_type="application/pdf"))
+        self.assertNotIn("Content-Encoding", pdf)
+
+        sin_cliente = self.procesar(HttpResponse(self.cuerpo, content_type="application/json"), aceptar="identity")
+        self.assertNotIn("Content-Encoding", sin_cliente)
+
+    def test_streaming(self):
+        partes = [self.cuerpo[i:i + 500] for i in range(0, len(self.cuerpo), 500)]
+        response = self.procesar(StreamingHttpResponse(iter(partes), content_type="application/json"))
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), self.cuerpo)
+
+    def test_etag_fuerte_se_debilita(self):
+        original = HttpResponse(self.cuerpo, content_type="application/json")
+        original["ETag"] = '"abc"'
+        self.assertEqual(self.procesar(original)["ETag"], 'W/"abc"')
+
+    def test_accept_encoding(self):
+        self.assertEqual(
+            codificaciones_aceptadas("gzip;q=0.5, br , zstd;q=0, *;q=0.1"),
+            {"gzip": 0.5, "br": 1.0, "zstd": 0.0, "*": 0.1},
+        )
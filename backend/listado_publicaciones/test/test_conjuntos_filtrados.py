@@ -0,0 +1,74 @@
+from django.db import connection
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from ..benchmarks.seed import sembrar_municipio
+from ..filters import PublicacionFilter
+from ..models import Publicacion, Tarea, Usuario
+from ..services.statistics_service import StatisticsService
+from ..utils.cache_estadisticas import cache_estadisticas_backend
+from ..utils.conjuntos_filtrados import filtros_normalizados
+
+FILTROS = {"departamento": "Obras,Salud", "situacion": "Pendiente,En curso"}
+
+
+def filterset(parametros):
+    datos = QueryDict(mutable=True)
+    datos.update(parametros)
+    filtro = PublicacionFilter(datos, queryset=Publicacion.objects.all())
+    filtro.is_valid()
+    return filtro
+
+
+class ConjuntosFiltradosTest(APITestCase):
+    """Conjunto de ids filtrado compartido entre endpoints de estadísticas."""
+
+    def setUp(self):
+        cache_estadisticas_backend().clear()
+        sembrar_municipio(publicaciones=200, semilla=9, lote=100)
+        self.client.force_authenticate(user=Usuario.objects.filter(es_administrador=True).first())
+
+    def consultar(self, url, parametros=FILTROS):
+        with CaptureQueriesContext(connection) as consultas:
+            response = self.client.get(url, parametros)
+        sql = [consulta["sql"] for consulta in consultas.captured_queries]
+        return response, sql
+
+    def test_mismos_resultados(self):
+        esperado = StatisticsService.get_resumen_estadisticas(filterset(FILTROS).qs)
+        response, _ = self.consultar("/api/v1/estadisticas/resumen/")
+        self.assertEqual(response.data, esperado)
+        response, _ = self.consultar("/api/v1/estadisticas/resumen/")
+        self.assertEqual(response.data, esperado)
+
+    def test_endpoints_reutilizan_conjunto(self):
+        # resumen, por mes, por categoría y tasa de resolución leen el rollup diario
+        self.consultar("/api/v1/estadisticas/publicaciones-junta/")
+        _, sql = self.consultar("/api/v1/estadisticas/resueltas-junta/")
+        # El predicado de los filtros no se vuelve a evaluar: se filtra por id
+        self.assertFalse([consulta for consulta in sql if '"situacion_id" IN' in consulta])
+        self.assertTrue(any('"id" IN (' in consulta for consulta in sql))
+
+    def test_cambio_invalida(self):
+        total = self.consultar("/api/v1/estadisticas/resumen/")[0].data["total_publicaciones"]
+        publicacion = filterset(FILTROS).qs.first()
+        publicacion.pk = None
+        publicacion.codigo = None
+        publicacion.save()
+        response, _ = self.consultar("/api/v1/estadisticas/resumen/")
+        self.assertEqual(response.data["total_publicaciones"], total + 1)
+
+    def test_cambio_en_relacion_de_existencia_invalida(self):
+        parametros = {**FILTROS, "en_tarea_kanban": "false"}
+        total = self.consultar("/api/v1/estadisticas/resumen/", parametros)[0].data["total_publicaciones"]
+        publicacion = filterset(parametros).qs.first()
+        Tarea.objects.first().publicaciones.add(publicacion)
+        response, _ = self.consultar("/api/v1/estadisticas/resumen/", parametros)
+        self.assertEqual(response.data["total_publicaciones"], total - 1)
+
+    def test_normalizacion(self):
+        self.assertEqual(
+            filtros_normalizados(filterset({**FILTROS, "page": "2"})),
+            filtros_normalizados(filterset(dict(reversed(list(FILTROS.items()))))),
+        )
+        self.assertEqual(filtros_normalizados(filterset({})), [])
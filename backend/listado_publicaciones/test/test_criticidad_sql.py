@@ -0,0 +1,112 @@
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from importlib import import_module
+from io import StringIO
+from django.apps import apps
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from ..benchmarks.seed import sembrar_municipio
+from ..models import Publicacion, Usuario
+from ..services.statistics_service import StatisticsService
+from ..utils.dias_habiles import dias_habiles_entre
+
+
+def criticidad_en_python(qs):
+    """Agregación anterior (una instancia por publicación), como referencia"""
+    juntas_data = {}
+    ahora = timezone.now()
+    pendientes = []
+    # Por id: el orden de primera aparición de las categorías no depende de
+    # cómo devuelva las filas el motor (en PostgreSQL cambia tras un update)
+    for pub in qs.select_related("junta_vecinal", "situacion", "categoria").order_by("id"):
+        junta = pub.junta_vecinal
+        data = juntas_data.setdefault(junta.id, {
+            "junta_obj": junta, "total": 0, "pendientes": 0, "vencidas": 0,
+            "dias_pendientes_acum": 0, "categorias_conteo": {},
+        })
+        data["total"] += 1
+        nombre = pub.categoria.nombre
+        data["categorias_conteo"][nombre] = data["categorias_conteo"].get(nombre, 0) + 1
+        if pub.situacion_id == 4 or pub.situacion is None:
+            data["pendientes"] += 1
+            data["dias_pendientes_acum"] += (timezone.localdate(ahora) - timezone.localdate(pub.fecha_publicacion)).days
+            pendientes.append((junta.id, pub.fecha_publicacion))
+    dias = dias_habiles_entre([fecha for _, fecha in pendientes], ahora)
+    for (junta_id, _), dias_junta in zip(pendientes, dias):
+        if dias_junta > settings.PLAZO_LEGAL_DIAS:
+            juntas_data[junta_id]["vencidas"] += 1
+    return juntas_data
+
+
+class CriticidadSqlTest(APITestCase):
+    """La criticidad por junta se agrega en SQL con el mismo resultado."""
+
+    def setUp(self):
+        sembrar_municipio(publicaciones=300, semilla=17, lote=100)
+        # Casos borde: sin situación y publicaciones justo alrededor del plazo
+        ids = list(Publicacion.objects.order_by("id").values_list("id", flat=True)[:40])
+        Publicacion.objects.filter(id__in=ids[:10]).update(situacion=None)
+        ahora = timezone.now()
+        for dias, publicacion_id in enumerate(ids[10:40], start=20):
+            Publicacion.objects.filter(id=publicacion_id).update(
+                situacion_id=4, fecha_publicacion=ahora - timedelta(days=dias)
+            )
+        # update() no pasa por save(): se recalcula el plazo como tras una carga masiva
+        call_command("recalcular_vencimientos", stdout=StringIO())
+        self.client.force_authenticate(user=Usuario.objects.filter(es_administrador=True).first())
+
+    def test_mismos_conteos(self):
+        self.assertMismosConteos()
+
+    def test_sin_fecha_vencimiento(self):
+        # Filas de antes de la migración 0027 o de cargas con update() sin recalcular
+        Publicacion.objects.filter(id__in=Publicacion.objects.order_by("id").values("id")[:40]).update(
+            fecha_vencimiento_legal=None
+        )
+        self.assertMismosConteos()
+
+    def test_carga_de_la_migracion(self):
+        # La copia congelada del calendario en 0027 da las mismas fechas que utils/dias_habiles.py
+        esperadas = dict(Publicacion.objects.values_list("id", "fecha_vencimiento_legal"))
+        Publicacion.objects.update(fecha_vencimiento_legal=None)
+        migracion = import_module("listado_publicaciones.migrations.0027_fecha_vencimiento_legal")
+        migracion.poblar_vencimientos(apps, None)
+        self.assertEqual(dict(Publicacion.objects.values_list("id", "fecha_vencimiento_legal")), esperadas)
+
+    def assertMismosConteos(self):
+        referencia = criticidad_en_python(Publicacion.objects.all())
+        resultado = {fila["Junta_Vecinal"]["id"]: fila for fila in StatisticsService.get_analisis_criticidad_juntas()}
+        self.assertEqual(set(resultado), set(referencia))
+        self.assertTrue(any(datos["vencidas"] for datos in referencia.values()))
+        for junta_id, datos in referencia.items():
+            fila = resultado[junta_id]
+            self.assertEqual(fila["Junta_Vecinal"]["total_publicaciones"], datos["total"])
+            self.assertEqual(fila["Junta_Vecinal"]["pendientes"], datos["pendientes"])
+            self.assertEqual(fila["Junta_Vecinal"]["urgentes"], datos["vencidas"])
+            promedio = datos["dias_pendientes_acum"] // datos["pendientes"] if datos["pendientes"] else 0
+            self.assertEqual(fila["tiempo_promedio_pendiente"], f"{promedio} días")
+            categorias = {clave: valor for clave, valor in fila.items() if clave not in ("Junta_Vecinal", "tiempo_promedio_pendiente")}
+            self.assertEqual(list(categorias.items()), list(datos["categorias_conteo"].items()))
+
+    @override_settings(PLAZO_LEGAL_DIAS=20)
+    def test_vencimiento_al_guardar(self):
+        publicacion = Publicacion.objects.order_by("id").first()
+        publicacion.fecha_publicacion = datetime(2025, 9, 12, 15, tzinfo=dt_timezone.utc)
+        publicacion.save(update_fields=["fecha_publicacion"])
+        publicacion.refresh_from_db()
+        self.assertEqual(publicacion.fecha_vencimiento_legal, date(2025, 10, 14))
+
+    def test_consultas_constantes(self):
+        with CaptureQueriesContext(connection) as consultas:
+            response = self.client.get("/api/v1/estadisticas/junta-critica/", {"departamento": "Obras"})
+        # Solo lecturas: ATOMIC_REQUESTS agrega SAVEPOINT/RELEASE alrededor de la vista
+        total_consultas = len([consulta for consulta in consultas.captured_queries if consulta["sql"].startswith("SELECT")])
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.data["junta_mas_critica"])
+        # Filtro por nombre (2), conjunto filtrado (2), conteos, juntas y categorías,
+        # más las marcas del cache de estadísticas (completa y análisis)
+        self.assertLessEqual(total_consultas, 9)
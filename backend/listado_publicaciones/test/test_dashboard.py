@@ -0,0 +1,87 @@
+import threading
+from unittest.mock import patch
+from django.http import QueryDict
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from ..benchmarks.seed import sembrar_municipio
+from ..filters import PublicacionFilter
+from ..models import Publicacion, Usuario
+from ..services.dashboard_service import DashboardService, SECCIONES, BASE_RESUMEN, BASE_PUBLICACIONES
+
+URL = "/api/v1/estadisticas/dashboard/"
+FILTROS = {"departamento": "Obras,Salud"}
+
+# Sección del dashboard -> endpoint individual equivalente
+ENDPOINTS = {
+    "resumen": "/api/v1/estadisticas/resumen/",
+    "mes_categoria": "/api/v1/estadisticas/publicaciones-mes-categoria/",
+    "categorias": "/api/v1/estadisticas/publicaciones-categoria/",
+    "resueltos_mes": "/api/v1/estadisticas/resueltos-mes/",
+    "tasa_departamento": "/api/v1/estadisticas/tasa-resolucion/",
+    "criticidad": "/api/v1/estadisticas/publicaciones-junta/",
+    "eficiencia": "/api/v1/estadisticas/junta-eficiente/",
+    "frio": "/api/v1/estadisticas/resueltas-junta/",
+}
+
+
+def filterset(parametros):
+    datos = QueryDict(mutable=True)
+    datos.update(parametros)
+    filtro = PublicacionFilter(datos, queryset=Publicacion.objects.all())
+    filtro.is_valid()
+    return filtro
+
+
+class DashboardTest(APITestCase):
+    """Dashboard en secuencia (dentro de la transacción del test) frente a los endpoints individuales."""
+
+    def setUp(self):
+        sembrar_municipio(publicaciones=150, semilla=11, lote=50)
+        self.client.force_authenticate(user=Usuario.objects.filter(es_administrador=True).first())
+
+    def assertIgualAEndpoints(self, datos):
+        self.assertEqual(set(datos["secciones"]), set(ENDPOINTS))
+        self.assertEqual(set(datos["tiempos_ms"]), set(ENDPOINTS) | {"base_filtrada"})
+        for seccion, url in ENDPOINTS.items():
+            self.assertEqual(datos["secciones"][seccion], self.client.get(url, FILTROS).json(), seccion)
+
+    def test_igual_a_los_endpoints(self):
+        datos = self.client.get(URL, FILTROS).json()
+        self.assertFalse(datos["en_paralelo"])
+        self.assertIgualAEndpoints(datos)
+
+    def test_secciones_pedidas(self):
+        datos = self.client.get(URL, {"secciones": "resumen, criticidad"}).json()
+        self.assertEqual(list(datos["secciones"]), ["resumen", "criticidad"])
+
+    def test_validaciones(self):
+        response = self.client.get(URL, {"secciones": "resumen,mapa"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("mapa", response.data["secciones"])
+        self.client.force_authenticate(user=Usuario.objects.filter(es_administrador=False).first())
+        self.assertEqual(self.client.get(URL).status_code, 403)
+
+
+@override_settings(ESTADISTICAS_DASHBOARD_HILOS=4)
+class DashboardConcurrenteTest(SimpleTestCase):
+    """
+    Fuera de una transacción las secciones corren en el pool de hilos. Las
+    secciones de prueba no usan la base: en SQLite en memoria las conexiones
+    de otros hilos no se pueden cerrar.
+    """
+
+    def test_secciones_en_paralelo(self):
+        # Solo se pasa la barrera si ambas secciones corren a la vez
+        barrera = threading.Barrier(2, timeout=5)
+
+        def seccion(queryset):
+            barrera.wait()
+            return threading.current_thread().name
+
+        secciones = {"a": (BASE_RESUMEN, seccion), "b": (BASE_PUBLICACIONES, seccion)}
+        with patch.dict(SECCIONES, secciones, clear=True):
+            datos = DashboardService.calcular(filterset({}))
+
+        self.assertTrue(datos["en_paralelo"])
+        self.assertEqual(len(set(datos["secciones"].values())), 2)
+        self.assertTrue(all(nombre.startswith("dashboard") for nombre in datos["secciones"].values()))
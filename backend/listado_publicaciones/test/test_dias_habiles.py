@@ -0,0 +1,71 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+import numpy as np
+from django.test import SimpleTestCase, override_settings
+from ..utils.dias_habiles import (
+    feriados_del_anio,
+    dias_habiles_entre,
+    sumar_dias_habiles,
+    vencimientos_legales,
+    corte_vencimiento,
+)
+
+
+class DiasHabilesTest(SimpleTestCase):
+    def test_feriados_2025(self):
+        feriados = set(feriados_del_anio(2025))
+        esperados = {
+            date(2025, 1, 1), date(2025, 4, 18), date(2025, 4, 19), date(2025, 5, 1), date(2025, 5, 21),
+            date(2025, 6, 20), date(2025, 6, 29), date(2025, 7, 16), date(2025, 8, 15), date(2025, 9, 18),
+            date(2025, 9, 19), date(2025, 10, 12), date(2025, 10, 31), date(2025, 11, 1), date(2025, 12, 8),
+            date(2025, 12, 25),
+        }
+        self.assertEqual(feriados, esperados)
+
+    def test_traslados(self):
+        # 29 de junio de 2027 es martes: pasa al lunes 28
+        self.assertIn(date(2027, 6, 28), feriados_del_anio(2027))
+        self.assertNotIn(date(2027, 6, 29), feriados_del_anio(2027))
+        # 31 de octubre de 2029 es miércoles: pasa al viernes 2 de noviembre
+        self.assertIn(date(2029, 11, 2), feriados_del_anio(2029))
+        # 20 de septiembre de 2024 es viernes: también es feriado
+        self.assertIn(date(2024, 9, 20), feriados_del_anio(2024))
+
+    def test_conteo_vectorizado(self):
+        inicios = [date(2025, 9, 12), date(2025, 9, 13), date(2025, 9, 1)]
+        fines = [date(2025, 9, 22), date(2025, 9, 22), date(2025, 9, 1)]
+        # Fiestas Patrias (18 y 19) no cuentan; el plazo parte al día siguiente
+        self.assertEqual(list(dias_habiles_entre(inicios, fines)), [4, 4, 0])
+        self.assertEqual(list(dias_habiles_entre(inicios[:2], date(2025, 9, 22))), [4, 4])
+        self.assertEqual(len(dias_habiles_entre([], date(2025, 9, 22))), 0)
+
+    def test_fecha_local(self):
+        # 02:00 UTC del 15 de septiembre es aún domingo 14 en Santiago
+        inicio = datetime(2025, 9, 15, 2, 0, tzinfo=ZoneInfo("UTC"))
+        self.assertEqual(list(dias_habiles_entre([inicio], date(2025, 9, 15))), [1])
+
+    @override_settings(FERIADOS_ADICIONALES=["2025-09-22"])
+    def test_feriados_adicionales(self):
+        self.assertEqual(list(dias_habiles_entre([date(2025, 9, 12)], date(2025, 9, 22))), [3])
+
+    def test_sumar_dias_habiles(self):
+        vencimientos = sumar_dias_habiles([date(2025, 9, 12), date(2025, 9, 13)], 20)
+        self.assertEqual(list(vencimientos), [np.datetime64("2025-10-14")] * 2)
+        self.assertEqual(list(dias_habiles_entre([date(2025, 9, 12)], vencimientos[:1])), [20])
+
+    @override_settings(PLAZO_LEGAL_DIAS=20)
+    def test_vencimiento_y_corte(self):
+        publicacion = date(2025, 9, 12)
+        vencimiento = vencimientos_legales([publicacion])[0]
+        self.assertEqual(vencimiento, date(2025, 10, 14))
+        # Vencida (fecha_vencimiento_legal < corte) sii pasaron más de 20 hábiles
+        for hoy in (date(2025, 10, 14), date(2025, 10, 15), date(2025, 10, 18), date(2025, 12, 1)):
+            ahora = datetime(hoy.year, hoy.month, hoy.day, 12, tzinfo=ZoneInfo("America/Santiago"))
+            self.assertEqual(
+                vencimiento < corte_vencimiento(ahora),
+                dias_habiles_entre([publicacion], hoy)[0] > 20,
+                hoy,
+            )
+        # Sábado: el corte es el viernes anterior
+        sabado = datetime(2025, 10, 18, 12, tzinfo=ZoneInfo("America/Santiago"))
+        self.assertEqual(corte_vencimiento(sabado), date(2025, 10, 17))
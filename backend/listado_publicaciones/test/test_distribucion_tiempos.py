@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+import numpy as np
+from rest_framework.test import APITestCase
+from ..models import (
+    Usuario,
+    DepartamentoMunicipal,
+    Categoria,
+    JuntaVecinal,
+    SituacionPublicacion,
+    Publicacion,
+    RespuestaMunicipal,
+)
+from ..services.statistics_service import StatisticsService
+from ..utils.cache_estadisticas import cache_estadisticas_backend
+from ..utils.distribucion_tiempos import resumir, etiquetas_histograma
+
+URL = "/api/v1/estadisticas/distribucion-tiempos/"
+INICIO = datetime(2025, 3, 3, 12, tzinfo=dt_timezone.utc)
+
+
+class DistribucionTiemposTest(APITestCase):
+    """Percentiles e histogramas contra valores calculados a mano."""
+
+    def setUp(self):
+        cache_estadisticas_backend().clear()
+        self.admin = Usuario.objects.create(
+            rut="11111111-1", email="admin@muni.cl", nombre="Admin", tipo_usuario="administrador",
+            es_administrador=True,
+        )
+        self.obras = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.salud = DepartamentoMunicipal.objects.create(nombre="Salud")
+        self.baches = Categoria.objects.create(nombre="Baches", departamento=self.obras)
+        self.vacunas = Categoria.objects.create(nombre="Vacunas", departamento=self.salud)
+        self.junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+        self.resuelto = SituacionPublicacion.objects.create(id=1, nombre="Resuelto")
+
+        # (categoría, días a la primera respuesta, días a la última, ¿resuelta?)
+        casos = [
+            (self.baches, 0.5, 2, True),
+            (self.baches, 1, 4, True),
+            (self.baches, 3, 12, True),
+            (self.baches, 6, 6, False),
+            (self.vacunas, 0.25, 1.5, True),
+            (self.vacunas, 40, 100, True),
+        ]
+        for categoria, primera, ultima, resuelta in casos:
+            publicacion = self.publicar(categoria, self.resuelto if resuelta else None)
+            self.responder(publicacion, ultima)
+            self.responder(publicacion, primera)
+        # Sin respuesta: no entra en la distribución
+        self.publicar(self.baches, self.resuelto)
+
+    def publicar(self, categoria, situacion=None):
+        datos = {"situacion": situacion} if situacion else {}
+        return Publicacion.objects.create(
+            usuario=self.admin, junta_vecinal=self.junta, departamento=categoria.departamento,
+            categoria=categoria, titulo="Reclamo", latitud=0, longitud=0, fecha_publicacion=INICIO, **datos,
+        )
+
+    def responder(self, publicacion, dias):
+        RespuestaMunicipal.objects.create(
+            usuario=self.admin, publicacion=publicacion, fecha=INICIO + timedelta(days=dias),
+            descripcion="Atendido", acciones="Visita", situacion_inicial="Pendiente", situacion_posterior="Resuelto",
+        )
+
+    def test_percentiles_e_histograma_por_departamento(self):
+        datos = StatisticsService.get_distribucion_tiempos()
+        self.assertEqual(datos["histograma"], etiquetas_histograma())
+        obras, salud = datos["grupos"]
+        self.assertEqual([obras["nombre"], salud["nombre"]], ["Obras", "Salud"])
+
+        # La no resuelta cuenta para la primera respuesta, no para la resolución
+        self.assertEqual(obras["primera_respuesta"]["cantidad"], 4)
+        self.assertEqual(obras["resolucion"]["cantidad"], 3)
+        esperado = np.percentile([2, 4, 12], [50, 75, 90, 99])
+        for p, valor in zip(datos["percentiles"], esperado):
+            self.assertAlmostEqual(obras["resolucion"][f"p{p}"], round(valor, 2), places=2)
+        self.assertAlmostEqual(obras["primera_respuesta"]["p50"], 2.0, places=2)
+        self.assertAlmostEqual(obras["resolucion"]["promedio"], 6.0, places=2)
+
+        # Tramos 0-1, 1-2, 2-3, 3-5, 5-10, 10-15, ..., 90+
+        self.assertEqual(obras["primera_respuesta"]["histograma"], [1, 1, 0, 1, 1, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(salud["resolucion"]["histograma"], [0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1])
+
+        total = datos["total"]["resolucion"]
+        self.assertEqual(total["cantidad"], 5)
+        self.assertAlmostEqual(total["p90"], round(np.percentile([2, 4, 12, 1.5, 100], 90), 2), places=2)
+        self.assertEqual(sum(total["histograma"]), 5)
+
+    def test_endpoint_agrupaciones(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(URL, {"agrupar_por": "categoria", "departamento": "Salud"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([grupo["nombre"] for grupo in response.data["grupos"]], ["Vacunas"])
+        self.assertEqual(response.data["total"]["primera_respuesta"]["cantidad"], 2)
+
+        junta = self.client.get(URL, {"agrupar_por": "junta_vecinal"}).data
+        self.assertEqual([grupo["nombre"] for grupo in junta["grupos"]], ["Centro"])
+        self.assertEqual(junta["grupos"][0]["resolucion"]["cantidad"], 5)
+
+        self.assertEqual(self.client.get(URL, {"agrupar_por": "comuna"}).status_code, 400)
+
+    def test_sin_datos(self):
+        datos = StatisticsService.get_distribucion_tiempos(Publicacion.objects.none())
+        self.assertEqual(datos["grupos"], [])
+        self.assertEqual(datos["total"]["resolucion"]["cantidad"], 0)
+        self.assertIsNone(datos["total"]["resolucion"]["p50"])
+
+        por_grupo, total = resumir(np.array([0, 0, 1]), np.array([86400.0, np.nan, -5.0]), 2)
+        self.assertEqual([por_grupo[0]["cantidad"], por_grupo[1]["cantidad"], total["cantidad"]], [1, 0, 1])
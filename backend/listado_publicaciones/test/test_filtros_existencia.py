@@ -0,0 +1,53 @@
+from django.http import QueryDict
+from django.test import TestCase
+from rest_framework.test import APIClient
+from ..benchmarks.seed import sembrar_municipio
+from ..filters import PublicacionFilter
+from ..models import Publicacion, Usuario
+
+
+def filtrar(**parametros):
+    datos = QueryDict(mutable=True)
+    datos.update(parametros)
+    return PublicacionFilter(datos, queryset=Publicacion.objects.order_by("-fecha_publicacion")).qs
+
+
+class FiltrosExistenciaTest(TestCase):
+    """Filtros por existencia de relaciones resueltos con EXISTS."""
+
+    def setUp(self):
+        sembrar_municipio(publicaciones=150, semilla=5, lote=50)
+        self.todas = set(Publicacion.objects.values_list("id", flat=True))
+
+    def test_equivalentes_al_join(self):
+        relaciones = {
+            "con_modificaciones": "historialmodificaciones",
+            "con_respuesta": "respuestamunicipal",
+            "con_evidencia": "evidencia",
+            "en_tarea_kanban": "tareas_asociadas",
+        }
+        for parametro, relacion in relaciones.items():
+            with self.subTest(parametro):
+                con = set(
+                    Publicacion.objects.filter(**{f"{relacion}__isnull": False}).values_list("id", flat=True)
+                )
+                self.assertTrue(con and con != self.todas)
+                self.assertEqual(set(filtrar(**{parametro: "true"}).values_list("id", flat=True)), con)
+                self.assertEqual(set(filtrar(**{parametro: "false"}).values_list("id", flat=True)), self.todas - con)
+
+    def test_sin_join_ni_distinct(self):
+        queryset = filtrar(con_modificaciones="true", con_respuesta="false", en_tarea_kanban="true")
+        sql = str(queryset.query).upper()
+        self.assertIn("EXISTS", sql)
+        self.assertNotIn("DISTINCT", sql)
+        self.assertNotIn("JOIN", sql)
+        # Conserva el orden del queryset base
+        fechas = list(queryset.values_list("fecha_publicacion", flat=True))
+        self.assertEqual(fechas, sorted(fechas, reverse=True))
+
+    def test_compone_con_estadisticas(self):
+        cliente = APIClient()
+        cliente.force_authenticate(user=Usuario.objects.filter(es_administrador=True).first())
+        response = cliente.get("/api/v1/estadisticas/resumen/", {"con_respuesta": "true"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["total_publicaciones"], filtrar(con_respuesta="true").count())
@@ -0,0 +1,64 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from ..benchmarks.filtros import queryset_filtro_anterior, queryset_filtro_actual, medir_filtros
+from ..benchmarks.seed import sembrar_municipio
+from ..models import Publicacion, Categoria
+
+
+class FiltrosReferenciasTest(TestCase):
+    """Los filtros por nombre se resuelven a ids sin cambiar las filas seleccionadas."""
+
+    def setUp(self):
+        sembrar_municipio(publicaciones=120, semilla=11, lote=50)
+        # Caso borde: publicación sin situación
+        Publicacion.objects.filter(id=Publicacion.objects.order_by("id").first().id).update(situacion=None)
+
+    def assertMismasFilas(self, parametros):
+        self.assertEqual(
+            set(queryset_filtro_actual(parametros).values_list("id", flat=True)),
+            set(queryset_filtro_anterior(parametros).values_list("id", flat=True)),
+        )
+
+    def test_misma_semantica_que_icontains(self):
+        casos = [
+            {"departamento": "obras"},
+            {"departamento": "Obras,Aseo"},
+            {"departamento": "Obras,"},
+            {"categoria": "SEGURIDAD 1,Salud"},
+            {"junta_vecinal": "Vecinal 1"},
+            {"situacion": "pendiente,Curso"},
+            {"situacion": "No existe"},
+            {"departamento": "Obras", "situacion": "Pendiente", "junta_vecinal": "2"},
+        ]
+        for parametros in casos:
+            with self.subTest(parametros):
+                self.assertMismasFilas(parametros)
+
+    def test_filtra_por_fk_sin_join(self):
+        sql = str(queryset_filtro_actual({"departamento": "Obras", "categoria": "Salud"}).query)
+        self.assertNotIn("LIKE", sql.upper())
+        self.assertIn("departamento_id", sql)
+
+    def test_cache_de_referencias(self):
+        parametros = {"departamento": "Obras", "categoria": "Salud", "situacion": "Pendiente"}
+        queryset_filtro_actual(parametros)
+        with CaptureQueriesContext(connection) as consultas:
+            queryset_filtro_actual(parametros)
+        total_consultas = len(consultas)
+        # Solo la lectura de las marcas de cambio
+        self.assertEqual(total_consultas, 1)
+
+    def test_cambio_de_nombre_invalida(self):
+        categoria = Categoria.objects.order_by("id").first()
+        self.assertFalse(queryset_filtro_actual({"categoria": "Renombrada"}).exists())
+        categoria.nombre = "Renombrada"
+        categoria.save()
+        self.assertEqual(
+            set(queryset_filtro_actual({"categoria": "Renombrada"}).values_list("id", flat=True)),
+            set(Publicacion.objects.filter(categoria=categoria).values_list("id", flat=True)),
+        )
+
+    def test_benchmark(self):
+        resultados = medir_filtros(repeticiones=1)
+        self.assertTrue(all(caso["mismas_filas"] for caso in resultados.values()))
@@ -0,0 +1,102 @@
+from django.contrib.auth.models import update_last_login
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from ..models import (
+    Usuario, DepartamentoMunicipal, Categoria, JuntaVecinal, SituacionPublicacion,
+    Publicacion, MarcaCambio
+)
+
+
+class GetCondicionalTest(APITestCase):
+    """ETag / Last-Modified a partir de las marcas de cambio por tabla."""
+
+    def setUp(self):
+        self.admin = Usuario.objects.create(
+            rut="11111111-1", email="admin@muni.cl", nombre="Admin",
+            es_administrador=True, tipo_usuario="administrador"
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.depto = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.categoria = Categoria.objects.create(nombre="Baches", departamento=self.depto)
+        self.junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        self.situacion = SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+
+    def crear_publicacion(self):
+        return Publicacion.objects.create(
+            usuario=self.admin, junta_vecinal=self.junta, categoria=self.categoria,
+            departamento=self.depto, situacion=self.situacion,
+            titulo="Bache", latitud=0, longitud=0, descripcion="Texto",
+        )
+
+    def test_304_sin_serializar(self):
+        for url in ("/api/v1/categorias/", "/api/v1/situaciones/", "/api/v1/juntas-vecinales/",
+                    "/api/v1/publicaciones/", "/api/v1/anuncios/"):
+            with self.subTest(url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response["ETag"].startswith('W/"'))
+                self.assertIn("Last-Modified", response)
+
+                with CaptureQueriesContext(connection) as consultas:
+                    condicional = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+                # ATOMIC_REQUESTS agrega SAVEPOINT/RELEASE; se cuentan las lecturas
+                total_consultas = sum(1 for consulta in consultas if consulta["sql"].startswith("SELECT"))
+                self.assertEqual(condicional.status_code, 304)
+                self.assertEqual(condicional["ETag"], response["ETag"])
+                # Solo la lectura de las marcas de cambio
+                self.assertEqual(total_consultas, 1)
+
+                por_fecha = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+                self.assertEqual(por_fecha.status_code, 304)
+
+    def test_cambio_en_tabla_dependiente_invalida(self):
+        etag = self.client.get("/api/v1/categorias/")["ETag"]
+        self.crear_publicacion()
+        response = self.client.get("/api/v1/categorias/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]["cantidad_publicaciones"], 1)
+        self.assertNotEqual(response["ETag"], etag)
+
+        # Una tabla que no participa del listado no lo invalida
+        etag = response["ETag"]
+        self.situacion.nombre = "Pendiente de revisión"
+        self.situacion.save()
+        self.assertEqual(self.client.get("/api/v1/categorias/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Publicacion.objects.all().delete()
+        self.assertEqual(self.client.get("/api/v1/categorias/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_etag_depende_de_url_y_usuario(self):
+        etag = self.client.get("/api/v1/publicaciones/")["ETag"]
+        self.assertNotEqual(self.client.get("/api/v1/publicaciones/?pagesize=5")["ETag"], etag)
+
+        otro = Usuario.objects.create(
+            rut="22222222-2", email="otro@muni.cl", nombre="Otro",
+            es_administrador=True, tipo_usuario="administrador"
+        )
+        self.client.force_authenticate(user=otro)
+        self.assertEqual(
+            self.client.get("/api/v1/publicaciones/", HTTP_IF_NONE_MATCH=etag).status_code, 200
+        )
+
+    def test_login_no_invalida(self):
+        version = MarcaCambio.marcas([Usuario])[MarcaCambio.tabla_de(Usuario)][0]
+        update_last_login(None, self.admin)
+        self.assertEqual(MarcaCambio.marcas([Usuario])[MarcaCambio.tabla_de(Usuario)][0], version)
+
+    def test_marca_se_incrementa_al_confirmar(self):
+        tabla = MarcaCambio.tabla_de(Publicacion)
+        with self.captureOnCommitCallbacks() as pendientes, CaptureQueriesContext(connection) as consultas:
+            self.crear_publicacion()
+            self.crear_publicacion()
+
+        # Durante la transacción nadie escribe (ni bloquea) la fila de la marca...
+        self.assertFalse([consulta for consulta in consultas if "marcacambio" in consulta["sql"]])
+        self.assertFalse(MarcaCambio.objects.filter(tabla=tabla).exists())
+        # ...pero la propia transacción ve sus cambios
+        self.assertEqual(MarcaCambio.marcas([Publicacion])[tabla][0], 2)
+
+        for callback in pendientes:
+            callback()
+        self.assertEqual(MarcaCambio.objects.get(tabla=tabla).version, 2)
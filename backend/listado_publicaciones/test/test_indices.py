@@ -0,0 +1,13 @@
+from django.test import TestCase
+from ..benchmarks.indices import verificar_indices
+from ..benchmarks.seed import sembrar_municipio
+
+
+class IndicesPublicacionTest(TestCase):
+    """Regresión de planes: cada ruta de acceso dominante usa su índice."""
+
+    def test_consultas_usan_indice(self):
+        sembrar_municipio(publicaciones=400, semilla=3, lote=200)
+        for nombre, resultado in verificar_indices().items():
+            with self.subTest(nombre):
+                self.assertTrue(resultado["usado"], resultado["plan"])
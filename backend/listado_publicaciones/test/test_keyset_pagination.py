@@ -0,0 +1,119 @@
+import base64
+import json
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from ..models import (
+    Publicacion, Usuario, Categoria, DepartamentoMunicipal, JuntaVecinal,
+    SituacionPublicacion, HistorialModificaciones, Auditoria
+)
+
+
+class KeysetPaginationTest(APITestCase):
+    """Paginación por cursor opt-in sobre (fecha, id)."""
+
+    def setUp(self):
+        self.admin = Usuario.objects.create(
+            rut="11111111-1", email="admin@muni.cl", nombre="Admin",
+            es_administrador=True, tipo_usuario="administrador"
+        )
+        self.client.force_authenticate(user=self.admin)
+        depto = DepartamentoMunicipal.objects.create(nombre="Obras")
+        categoria = Categoria.objects.create(nombre="Baches", departamento=depto)
+        junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        situacion = SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+
+        # Varias publicaciones comparten fecha para probar el desempate por id
+        base = timezone.now()
+        self.publicaciones = []
+        for i in range(13):
+            pub = Publicacion.objects.create(
+                usuario=self.admin, junta_vecinal=junta, categoria=categoria, departamento=depto,
+                situacion=situacion, titulo=f"Pub {i}", latitud=0, longitud=0,
+                fecha_publicacion=base - timedelta(hours=i // 3),
+            )
+            self.publicaciones.append(pub)
+            HistorialModificaciones.objects.create(
+                publicacion=pub, campo_modificado="titulo", valor_anterior="", valor_nuevo=pub.titulo,
+                autor=self.admin, fecha=pub.fecha_publicacion,
+            )
+
+    def recorrer(self, url):
+        ids, paginas = [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            paginas.append(response.data)
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+        return ids, paginas
+
+    def test_recorre_todas_las_publicaciones_sin_repetir(self):
+        ids, paginas = self.recorrer("/api/v1/publicaciones/?paginacion=cursor&pagesize=4")
+        esperado = list(
+            Publicacion.objects.order_by("-fecha_publicacion", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(ids, esperado)
+        self.assertEqual(len(paginas), 4)
+        self.assertIsNone(paginas[0]["previous"])
+
+    def test_previous_vuelve_a_la_pagina_anterior(self):
+        primera = self.client.get("/api/v1/publicaciones/?paginacion=cursor&pagesize=4").data
+        segunda = self.client.get(primera["next"]).data
+        tercera = self.client.get(segunda["next"]).data
+
+        volver = self.client.get(tercera["previous"]).data
+        self.assertEqual(volver["results"], segunda["results"])
+        inicio = self.client.get(volver["previous"]).data
+        self.assertEqual(inicio["results"], primera["results"])
+        self.assertIsNone(inicio["previous"])
+
+    def test_respeta_ordering_ascendente(self):
+        ids, _ = self.recorrer("/api/v1/publicaciones/?paginacion=cursor&pagesize=5&ordering=fecha_publicacion")
+        esperado = list(
+            Publicacion.objects.order_by("fecha_publicacion", "id").values_list("id", flat=True)
+        )
+        self.assertEqual(ids, esperado)
+
+    def test_cursor_no_ejecuta_count(self):
+        with CaptureQueriesContext(connection) as consultas:
+            self.client.get("/api/v1/publicaciones/?paginacion=cursor&pagesize=4")
+        # El COUNT(*) del paginador por número de página no debe aparecer
+        self.assertFalse(any(q["sql"].upper().startswith("SELECT COUNT(*)") for q in consultas.captured_queries))
+
+    def test_paginacion_por_numero_sigue_igual(self):
+        response = self.client.get("/api/v1/publicaciones/?pagesize=4&page=2")
+        self.assertEqual(response.data["count"], 13)
+        self.assertEqual(len(response.data["results"]), 4)
+
+    def test_cursor_invalido(self):
+        response = self.client.get("/api/v1/publicaciones/?cursor=no-es-un-cursor")
+        self.assertEqual(response.status_code, 404)
+
+    def test_cursor_con_valor_alterado(self):
+        for datos in ({"v": "x", "id": 1}, {"v": None, "id": 1}, {"v": [], "id": 1}):
+            cursor = base64.urlsafe_b64encode(json.dumps(datos).encode("utf-8")).decode("ascii")
+            with self.subTest(datos=datos):
+                response = self.client.get(f"/api/v1/publicaciones/?cursor={cursor}")
+                self.assertEqual(response.status_code, 404)
+
+    def test_historial_sin_parametros_no_pagina(self):
+        response = self.client.get("/api/v1/historial-modificaciones/")
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 13)
+
+        ids, _ = self.recorrer("/api/v1/historial-modificaciones/?paginacion=cursor&pagesize=5")
+        esperado = list(HistorialModificaciones.objects.order_by("-fecha", "-id").values_list("id", flat=True))
+        self.assertEqual(ids, esperado)
+
+    def test_auditorias_por_cursor(self):
+        for i in range(7):
+            Auditoria.objects.create(autor=self.admin, accion="READ", modulo="Pruebas", descripcion=str(i))
+        ids, _ = self.recorrer("/api/v1/auditorias/?paginacion=cursor&pagesize=3&modulo=Pruebas")
+        esperado = list(
+            Auditoria.objects.filter(modulo="Pruebas").order_by("-fecha", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(ids, esperado)
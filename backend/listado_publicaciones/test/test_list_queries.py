@@ -0,0 +1,78 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from ..models import (
+    Publicacion, Usuario, Categoria, DepartamentoMunicipal, UsuarioDepartamento,
+    JuntaVecinal, SituacionPublicacion, Evidencia
+)
+from ..serializers.v1 import PublicacionListSerializer
+
+
+class PublicacionListQueriesTest(APITestCase):
+    """
+    El listado de publicaciones debe usar un número constante de consultas
+    sin cambiar el JSON que se entrega.
+    """
+
+    def setUp(self):
+        self.admin = Usuario.objects.create(
+            rut="11111111-1", email="admin@muni.cl", nombre="Admin",
+            es_administrador=True, tipo_usuario="administrador"
+        )
+        self.client.force_authenticate(user=self.admin)
+
+        self.depto_obras = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.depto_aseo = DepartamentoMunicipal.objects.create(nombre="Aseo")
+
+        # Jefe que dirige un departamento y personal con asignación activa
+        self.jefe = Usuario.objects.create(
+            rut="22222222-2", email="jefe@muni.cl", nombre="Jefe", tipo_usuario="jefe_departamento"
+        )
+        self.depto_obras.jefe_departamento = self.jefe
+        self.depto_obras.save()
+        self.personal = Usuario.objects.create(
+            rut="33333333-3", email="personal@muni.cl", nombre="Personal", tipo_usuario="personal"
+        )
+        UsuarioDepartamento.objects.create(usuario=self.personal, departamento=self.depto_aseo)
+        self.vecino = Usuario.objects.create(rut="44444444-4", email="vecino@muni.cl", nombre="Vecino")
+
+        self.cat_obras = Categoria.objects.create(nombre="Baches", departamento=self.depto_obras)
+        self.cat_aseo = Categoria.objects.create(nombre="Basura", departamento=self.depto_aseo)
+        self.junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        self.situacion = SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+
+    def crear_publicaciones(self, cantidad):
+        autores = [self.vecino, self.jefe, self.personal]
+        for i in range(cantidad):
+            pub = Publicacion.objects.create(
+                usuario=autores[i % 3], encargado=autores[(i + 1) % 3] if i % 2 else None,
+                junta_vecinal=self.junta, categoria=self.cat_obras if i % 2 else self.cat_aseo,
+                departamento=self.depto_obras, situacion=self.situacion,
+                titulo=f"Pub {i}", latitud=0, longitud=0,
+            )
+            Evidencia.objects.create(publicacion=pub, archivo="evidencias/foto.jpg", extension="jpg")
+
+    def test_json_identico_con_queryset_optimizado(self):
+        self.crear_publicaciones(6)
+        queryset = Publicacion.objects.order_by("id")
+
+        original = PublicacionListSerializer(queryset, many=True).data
+        optimizado = PublicacionListSerializer(
+            PublicacionListSerializer.queryset_optimizado(queryset), many=True
+        ).data
+
+        self.assertEqual(JSONRenderer().render(original), JSONRenderer().render(optimizado))
+
+    def test_consultas_constantes_al_crecer_la_pagina(self):
+        self.crear_publicaciones(3)
+        with CaptureQueriesContext(connection) as pocas:
+            response = self.client.get("/api/v1/publicaciones/?pagesize=100")
+        self.assertEqual(len(response.data["results"]), 3)
+
+        self.crear_publicaciones(30)
+        with CaptureQueriesContext(connection) as muchas:
+            response = self.client.get("/api/v1/publicaciones/?pagesize=100")
+        self.assertEqual(len(response.data["results"]), 33)
+
+        self.assertEqual(len(pocas), len(muchas))
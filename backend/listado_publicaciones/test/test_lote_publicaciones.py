@@ -0,0 +1,106 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from ..models import (
+    Usuario, DepartamentoMunicipal, Categoria, JuntaVecinal, SituacionPublicacion,
+    Publicacion, Auditoria, MarcaCambio
+)
+
+URL = "/api/v1/publicaciones/lote/"
+
+
+class LotePublicacionesTest(APITestCase):
+    """Creación de publicaciones por lote con resultado por ítem."""
+
+    def setUp(self):
+        self.vecino = Usuario.objects.create(
+            rut="11111111-1", email="vecino@muni.cl", nombre="Vecino", tipo_usuario="vecino"
+        )
+        self.client.force_authenticate(user=self.vecino)
+        self.depto = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.categoria = Categoria.objects.create(nombre="Baches", departamento=self.depto)
+        self.norte = JuntaVecinal.objects.create(
+            nombre_junta="Norte", latitud=-22.40, longitud=-68.90, numero_calle=1
+        )
+        self.sur = JuntaVecinal.objects.create(
+            nombre_junta="Sur", latitud=-22.50, longitud=-68.95, numero_calle=2
+        )
+        SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+
+    def item(self, indice, **extra):
+        datos = {
+            "usuario": self.vecino.id,
+            "categoria": self.categoria.id,
+            "titulo": f"Bache {indice}",
+            "descripcion": "Reporte offline",
+            "latitud": "-22.401000" if indice % 2 else "-22.499000",
+            "longitud": "-68.901000" if indice % 2 else "-68.949000",
+            "id_local": f"local-{indice}",
+        }
+        datos.update(extra)
+        return datos
+
+    def enviar(self, items):
+        with CaptureQueriesContext(connection) as consultas:
+            response = self.client.post(URL, {"publicaciones": items}, format="json")
+        total_consultas = len(consultas)
+        return response, total_consultas
+
+    def test_crea_todo_el_lote(self):
+        items = [self.item(i) for i in range(6)]
+        version = MarcaCambio.marcas([Publicacion]).get(MarcaCambio.tabla_de(Publicacion), (0, None))[0]
+
+        response, _ = self.enviar(items)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["creadas"], 6)
+
+        resultados = response.data["resultados"]
+        self.assertEqual([r["id_local"] for r in resultados], [i["id_local"] for i in items])
+        self.assertEqual(len({r["codigo"] for r in resultados}), 6)
+
+        creadas = Publicacion.objects.in_bulk([r["id"] for r in resultados])
+        for resultado in resultados:
+            publicacion = creadas[resultado["id"]]
+            esperada = self.norte if resultado["indice"] % 2 else self.sur
+            self.assertEqual(publicacion.junta_vecinal_id, esperada.id)
+            self.assertEqual(publicacion.departamento_id, self.depto.id)
+            self.assertEqual(publicacion.situacion_id, 4)
+            self.assertEqual(publicacion.codigo, resultado["codigo"])
+
+        self.assertEqual(Auditoria.objects.filter(accion="CREATE", modulo="Publicaciones").count(), 1)
+        self.assertGreater(MarcaCambio.marcas([Publicacion])[MarcaCambio.tabla_de(Publicacion)][0], version)
+
+    def test_consultas_no_dependen_del_tamano(self):
+        # El primer envío crea la fila de MarcaCambio y las celdas del rollup diario de ambas juntas
+        self.enviar([self.item(0), self.item(1)])
+        _, pocas = self.enviar([self.item(i) for i in range(2)])
+        _, muchas = self.enviar([self.item(i) for i in range(30)])
+        self.assertEqual(pocas, muchas)
+
+    def test_resultado_por_item_con_errores(self):
+        items = [
+            self.item(0),
+            self.item(1, categoria=9999),
+            self.item(2, latitud=None),
+            self.item(3, junta_vecinal=self.norte.id, auto_detectar_junta=False),
+            "no es un objeto",
+        ]
+        response, _ = self.enviar(items)
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data["creadas"], 2)
+        estados = [r["estado"] for r in response.data["resultados"]]
+        self.assertEqual(estados, ["creada", "error", "error", "creada", "error"])
+        self.assertIn("categoria", response.data["resultados"][1]["errores"])
+        self.assertEqual(response.data["resultados"][3]["junta_vecinal"], self.norte.id)
+        self.assertEqual(Publicacion.objects.count(), 2)
+
+    def test_lote_invalido(self):
+        self.assertEqual(self.client.post(URL, {"publicaciones": []}, format="json").status_code, 400)
+        response, _ = self.enviar([self.item(0, categoria=9999)])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Auditoria.objects.exists())
+
+    def test_codigos_sin_colision(self):
+        publicaciones = [Publicacion(titulo=str(i)) for i in range(50)]
+        Publicacion.asignar_codigos(publicaciones)
+        self.assertEqual(len({p.codigo for p in publicaciones}), 50)
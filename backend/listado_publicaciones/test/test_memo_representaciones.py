@@ -0,0 +1,90 @@
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from ..benchmarks.seed import sembrar_municipio
+from ..models import Usuario, HistorialModificaciones, Tarea, Publicacion
+from ..serializers.compilado import serializar_compilado
+from ..serializers.memo import MemoRepresentacionMixin
+from ..serializers.v1 import (
+    HistorialModificacionesSerializer,
+    TareaListSerializer,
+    PublicacionListSerializer,
+)
+
+
+class MemoRepresentacionesTest(APITestCase):
+    """Cada objeto anidado se serializa una vez por respuesta, con el mismo JSON."""
+
+    def setUp(self):
+        sembrar_municipio(publicaciones=40, semilla=5, lote=20)
+        self.admin = Usuario.objects.get(es_administrador=True)
+        self.client.force_authenticate(user=self.admin)
+        self.renderer = JSONRenderer()
+
+    def listar(self, url):
+        with CaptureQueriesContext(connection) as consultas:
+            response = self.client.get(url)
+        total_consultas = len(consultas)
+        self.assertEqual(response.status_code, 200)
+        return response.data, total_consultas
+
+    def sin_memo(self, serializer_class, queryset):
+        with mock.patch.object(MemoRepresentacionMixin, "_memo", return_value=None):
+            return self.renderer.render(serializer_class(queryset, many=True).data)
+
+    def test_historial_mismo_json_y_menos_trabajo(self):
+        queryset = HistorialModificaciones.objects.all().order_by("-fecha")
+        self.assertGreater(queryset.count(), queryset.values("autor").distinct().count())
+
+        original = Usuario.get_departamento_asignado
+        with mock.patch.object(
+            Usuario, "get_departamento_asignado", autospec=True, side_effect=original
+        ) as llamadas:
+            datos, total_consultas = self.listar("/api/v1/historial-modificaciones/")
+        usuarios_distintos = {fila["autor"]["id"] for fila in datos} | {
+            fila["publicacion"]["usuario"]["id"] for fila in datos
+        } | {
+            fila["publicacion"]["encargado"]["id"] for fila in datos if fila["publicacion"]["encargado"]
+        }
+        self.assertLessEqual(llamadas.call_count, len(usuarios_distintos))
+        self.assertLessEqual(total_consultas, 12)
+
+        self.assertEqual(
+            self.renderer.render(datos),
+            self.sin_memo(HistorialModificacionesSerializer, queryset),
+        )
+
+    def test_tareas_consultas_constantes(self):
+        datos, total_consultas = self.listar("/api/v1/tareas/")
+        self.assertEqual(len(datos), Tarea.objects.count())
+        self.assertLessEqual(total_consultas, 8)
+        # Las tareas sembradas comparten fecha_creacion: se comparan por id
+        self.assertEqual(
+            self.renderer.render(sorted(datos, key=lambda fila: fila["id"])),
+            self.sin_memo(TareaListSerializer, TareaListSerializer.queryset_optimizado(Tarea.objects.order_by("id"))),
+        )
+
+    def test_kanban_anidado_consultas_constantes(self):
+        for url in ("/api/v1/tableros/", "/api/v1/columnas/", "/api/v1/comentarios/"):
+            with self.subTest(url):
+                _, total_consultas = self.listar(url)
+                self.assertLessEqual(total_consultas, 12)
+
+    def test_compilado_reutiliza_representaciones(self):
+        publicaciones = list(
+            PublicacionListSerializer.queryset_optimizado(Publicacion.objects.order_by("id"))
+        )
+        datos = serializar_compilado(PublicacionListSerializer, publicaciones)
+        por_usuario = {}
+        for fila in datos:
+            por_usuario.setdefault(fila["usuario"]["id"], []).append(fila["usuario"])
+        repetidas = [filas for filas in por_usuario.values() if len(filas) > 1]
+        self.assertTrue(repetidas)
+        for filas in repetidas:
+            self.assertTrue(all(fila is filas[0] for fila in filas))
+        self.assertEqual(
+            self.renderer.render(datos),
+            self.sin_memo(PublicacionListSerializer, publicaciones),
+        )
@@ -0,0 +1,216 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import transaction
+from django.http import QueryDict
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+from ..benchmarks.seed import sembrar_municipio
+from ..filters import PublicacionFilter
+from ..models import (
+    Usuario,
+    DepartamentoMunicipal,
+    Categoria,
+    JuntaVecinal,
+    SituacionPublicacion,
+    Publicacion,
+    RespuestaMunicipal,
+    ResumenDiario,
+)
+from ..services.resumen_diario_service import ResumenDiarioService, RecalculoPendiente, CAMPOS_CELDA, CONTADORES
+from ..services.statistics_service import StatisticsService
+from ..utils.cache_estadisticas import cache_estadisticas_backend
+
+
+def celdas():
+    return {
+        tuple(fila)
+        for fila in ResumenDiario.objects.values_list("dia", *CAMPOS_CELDA, *CONTADORES)
+    }
+
+
+def filterset(parametros):
+    datos = QueryDict(mutable=True)
+    datos.update(parametros)
+    filtro = PublicacionFilter(datos, queryset=Publicacion.objects.all())
+    filtro.is_valid()
+    return filtro
+
+
+class MantenimientoResumenDiarioTest(TestCase):
+    """
+    Las señales de Publicacion y RespuestaMunicipal mantienen el rollup igual
+    a una reconstrucción. Recalculan al confirmar: las escrituras van dentro
+    de captureOnCommitCallbacks(execute=True).
+    """
+
+    def setUp(self):
+        self.vecino = Usuario.objects.create(rut="22222222-2", email="vecino@muni.cl", nombre="Vecino")
+        self.depto = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.categoria = Categoria.objects.create(nombre="Baches", departamento=self.depto)
+        self.junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+        self.resuelto = SituacionPublicacion.objects.create(id=1, nombre="Resuelto")
+        self.fecha = timezone.now() - timedelta(days=5)
+
+    def publicacion(self, **datos):
+        return Publicacion.objects.create(
+            usuario=self.vecino, junta_vecinal=self.junta, departamento=self.depto, categoria=self.categoria,
+            titulo="Bache", latitud=0, longitud=0, fecha_publicacion=self.fecha, **datos,
+        )
+
+    def assertIgualAReconstruccion(self):
+        mantenidas = celdas()
+        ResumenDiarioService.reconstruir()
+        self.assertEqual(mantenidas, celdas())
+
+    def test_altas_cambios_y_bajas(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            primera = self.publicacion()
+            segunda = self.publicacion(prioridad="alta")
+            self.publicacion(situacion=None)
+        self.assertEqual(ResumenDiario.objects.count(), 3)
+        self.assertIgualAReconstruccion()
+
+        # Cambiar la prioridad mueve la publicación a la celda de la otra
+        with self.captureOnCommitCallbacks(execute=True):
+            primera.prioridad = "alta"
+            primera.save()
+        self.assertEqual(ResumenDiario.objects.get(prioridad="alta").publicaciones, 2)
+        self.assertIgualAReconstruccion()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            segunda.situacion = self.resuelto
+            segunda.save(update_fields=["situacion"])
+            primera.delete()
+        self.assertFalse(ResumenDiario.objects.filter(prioridad="alta", situacion_id=4).exists())
+        self.assertIgualAReconstruccion()
+
+    def test_recalcula_al_confirmar(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.publicacion()
+            self.publicacion(prioridad="alta")
+            # La transacción que escribe no toca el rollup...
+            self.assertFalse(ResumenDiario.objects.exists())
+        # ...y deja un solo recálculo con las celdas de todas sus escrituras
+        pendientes = [callback for callback in callbacks if isinstance(callback, RecalculoPendiente)]
+        self.assertEqual(len(pendientes), 1)
+        pendientes[0]()
+        self.assertEqual(ResumenDiario.objects.count(), 2)
+        self.assertIgualAReconstruccion()
+
+    def test_lectura_en_la_misma_transaccion(self):
+        self.publicacion()
+        # Las lecturas del rollup aplican antes las celdas pendientes
+        self.assertEqual(ResumenDiarioService.queryset_filtrado(filterset({})).get().publicaciones, 1)
+        self.assertIgualAReconstruccion()
+
+    def test_respuestas(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            publicacion = self.publicacion(situacion=self.resuelto)
+            respuesta = RespuestaMunicipal.objects.create(
+                usuario=self.vecino, publicacion=publicacion, fecha=self.fecha + timedelta(days=2),
+                descripcion="Reparado", acciones="Bacheo", situacion_inicial="Pendiente",
+                situacion_posterior="Resuelto", puntuacion=4,
+            )
+        celda = ResumenDiario.objects.get()
+        self.assertEqual(
+            [celda.con_respuesta, celda.dias_respuesta, celda.puntuacion_suma, celda.puntuacion_cantidad],
+            [1, 2, 4, 1],
+        )
+        self.assertIgualAReconstruccion()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            respuesta.delete()
+        self.assertEqual(ResumenDiario.objects.get().con_respuesta, 0)
+        self.assertIgualAReconstruccion()
+
+    def test_comando_reconstruye(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.publicacion()
+        esperadas = celdas()
+        ResumenDiario.objects.all().delete()
+        call_command("reconstruir_resumenes", stdout=StringIO())
+        self.assertEqual(celdas(), esperadas)
+
+
+class EstadisticasDesdeResumenTest(TestCase):
+    """Los conteos leídos del rollup coinciden con los de Publicacion."""
+
+    @classmethod
+    def setUpTestData(cls):
+        sembrar_municipio(publicaciones=300, semilla=5, lote=100)
+
+    def comparar(self, parametros):
+        filtro = filterset(parametros)
+        resumen = ResumenDiarioService.queryset_filtrado(filtro)
+        self.assertIs(resumen.model, ResumenDiario)
+        for metodo in (
+            StatisticsService.get_resumen_estadisticas,
+            StatisticsService.get_publicaciones_por_mes_categoria,
+            StatisticsService.get_resueltos_por_mes,
+            StatisticsService.get_tasa_resolucion_departamento,
+        ):
+            self.assertEqual(metodo(resumen), metodo(filtro.qs), metodo.__name__)
+        # El orden de los empates no está definido
+        clave = lambda fila: sorted(fila.items())
+        self.assertEqual(
+            sorted(StatisticsService.get_publicaciones_por_categoria(resumen), key=clave),
+            sorted(StatisticsService.get_publicaciones_por_categoria(filtro.qs), key=clave),
+        )
+        self.assertEqual(
+            [fila["total"] for fila in StatisticsService.get_publicaciones_por_junta_vecinal(resumen)],
+            [fila["total"] for fila in StatisticsService.get_publicaciones_por_junta_vecinal(filtro.qs)],
+        )
+
+    def test_sin_filtros(self):
+        self.comparar({})
+
+    def test_con_filtros(self):
+        hace_dos_meses = (timezone.localdate() - timedelta(days=60)).isoformat()
+        self.comparar({"departamento": "Obras,Salud", "situacion": "Pendiente,Resuelto"})
+        self.comparar({"fecha_publicacion_after": hace_dos_meses, "categoria_ids": "1,2,3"})
+
+    def test_filtros_sin_rollup(self):
+        self.assertIsNone(ResumenDiarioService.queryset_filtrado(filterset({"usuario_id": "1"})))
+        self.assertIsNone(ResumenDiarioService.queryset_filtrado(filterset({"con_respuesta": "true"})))
+
+
+class CacheEntreMarcaYRecalculoTest(TransactionTestCase):
+    """
+    Las marcas suben al confirmar antes que el recálculo del rollup: lo que
+    se cachee entre ambos no se sirve después.
+    """
+
+    def setUp(self):
+        cache_estadisticas_backend().clear()
+        self.vecino = Usuario.objects.create(rut="22222222-2", email="vecino@muni.cl", nombre="Vecino")
+        self.depto = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.categoria = Categoria.objects.create(nombre="Baches", departamento=self.depto)
+        self.junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+
+    def total(self):
+        resumen = ResumenDiarioService.queryset_filtrado(filterset({}))
+        return StatisticsService.get_resumen_estadisticas(resumen)["total_publicaciones"]
+
+    def test_lectura_entre_callbacks(self):
+        self.assertEqual(self.total(), 0)
+        recalcular = RecalculoPendiente.__call__
+        leidos = []
+
+        def leer_y_recalcular(pendiente):
+            leidos.append(self.total())
+            recalcular(pendiente)
+
+        with mock.patch.object(RecalculoPendiente, "__call__", leer_y_recalcular):
+            with transaction.atomic():
+                Publicacion.objects.create(
+                    usuario=self.vecino, junta_vecinal=self.junta, departamento=self.depto,
+                    categoria=self.categoria, titulo="Bache", latitud=0, longitud=0,
+                )
+        # Entre la marca de Publicacion y el recálculo el rollup sigue viejo...
+        self.assertEqual(leidos, [0])
+        # ...pero ese resultado no queda bajo la clave vigente
+        self.assertEqual(self.total(), 1)
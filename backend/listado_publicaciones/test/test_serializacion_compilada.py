@@ -0,0 +1,72 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from ..benchmarks.seed import sembrar_municipio
+from ..benchmarks.serializacion import casos_listados
+from ..models import (
+    Publicacion, Usuario, UsuarioDepartamento, HistorialModificaciones,
+    AnuncioMunicipal, RespuestaMunicipal
+)
+from ..serializers.compilado import serializar_compilado
+from ..serializers.v1 import (
+    PublicacionListSerializer,
+    UsuarioListSerializer,
+    HistorialModificacionesSerializer,
+    AnuncioMunicipalListSerializer,
+    RespuestaMunicipalListSerializer,
+)
+
+
+class SerializacionCompiladaTest(APITestCase):
+    """La serialización compilada debe producir exactamente el JSON de DRF."""
+
+    def setUp(self):
+        sembrar_municipio(publicaciones=40, semilla=3, lote=20)
+        # Casos borde: publicación sin situación y funcionario sin asignación
+        publicacion = Publicacion.objects.order_by("id").first()
+        publicacion.situacion = None
+        publicacion.save()
+        UsuarioDepartamento.objects.filter(usuario_id=publicacion.encargado_id).delete()
+
+        self.admin = Usuario.objects.get(es_administrador=True)
+        self.client.force_authenticate(user=self.admin)
+        self.renderer = JSONRenderer()
+
+    def assertJSONIgual(self, serializer_class, instancias):
+        instancias = list(instancias)
+        self.assertTrue(instancias)
+        esperado = self.renderer.render(serializer_class(instancias, many=True).data)
+        self.assertEqual(self.renderer.render(serializar_compilado(serializer_class, instancias)), esperado)
+
+    def test_listados_identicos_a_drf(self):
+        for nombre, serializer_class, queryset in casos_listados(filas=50):
+            with self.subTest(nombre):
+                self.assertJSONIgual(serializer_class, queryset)
+
+    def test_sin_precarga(self):
+        self.assertJSONIgual(PublicacionListSerializer, Publicacion.objects.order_by("id")[:5])
+        self.assertJSONIgual(UsuarioListSerializer, Usuario.objects.order_by("id"))
+        self.assertJSONIgual(HistorialModificacionesSerializer, HistorialModificaciones.objects.order_by("id")[:5])
+
+    def test_endpoints_list_usan_el_mismo_json(self):
+        casos = [
+            (
+                "/api/v1/publicaciones/?pagesize=20",
+                PublicacionListSerializer,
+                Publicacion.objects.order_by("-fecha_publicacion")[:20],
+            ),
+            (
+                "/api/v1/anuncios/?pagesize=20",
+                AnuncioMunicipalListSerializer,
+                AnuncioMunicipal.objects.order_by("-fecha")[:20],
+            ),
+            ("/api/v1/respuestas/", RespuestaMunicipalListSerializer, RespuestaMunicipal.objects.all()),
+        ]
+        for url, serializer_class, queryset in casos:
+            with self.subTest(url):
+                datos = self.client.get(url).data
+                if isinstance(datos, dict):
+                    datos = datos["results"]
+                self.assertEqual(
+                    self.renderer.render(datos),
+                    self.renderer.render(serializer_class(queryset, many=True).data),
+                )
@@ -0,0 +1,93 @@
+from datetime import date, datetime, timezone as dt_timezone
+from rest_framework.test import APITestCase
+from ..models import (
+    Usuario,
+    DepartamentoMunicipal,
+    Categoria,
+    JuntaVecinal,
+    SituacionPublicacion,
+    Publicacion,
+    ResumenDiario,
+)
+from ..services.statistics_service import StatisticsService
+from ..utils.cache_estadisticas import cache_estadisticas_backend
+from ..utils.series_tiempo import serie
+
+URL = "/api/v1/estadisticas/series/"
+
+
+class SeriesTiempoTest(APITestCase):
+    """Periodos con año, en hora de Santiago y sin huecos."""
+
+    def setUp(self):
+        cache_estadisticas_backend().clear()
+        self.admin = Usuario.objects.create(
+            rut="11111111-1", email="admin@muni.cl", nombre="Admin", tipo_usuario="administrador",
+            es_administrador=True,
+        )
+        self.depto = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.baches = Categoria.objects.create(nombre="Baches", departamento=self.depto)
+        self.luminarias = Categoria.objects.create(nombre="Luminarias", departamento=self.depto)
+        self.junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+        self.resuelto = SituacionPublicacion.objects.create(id=1, nombre="Resuelto")
+
+        # 1 de marzo 02:00 UTC es 28 de febrero a las 23:00 en Santiago.
+        # El rollup diario se recalcula al confirmar
+        with self.captureOnCommitCallbacks(execute=True):
+            self.publicar(datetime(2024, 3, 1, 2, tzinfo=dt_timezone.utc), self.baches)
+            self.publicar(datetime(2024, 3, 10, 15, tzinfo=dt_timezone.utc), self.luminarias, self.resuelto)
+            self.publicar(datetime(2025, 3, 10, 15, tzinfo=dt_timezone.utc), self.baches, self.resuelto)
+
+    def publicar(self, fecha, categoria, situacion=None):
+        datos = {"situacion": situacion} if situacion else {}
+        return Publicacion.objects.create(
+            usuario=self.admin, junta_vecinal=self.junta, departamento=self.depto, categoria=categoria,
+            titulo="Reclamo", latitud=0, longitud=0, fecha_publicacion=fecha, **datos,
+        )
+
+    def test_meses_con_anio_y_sin_huecos(self):
+        with self.assertNumQueries(1):
+            datos = serie(Publicacion.objects.all(), "mes", ["total", "resueltos"])
+        self.assertEqual(len(datos["periodos"]), 14)
+        self.assertEqual(datos["periodos"][:2], ["2024-02", "2024-03"])
+        self.assertEqual(datos["periodos"][-1], "2025-03")
+        self.assertEqual(datos["etiquetas"][-1], "Mar 2025")
+        self.assertEqual(datos["series"]["total"], [1, 1] + [0] * 11 + [1])
+        self.assertEqual(datos["series"]["resueltos"], [0, 1] + [0] * 11 + [1])
+        # El rollup diario da la misma serie
+        self.assertEqual(serie(ResumenDiario.objects.all(), "mes", ["total", "resueltos"]), datos)
+
+    def test_granularidades_y_grupos(self):
+        semanas = serie(Publicacion.objects.all(), "semana", desde=date(2024, 2, 26), hasta=date(2024, 3, 10))
+        self.assertEqual(semanas["periodos"], ["2024-W09", "2024-W10"])
+        self.assertEqual(semanas["series"]["total"], [1, 1])
+
+        trimestres = serie(Publicacion.objects.all(), "trimestre", agrupar_por="categoria")
+        self.assertEqual(trimestres["periodos"], ["2024-T1", "2024-T2", "2024-T3", "2024-T4", "2025-T1"])
+        self.assertEqual(trimestres["series"]["Baches"]["total"], [1, 0, 0, 0, 1])
+        self.assertEqual(trimestres["series"]["Luminarias"]["total"], [1, 0, 0, 0, 0])
+
+    def test_metodos_mensuales_separan_anios(self):
+        nombres = [fila["name"] for fila in StatisticsService.get_resueltos_por_mes()]
+        self.assertEqual(nombres[:2], ["Feb 2024", "Mar 2024"])
+        self.assertEqual(len(nombres), 14)
+        tasas = StatisticsService.get_tasa_resolucion_departamento()["Obras"]
+        self.assertEqual(tasas["Mar 2024"]["tasa_resolucion"], 100.0)
+        self.assertEqual(tasas["Mar 2025"]["resueltos"], 1)
+
+    def test_endpoint(self):
+        self.client.force_authenticate(user=self.admin)
+        datos = self.client.get(URL, {
+            "granularidad": "mes", "metricas": "total,resueltos",
+            "fecha_publicacion_after": "2024-01-01", "fecha_publicacion_before": "2024-04-30",
+        }).json()
+        self.assertEqual(datos["periodos"], ["2024-01", "2024-02", "2024-03", "2024-04"])
+        self.assertEqual(datos["series"]["total"], [0, 1, 1, 0])
+
+        response = self.client.get(URL, {"granularidad": "anio", "metricas": "total,vistas"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data), {"granularidad", "metricas"})
+        # Más de MAXIMO_PERIODOS días
+        response = self.client.get(URL, {"granularidad": "dia", "fecha_publicacion_after": "2020-01-01"})
+        self.assertEqual(response.status_code, 400)
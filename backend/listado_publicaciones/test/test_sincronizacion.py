@@ -0,0 +1,146 @@
+import base64
+import json
+import threading
+import unittest
+from datetime import timedelta
+from unittest import mock
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.test import APITransactionTestCase
+from ..models import (
+    Usuario, DepartamentoMunicipal, Categoria, JuntaVecinal, SituacionPublicacion,
+    Publicacion, Evidencia, RespuestaMunicipal
+)
+from ..serializers.v1 import PublicacionListSerializer
+
+URL = "/api/v1/sincronizacion/publicaciones/"
+
+
+class SincronizacionTest(APITransactionTestCase):
+    """
+    Cambios desde una marca: actualizados, eliminados y paginación por marca.
+    Cada escritura confirma por separado (en PostgreSQL la marca depende de
+    qué transacciones terminaron, y un TestCase las dejaría todas abiertas).
+    """
+
+    def setUp(self):
+        self.admin = Usuario.objects.create(
+            rut="11111111-1", email="admin@muni.cl", nombre="Admin",
+            es_administrador=True, tipo_usuario="administrador"
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.depto = DepartamentoMunicipal.objects.create(nombre="Obras")
+        self.categoria = Categoria.objects.create(nombre="Baches", departamento=self.depto)
+        self.junta = JuntaVecinal.objects.create(nombre_junta="Centro", latitud=0, longitud=0, numero_calle=1)
+        SituacionPublicacion.objects.create(id=4, nombre="Pendiente")
+        self.publicaciones = [self.crear_publicacion(f"Pub {i}") for i in range(3)]
+
+    def crear_publicacion(self, titulo):
+        return Publicacion.objects.create(
+            usuario=self.admin, junta_vecinal=self.junta, categoria=self.categoria,
+            departamento=self.depto, titulo=titulo, latitud=0, longitud=0,
+        )
+
+    def sincronizar(self, marca=None, **parametros):
+        if marca:
+            parametros["desde"] = marca
+        response = self.client.get(URL, parametros)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def ids(self, datos):
+        return [fila["id"] for fila in datos["actualizados"]]
+
+    def test_sincronizacion_inicial_paginada(self):
+        primera = self.sincronizar(limite=2)
+        self.assertTrue(primera["hay_mas"])
+        self.assertEqual(self.ids(primera), [p.id for p in self.publicaciones[:2]])
+        self.assertEqual(primera["eliminados"], [])
+
+        segunda = self.sincronizar(primera["marca"], limite=2)
+        self.assertFalse(segunda["hay_mas"])
+        self.assertEqual(self.ids(segunda), [self.publicaciones[2].id])
+
+        # Mismo formato que el listado
+        publicacion = PublicacionListSerializer.queryset_optimizado(
+            Publicacion.objects.filter(id=self.publicaciones[2].id)
+        ).get()
+        self.assertEqual(segunda["actualizados"][0], PublicacionListSerializer(publicacion).data)
+
+        self.assertEqual(self.sincronizar(segunda["marca"])["actualizados"], [])
+
+    def test_modificados_y_eliminados_desde_la_marca(self):
+        marca = self.sincronizar()["marca"]
+        modificada, eliminada, con_evidencia = self.publicaciones
+
+        modificada.titulo = "Pub modificada"
+        modificada.save()
+        eliminada_id = eliminada.id
+        eliminada.delete()
+        Evidencia.objects.create(publicacion=con_evidencia, archivo="evidencias/foto.jpg", extension="jpg")
+        nueva = self.crear_publicacion("Pub nueva")
+
+        datos = self.sincronizar(marca)
+        self.assertEqual(self.ids(datos), [modificada.id, con_evidencia.id, nueva.id])
+        self.assertEqual(datos["actualizados"][0]["titulo"], "Pub modificada")
+        self.assertEqual(len(datos["actualizados"][1]["evidencias"]), 1)
+        self.assertEqual(datos["eliminados"], [eliminada_id])
+
+        siguiente = self.sincronizar(datos["marca"])
+        self.assertEqual(siguiente["actualizados"], [])
+        self.assertEqual(siguiente["eliminados"], [])
+
+    def test_otros_recursos(self):
+        respuesta = RespuestaMunicipal.objects.create(
+            usuario=self.admin, publicacion=self.publicaciones[0], descripcion="Listo",
+            acciones="Reparación", situacion_inicial="Pendiente", situacion_posterior="Resuelto",
+        )
+        datos = self.client.get("/api/v1/sincronizacion/respuestas/").data
+        self.assertEqual(self.ids(datos), [respuesta.id])
+        self.assertEqual(self.client.get("/api/v1/sincronizacion/anuncios/").data["actualizados"], [])
+
+    def test_errores(self):
+        self.assertEqual(self.client.get(URL, {"desde": "no-es-una-marca"}).status_code, 400)
+        self.assertEqual(self.client.get(URL, {"limite": "x"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/sincronizacion/usuarios/").status_code, 404)
+
+    def test_fecha_modificacion_anterior_a_la_marca(self):
+        marca = self.sincronizar()["marca"]
+        # Guardada con un reloj atrasado (o confirmada mucho después de guardar)
+        with mock.patch("django.utils.timezone.now", return_value=timezone.now() - timedelta(hours=1)):
+            atrasada = self.crear_publicacion("Pub atrasada")
+        self.assertLess(atrasada.fecha_modificacion, self.publicaciones[-1].fecha_modificacion)
+        self.assertEqual(self.ids(self.sincronizar(marca)), [atrasada.id])
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "ids de transacción de PostgreSQL")
+    def test_transaccion_que_confirma_despues_de_la_marca(self):
+        marca = self.sincronizar()["marca"]
+        guardada, confirmar = threading.Event(), threading.Event()
+        creadas = []
+
+        def escribir():
+            try:
+                with transaction.atomic():
+                    creadas.append(self.crear_publicacion("Pub lenta"))
+                    guardada.set()
+                    confirmar.wait(10)
+            finally:
+                connection.close()
+
+        hilo = threading.Thread(target=escribir)
+        hilo.start()
+        guardada.wait(10)
+        # Todavía sin confirmar: no se ve, pero la marca no la deja atrás
+        datos = self.sincronizar(marca)
+        self.assertEqual(datos["actualizados"], [])
+        confirmar.set()
+        hilo.join()
+        self.assertEqual(self.ids(self.sincronizar(datos["marca"])), [creadas[0].id])
+
+    def test_marca_por_fecha_reenvia_todo(self):
+        eliminada_id = self.publicaciones[0].id
+        self.publicaciones[0].delete()
+        antigua = base64.urlsafe_b64encode(json.dumps({"f": timezone.now().isoformat()}).encode()).decode()
+        datos = self.sincronizar(antigua)
+        self.assertEqual(self.ids(datos), [p.id for p in self.publicaciones[1:]])
+        self.assertEqual(datos["eliminados"], [eliminada_id])
@@ -0,0 +1,89 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from ..benchmarks.seed import sembrar_municipio
+from ..models import Publicacion, TrabajoEstadistica, Usuario
+from ..services.dashboard_service import SECCIONES, BASE_PUBLICACIONES
+from ..services.trabajos_estadistica_service import TrabajoEstadisticaService, MAXIMO_INTENTOS
+
+URL = "/api/v1/estadisticas/trabajos/"
+SECCIONES_JUNTAS = ["criticidad", "eficiencia", "frio"]
+FILTROS = {"departamento": "Obras,Salud"}
+
+
+class TrabajosEstadisticaTest(APITestCase):
+    """Cola de trabajos en la base: encolar, procesar, consultar y reutilizar."""
+
+    def setUp(self):
+        sembrar_municipio(publicaciones=120, semilla=13, lote=60)
+        self.admin = Usuario.objects.filter(es_administrador=True).first()
+        self.client.force_authenticate(user=self.admin)
+
+    def encolar(self, secciones=SECCIONES_JUNTAS, filtros=FILTROS):
+        return self.client.post(URL, {"secciones": secciones, "filtros": filtros}, format="json")
+
+    def test_ciclo_completo_y_reutilizacion(self):
+        response = self.encolar()
+        self.assertEqual(response.status_code, 202)
+        trabajo_id = response.data["id"]
+        self.assertEqual(response.data["estado"], TrabajoEstadistica.PENDIENTE)
+        # Lo mismo mientras está pendiente no crea otro trabajo
+        self.assertEqual(self.encolar().data["id"], trabajo_id)
+
+        self.assertEqual(TrabajoEstadisticaService.atender(una_vez=True), 1)
+        datos = self.client.get(f"{URL}{trabajo_id}/").json()
+        self.assertEqual([datos["estado"], datos["progreso"], datos["intentos"]], ["completado", 100, 1])
+        dashboard = self.client.get(
+            "/api/v1/estadisticas/dashboard/", {**FILTROS, "secciones": ",".join(SECCIONES_JUNTAS)}
+        ).json()
+        self.assertEqual(datos["resultado"], dashboard["secciones"])
+
+        # Con los mismos datos se reutiliza el resultado; tras una escritura, no
+        response = self.encolar(filtros={"departamento": "Obras,Salud", "situacion": ""})
+        self.assertEqual([response.status_code, response.data["id"]], [200, trabajo_id])
+        publicacion = Publicacion.objects.first()
+        publicacion.titulo = "Otro título"
+        publicacion.save()
+        response = self.encolar()
+        self.assertEqual(response.status_code, 202)
+        self.assertNotEqual(response.data["id"], trabajo_id)
+
+    def test_validaciones(self):
+        response = self.encolar(secciones=["criticidad", "mapa"])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("mapa", response.data["secciones"])
+        self.assertEqual(self.encolar(filtros={"fecha_publicacion_after": "ayer"}).status_code, 400)
+        self.assertEqual(self.client.get(f"{URL}{TrabajoEstadistica().id}/").status_code, 404)
+
+        self.client.force_authenticate(user=Usuario.objects.filter(es_administrador=False).first())
+        self.assertEqual(self.encolar().status_code, 403)
+
+    def test_error_en_una_seccion(self):
+        def falla(queryset):
+            raise RuntimeError("sin conexión")
+
+        trabajo, _ = TrabajoEstadisticaService.encolar(self.admin, ["criticidad", "roto"], {})
+        with patch.dict(SECCIONES, {"roto": (BASE_PUBLICACIONES, falla)}), self.assertLogs(level="ERROR"):
+            TrabajoEstadisticaService.atender(una_vez=True)
+        trabajo.refresh_from_db()
+        self.assertEqual([trabajo.estado, trabajo.progreso, trabajo.error], ["error", 50, "sin conexión"])
+
+    def test_trabajos_abandonados(self):
+        hace_mucho = timezone.now() - timedelta(days=1)
+        reintentable, _ = TrabajoEstadisticaService.encolar(self.admin, ["resumen"], {})
+        agotado, _ = TrabajoEstadisticaService.encolar(self.admin, ["categorias"], {})
+        TrabajoEstadistica.objects.filter(id=reintentable.id).update(
+            estado=TrabajoEstadistica.EN_PROCESO, fecha_inicio=hace_mucho, intentos=1
+        )
+        TrabajoEstadistica.objects.filter(id=agotado.id).update(
+            estado=TrabajoEstadistica.EN_PROCESO, fecha_inicio=hace_mucho, intentos=MAXIMO_INTENTOS
+        )
+
+        call_command("procesar_trabajos_estadistica", procesos=1, una_vez=True, stdout=StringIO())
+        reintentable.refresh_from_db()
+        agotado.refresh_from_db()
+        self.assertEqual([reintentable.estado, reintentable.intentos], ["completado", 2])
+        self.assertEqual(agotado.estado, "error")
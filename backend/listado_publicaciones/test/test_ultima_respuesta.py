@@ -0,0 +1,113 @@
+import random
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from ..benchmarks.seed import sembrar_municipio
+from ..models import Publicacion, RespuestaMunicipal
+from ..services.statistics_service import StatisticsService
+from ..utils.dias_habiles import dias_habiles_entre
+
+
+def ultima_respuesta(publicacion):
+    """Como la subconsulta: la más reciente y, a igual fecha, la de menor id"""
+    respuestas = publicacion.respuestamunicipal_set.all()
+    return min(respuestas, key=lambda r: (-r.fecha.timestamp(), r.id)) if respuestas else None
+
+
+def frio_en_python(qs):
+    """Recorrido anterior (todas las respuestas precargadas), como referencia"""
+    # Por id: las categorías salen en orden de primera aparición
+    qs = qs.select_related("junta_vecinal", "situacion", "categoria").prefetch_related(
+        "respuestamunicipal_set"
+    ).order_by("id")
+    juntas_data = {}
+    for pub in qs:
+        d = juntas_data.setdefault(pub.junta_vecinal.id, {
+            "junta": pub.junta_vecinal, "total": 0, "resueltas": 0, "alta": 0, "dias": 0,
+            "suma": 0, "cantidad": 0, "ultima": None, "categorias": {},
+        })
+        d["total"] += 1
+        if pub.situacion_id != 4 and pub.situacion is not None:
+            d["resueltas"] += 1
+            d["categorias"][pub.categoria.nombre] = d["categorias"].get(pub.categoria.nombre, 0) + 1
+            if pub.prioridad == "alta":
+                d["alta"] += 1
+            ultima = ultima_respuesta(pub)
+            if ultima:
+                if d["ultima"] is None or ultima.fecha > d["ultima"]:
+                    d["ultima"] = ultima.fecha
+                # Días locales, como el plazo legal
+                dias = (timezone.localdate(ultima.fecha) - timezone.localdate(pub.fecha_publicacion)).days
+                if dias >= 0:
+                    d["dias"] += dias
+                if ultima.puntuacion > 0:
+                    d["suma"] += ultima.puntuacion
+                    d["cantidad"] += 1
+    return juntas_data
+
+
+def en_plazo_en_python(qs):
+    """Resueltas dentro del plazo legal por junta, con la última respuesta de cada una"""
+    juntas, inicios, fines = [], [], []
+    for pub in qs.prefetch_related("respuestamunicipal_set"):
+        ultima = ultima_respuesta(pub)
+        if pub.situacion_id not in (4, None) and ultima:
+            juntas.append(pub.junta_vecinal_id)
+            inicios.append(pub.fecha_publicacion)
+            fines.append(ultima.fecha)
+    en_plazo = {}
+    for junta_id, dias in zip(juntas, dias_habiles_entre(inicios, fines)):
+        en_plazo[junta_id] = en_plazo.get(junta_id, 0) + (dias <= settings.PLAZO_LEGAL_DIAS)
+    return en_plazo
+
+
+class UltimaRespuestaTest(TestCase):
+    """Frío y eficiencia con la última respuesta como subconsulta."""
+
+    def setUp(self):
+        sembrar_municipio(publicaciones=300, semilla=23, lote=100)
+        # Varias respuestas por publicación, alguna anterior a la publicación
+        rng = random.Random(23)
+        respuestas = []
+        for respuesta in RespuestaMunicipal.objects.order_by("id")[:60]:
+            respuesta.pk = None
+            respuesta.fecha = respuesta.fecha + timedelta(days=rng.randint(-40, 40))
+            respuesta.puntuacion = rng.randint(0, 5)
+            respuestas.append(respuesta)
+        RespuestaMunicipal.objects.bulk_create(respuestas)
+
+    def test_frio_igual_al_recorrido(self):
+        referencia = frio_en_python(Publicacion.objects.all())
+        resultado = StatisticsService.get_analisis_frio_juntas()
+        self.assertEqual(len(resultado), len(referencia))
+        por_nombre = {fila["Junta_Vecinal"]["nombre"]: fila for fila in resultado}
+        for d in referencia.values():
+            fila = por_nombre[d["junta"].nombre_junta]
+            self.assertEqual(fila["Junta_Vecinal"]["total_resueltas"], d["resueltas"])
+            self.assertEqual(fila["Junta_Vecinal"]["casos_alta_prioridad_resueltos"], d["alta"])
+            self.assertEqual(fila["Junta_Vecinal"]["total_valoraciones"], d["cantidad"])
+            promedio = d["suma"] / d["cantidad"] if d["cantidad"] else 0
+            self.assertEqual(fila["Junta_Vecinal"]["calificacion_promedio"], round(promedio, 1))
+            tiempo = d["dias"] // d["resueltas"] if d["resueltas"] else 0
+            self.assertEqual(fila["tiempo_promedio_resolucion"], f"{tiempo} días")
+            self.assertEqual(fila["ultima_resolucion"], d["ultima"].isoformat() if d["ultima"] else None)
+            categorias = [(clave, valor) for clave, valor in fila.items() if clave in d["categorias"]]
+            self.assertEqual(categorias, list(d["categorias"].items()))
+
+    def test_eficiencia_igual_al_recorrido(self):
+        en_plazo = en_plazo_en_python(Publicacion.objects.all())
+        self.assertTrue(any(en_plazo.values()))
+        for fila in StatisticsService.get_analisis_eficiencia_juntas():
+            self.assertEqual(fila["metricas"]["resueltas_en_plazo_legal"], en_plazo.get(fila["junta"]["id"], 0))
+
+    def test_consultas_no_dependen_de_respuestas(self):
+        with CaptureQueriesContext(connection) as consultas:
+            StatisticsService.get_analisis_frio_juntas()
+            StatisticsService.get_analisis_eficiencia_juntas()
+        total_consultas = len(consultas)
+        # Frío: conteos, juntas, categorías. Eficiencia: conteos, juntas, pares de fechas.
+        # Más las marcas que consulta el cache de estadísticas en cada método
+        self.assertEqual(total_consultas, 8)
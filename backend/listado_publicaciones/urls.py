@@ -38,6 +38,12 @@ from .views.estadisticas import (
     estadisticas_respuestas,
     estadisticas_gestion_datos,
     estadisticas_historial_modificaciones,
+    dashboard_estadisticas,
+    estadisticas_cache,
+    serie_temporal,
+    distribucion_tiempos_atencion,
+    crear_trabajo_estadistica,
+    detalle_trabajo_estadistica,
 )
 from .views.reportes import export_to_excel, generate_pdf_report
 from .views.kanban import (
@@ -52,6 +58,7 @@ from .views.notificaciones import (
     desactivar_dispositivo,
     mis_dispositivos,
 )
+from .views.sincronizacion import cambios
 from rest_framework_simplejwt.views import TokenRefreshView
 
 # Configuración del router
@@ -139,6 +146,36 @@ urlpatterns = [
         publicaciones_resueltas_por_junta_vecinal,
         name="resueltas_junta",
     ),
+    path(
+        "v1/estadisticas/distribucion-tiempos/",
+        distribucion_tiempos_atencion,
+        name="distribucion_tiempos",
+    ),
+    path(
+        "v1/estadisticas/dashboard/",
+        dashboard_estadisticas,
+        name="dashboard_estadisticas",
+    ),
+    path(
+        "v1/estadisticas/series/",
+        serie_temporal,
+        name="serie_temporal",
+    ),
+    path(
+        "v1/estadisticas/trabajos/",
+        crear_trabajo_estadistica,
+        name="crear_trabajo_estadistica",
+    ),
+    path(
+        "v1/estadisticas/trabajos/<uuid:trabajo_id>/",
+        detalle_trabajo_estadistica,
+        name="detalle_trabajo_estadistica",
+    ),
+    path(
+        "v1/estadisticas/cache/",
+        estadisticas_cache,
+        name="estadisticas_cache",
+    ),
     path(
         "v1/estadisticas/departamentos/",
         estadisticas_departamentos,
@@ -183,4 +220,6 @@ urlpatterns = [
         mis_dispositivos,
         name="mis_dispositivos",
     ),
+    # Sincronización incremental (app móvil)
+    path("v1/sincronizacion/<str:recurso>/", cambios, name="sincronizacion_cambios"),
 ]
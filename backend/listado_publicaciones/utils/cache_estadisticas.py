@@ -0,0 +1,184 @@
+"""
+Cache de resultados de StatisticsService (decorador @cache_estadisticas).
+
+La clave lleva el método, sus argumentos normalizados (un queryset se reduce
+a su SQL con parámetros, la forma canónica de los filtros aplicados; un
+modelo a su pk), el día local, porque los plazos vencidos dependen de la
+fecha, y las marcas de MarcaCambio de TABLAS_ESTADISTICAS. Las señales
+post_save/post_delete de esas tablas incrementan su marca (signals.py): una
+escritura deja inalcanzables las entradas anteriores, que expiran por TTL.
+ResumenDiario no tiene señales: su marca la incrementa ResumenDiarioService
+al reescribir celdas.
+
+El backend es el alias "estadisticas" de settings.CACHES (memoria local,
+archivos o Redis según ESTADISTICAS_CACHE_URL). Los aciertos y fallos por
+método se cuentan en el mismo backend, así que con uno compartido suman los
+de todos los procesos.
+"""
+import hashlib
+import json
+from functools import wraps
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+from ..models import (
+    Publicacion,
+    RespuestaMunicipal,
+    EvidenciaRespuesta,
+    HistorialModificaciones,
+    Categoria,
+    SituacionPublicacion,
+    JuntaVecinal,
+    DepartamentoMunicipal,
+    UsuarioDepartamento,
+    Usuario,
+    Tablero,
+    Columna,
+    Tarea,
+    ResumenDiario,
+    MarcaCambio,
+)
+
+ALIAS_CACHE_ESTADISTICAS = "estadisticas"
+PREFIJO = "estadisticas"
+
+TABLAS_ESTADISTICAS = (
+    Publicacion,
+    RespuestaMunicipal,
+    EvidenciaRespuesta,
+    HistorialModificaciones,
+    Categoria,
+    SituacionPublicacion,
+    JuntaVecinal,
+    DepartamentoMunicipal,
+    UsuarioDepartamento,
+    Usuario,
+    Tablero,
+    Columna,
+    Tarea,
+    ResumenDiario,
+)
+
+# Nombres de los métodos decorados, para informar sus contadores
+METODOS_CACHEADOS = []
+
+# Distingue "no está en cache" de un resultado None guardado
+_AUSENTE = object()
+
+
+def cache_estadisticas_backend():
+    return caches[ALIAS_CACHE_ESTADISTICAS]
+
+
+def _normalizar(valor):
+    if isinstance(valor, QuerySet):
+        try:
+            sql, parametros = valor.query.sql_with_params()
+        except EmptyResultSet:
+            # queryset.none() o un filtro que no puede tener filas
+            return [valor.model._meta.label_lower, None]
+        return [valor.model._meta.label_lower, sql, [str(parametro) for parametro in parametros]]
+    if isinstance(valor, Model):
+        return [valor._meta.label_lower, valor.pk]
+    return valor
+
+
+def version_datos():
+    """Hash de las marcas de TABLAS_ESTADISTICAS y del día local: cambia con cada escritura"""
+    marcas = MarcaCambio.marcas(TABLAS_ESTADISTICAS)
+    versiones = [
+        f"{tabla}:{version}-{fecha.timestamp()}" for tabla, (version, fecha) in sorted(marcas.items())
+    ]
+    firma = json.dumps([timezone.localdate().isoformat(), versiones])
+    return hashlib.md5(firma.encode()).hexdigest()
+
+
+def _clave(metodo, args, kwargs):
+    firma = json.dumps(
+        [
+            [_normalizar(arg) for arg in args],
+            sorted((nombre, _normalizar(valor)) for nombre, valor in kwargs.items()),
+            version_datos(),
+        ],
+        default=str,
+    )
+    return f"{PREFIJO}:{metodo}:{hashlib.md5(firma.encode()).hexdigest()}"
+
+
+def _clave_contador(metodo, tipo):
+    return f"{PREFIJO}:contador:{tipo}:{metodo}"
+
+
+def _contar(metodo, tipo):
+    cache = cache_estadisticas_backend()
+    clave = _clave_contador(metodo, tipo)
+    cache.add(clave, 0, timeout=None)
+    try:
+        cache.incr(clave)
+    except ValueError:
+        # Se eliminó entre add e incr
+        cache.set(clave, 1, timeout=None)
+
+
+def cache_estadisticas(funcion):
+    """Guarda el resultado de un método de StatisticsService en el cache de estadísticas"""
+    metodo = funcion.__name__
+    METODOS_CACHEADOS.append(metodo)
+
+    @wraps(funcion)
+    def envoltura(*args, **kwargs):
+        cache = cache_estadisticas_backend()
+        clave = _clave(metodo, args, kwargs)
+        resultado = cache.get(clave, _AUSENTE)
+        if resultado is not _AUSENTE:
+            _contar(metodo, "aciertos")
+            return resultado
+
+        _contar(metodo, "fallos")
+        resultado = funcion(*args, **kwargs)
+        if isinstance(resultado, QuerySet):
+            # Se guarda evaluado: un queryset cacheado volvería a consultar
+            resultado = list(resultado)
+        cache.set(clave, resultado)
+        return resultado
+
+    return envoltura
+
+
+def contadores_cache():
+    """{"metodos": {metodo: {aciertos, fallos, tasa_aciertos}}, "totales": {...}}"""
+    claves = {
+        (metodo, tipo): _clave_contador(metodo, tipo)
+        for metodo in METODOS_CACHEADOS
+        for tipo in ("aciertos", "fallos")
+    }
+    valores = cache_estadisticas_backend().get_many(claves.values())
+
+    def resumen(aciertos, fallos):
+        total = aciertos + fallos
+        return {
+            "aciertos": aciertos,
+            "fallos": fallos,
+            "tasa_aciertos": round(aciertos / total * 100, 2) if total else 0,
+        }
+
+    metodos = {
+        metodo: resumen(
+            valores.get(claves[(metodo, "aciertos")], 0), valores.get(claves[(metodo, "fallos")], 0)
+        )
+        for metodo in METODOS_CACHEADOS
+    }
+    return {
+        "metodos": metodos,
+        "totales": resumen(
+            sum(datos["aciertos"] for datos in metodos.values()),
+            sum(datos["fallos"] for datos in metodos.values()),
+        ),
+    }
+
+
+def reiniciar_contadores_cache():
+    cache_estadisticas_backend().delete_many(
+        [_clave_contador(metodo, tipo) for metodo in METODOS_CACHEADOS for tipo in ("aciertos", "fallos")]
+    )
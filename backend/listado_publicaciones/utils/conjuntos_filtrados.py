@@ -0,0 +1,99 @@
+"""
+Conjunto de ids de publicaciones que cumplen un PublicacionFilter, compartido
+entre los endpoints de /estadisticas/*.
+
+Un dashboard llama a unos diez endpoints con los mismos filtros: el primero
+evalúa el predicado y guarda los ids en el cache "estadisticas" (compartido
+entre procesos, ver utils/cache_estadisticas.py); los demás filtran por
+`id IN (...)` sin volver a resolver nombres ni relaciones. La clave lleva los
+filtros normalizados (valores ya validados por el form) y las marcas de
+MarcaCambio de todas las tablas que los filtros leen, incluidas las de los
+filtros de existencia, así que un alta o un cambio genera una clave nueva.
+"""
+import hashlib
+import json
+from ..models import (
+    Publicacion,
+    RespuestaMunicipal,
+    Evidencia,
+    HistorialModificaciones,
+    Tarea,
+    Categoria,
+    DepartamentoMunicipal,
+    JuntaVecinal,
+    SituacionPublicacion,
+    MarcaCambio,
+)
+from .cache_estadisticas import cache_estadisticas_backend
+
+TIEMPO_CACHE_CONJUNTOS = 60
+# Sobre este tamaño la lista IN no le gana al predicado (que ya usa índices)
+MAXIMO_IDS_CONJUNTO = 5000
+# Marca en cache para conjuntos que superan el máximo
+DEMASIADOS_IDS = "demasiados"
+
+# Publicacion, las tablas de PublicacionFilter.RELACIONES_EXISTENCIA (la de
+# tareas por su marca, que también cambia al asociar publicaciones) y las de
+# referencia que se resuelven por nombre
+TABLAS_CONJUNTOS = (
+    Publicacion,
+    RespuestaMunicipal,
+    Evidencia,
+    HistorialModificaciones,
+    Tarea,
+    Categoria,
+    DepartamentoMunicipal,
+    JuntaVecinal,
+    SituacionPublicacion,
+)
+
+
+def _valor_normalizado(valor):
+    if isinstance(valor, slice):
+        return [_valor_normalizado(valor.start), _valor_normalizado(valor.stop)]
+    if hasattr(valor, "isoformat"):
+        return valor.isoformat()
+    return valor if valor is None or isinstance(valor, (bool, int, float)) else str(valor)
+
+
+def filtros_normalizados(filterset):
+    """[(filtro, valor)] activos y ordenados de un filterset ya validado"""
+    activos = []
+    for nombre, valor in sorted(filterset.form.cleaned_data.items()):
+        if valor in (None, "", [], ()) or (isinstance(valor, slice) and valor.start is None and valor.stop is None):
+            continue
+        activos.append((nombre, _valor_normalizado(valor)))
+    return activos
+
+
+def _clave(filtros):
+    marcas = MarcaCambio.marcas(TABLAS_CONJUNTOS)
+    versiones = [
+        f"{tabla}:{version}-{fecha.timestamp()}" for tabla, (version, fecha) in sorted(marcas.items())
+    ]
+    firma = json.dumps([filtros, versiones], sort_keys=True, default=str)
+    return f"conjunto_publicaciones:{hashlib.md5(firma.encode()).hexdigest()}"
+
+
+def queryset_filtrado(filterset):
+    """
+    Publicaciones que cumplen `filterset` (validado), reutilizando el conjunto
+    de ids en cache. Sin filtros activos o con conjuntos muy grandes se
+    devuelve el queryset del filtro tal cual.
+    """
+    filtros = filtros_normalizados(filterset)
+    if not filtros:
+        return filterset.qs
+
+    cache = cache_estadisticas_backend()
+    clave = _clave(filtros)
+    ids = cache.get(clave)
+    if ids is None:
+        ids = list(filterset.qs.order_by().values_list("id", flat=True)[: MAXIMO_IDS_CONJUNTO + 1])
+        if len(ids) > MAXIMO_IDS_CONJUNTO:
+            ids = DEMASIADOS_IDS
+        cache.set(clave, ids, TIEMPO_CACHE_CONJUNTOS)
+
+    if ids == DEMASIADOS_IDS:
+        return filterset.qs
+    return Publicacion.objects.filter(id__in=ids)
@@ -0,0 +1,231 @@
+"""
+Días hábiles con calendario de feriados de Chile.
+
+El plazo legal (settings.PLAZO_LEGAL_DIAS) se cuenta en días hábiles desde el
+día siguiente a la publicación: lunes a viernes, sin feriados. Los conteos se
+hacen para arreglos completos de fechas con numpy.busday_count sobre un
+busdaycalendar que se construye una vez por rango de años (lru_cache).
+
+Publicacion guarda el último día del plazo en fecha_vencimiento_legal
+(vencimientos_legales); está vencida cuando ese día es anterior a
+corte_vencimiento(), el último hábil hasta hoy. Sin ese día (una fila aún no
+recalculada), cuando fecha_publicacion es anterior a limite_plazo_vencido().
+
+Los feriados nacionales se calculan por regla (fijos, Semana Santa, traslados
+de la Ley 19.668, etc.). Los extraordinarios (elecciones, interferiados) se
+agregan en settings.FERIADOS_ADICIONALES como fechas "AAAA-MM-DD".
+"""
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+FERIADOS_FIJOS = [
+    (1, 1),    # Año Nuevo
+    (5, 1),    # Día del Trabajo
+    (5, 21),   # Glorias Navales
+    (7, 16),   # Virgen del Carmen
+    (8, 15),   # Asunción de la Virgen
+    (9, 18),   # Independencia
+    (9, 19),   # Glorias del Ejército
+    (11, 1),   # Todos los Santos
+    (12, 8),   # Inmaculada Concepción
+    (12, 25),  # Navidad
+]
+
+# Día de los Pueblos Indígenas (solsticio de invierno): 21 de junio salvo estos años
+SOLSTICIO_20_JUNIO = {2024, 2025, 2028, 2029, 2032, 2033}
+
+
+def _domingo_de_pascua(anio):
+    """Algoritmo anónimo gregoriano (Meeus/Jones/Butcher)"""
+    a = anio % 19
+    b, c = divmod(anio, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    mes, dia = divmod(h + l - 7 * m + 114, 31)
+    return date(anio, mes, dia + 1)
+
+
+def _trasladar_a_lunes(fecha):
+    """Ley 19.668: martes a jueves -> lunes anterior; viernes -> lunes siguiente"""
+    dia_semana = fecha.weekday()
+    if dia_semana in (1, 2, 3):
+        return fecha - timedelta(days=dia_semana)
+    if dia_semana == 4:
+        return fecha + timedelta(days=3)
+    return fecha
+
+
+@lru_cache(maxsize=None)
+def feriados_del_anio(anio):
+    """Feriados nacionales de `anio` (sin los adicionales de settings)"""
+    feriados = {date(anio, mes, dia) for mes, dia in FERIADOS_FIJOS}
+
+    pascua = _domingo_de_pascua(anio)
+    feriados.add(pascua - timedelta(days=2))  # Viernes Santo
+    feriados.add(pascua - timedelta(days=1))  # Sábado Santo
+
+    if anio >= 2021:
+        feriados.add(date(anio, 6, 20 if anio in SOLSTICIO_20_JUNIO else 21))
+
+    feriados.add(_trasladar_a_lunes(date(anio, 6, 29)))   # San Pedro y San Pablo
+    feriados.add(_trasladar_a_lunes(date(anio, 10, 12)))  # Encuentro de Dos Mundos
+
+    # Fiestas Patrias: el 17 si cae lunes y el 20 si cae viernes
+    if date(anio, 9, 17).weekday() == 0:
+        feriados.add(date(anio, 9, 17))
+    if date(anio, 9, 20).weekday() == 4:
+        feriados.add(date(anio, 9, 20))
+
+    # Iglesias Evangélicas: martes -> viernes anterior; miércoles -> viernes siguiente
+    reforma = date(anio, 10, 31)
+    if reforma.weekday() == 1:
+        reforma -= timedelta(days=4)
+    elif reforma.weekday() == 2:
+        reforma += timedelta(days=2)
+    feriados.add(reforma)
+
+    return sorted(feriados)
+
+
+def feriados_adicionales():
+    return tuple(getattr(settings, "FERIADOS_ADICIONALES", ()))
+
+
+@lru_cache(maxsize=32)
+def _calendario(anio_desde, anio_hasta, adicionales):
+    feriados = [fecha for anio in range(anio_desde, anio_hasta + 1) for fecha in feriados_del_anio(anio)]
+    feriados.extend(date.fromisoformat(fecha) for fecha in adicionales)
+    return np.busdaycalendar(weekmask="1111100", holidays=np.array(feriados, dtype="datetime64[D]"))
+
+
+def calendario(anio_desde, anio_hasta):
+    """busdaycalendar de Chile que cubre los años indicados"""
+    return _calendario(anio_desde, anio_hasta, feriados_adicionales())
+
+
+def _a_dia(fecha):
+    if isinstance(fecha, datetime):
+        return fecha.date() if timezone.is_naive(fecha) else timezone.localdate(fecha)
+    return fecha
+
+
+def a_dias(fechas):
+    """
+    Arreglo datetime64[D] con la fecha local (America/Santiago) de cada valor.
+    Una fecha suelta da un escalar, que numpy extiende al resto de los arreglos.
+    """
+    if isinstance(fechas, np.ndarray):
+        return fechas.astype("datetime64[D]")
+    if isinstance(fechas, date):
+        return np.datetime64(_a_dia(fechas), "D")
+    return np.array([_a_dia(fecha) for fecha in fechas], dtype="datetime64[D]")
+
+
+def _rango_anios(*arreglos):
+    anios = np.concatenate([np.ravel(arreglo.astype("datetime64[Y]").astype(int)) + 1970 for arreglo in arreglos])
+    return int(anios.min()), int(anios.max())
+
+
+def dias_habiles_entre(inicios, fines):
+    """
+    Días hábiles transcurridos entre cada par (inicio, fin], uno por posición.
+    Acepta listas de date/datetime, arreglos datetime64[D] o una fecha suelta.
+    """
+    inicios, fines = a_dias(inicios), a_dias(fines)
+    if np.size(inicios) == 0 or np.size(fines) == 0:
+        return np.zeros(0, dtype=int)
+    un_dia = np.timedelta64(1, "D")
+    return np.busday_count(
+        inicios + un_dia, fines + un_dia, busdaycal=calendario(*_rango_anios(inicios, fines))
+    )
+
+
+def sumar_dias_habiles(inicios, dias):
+    """
+    Fecha en que se cumplen `dias` hábiles contados desde el día siguiente a
+    cada inicio (un inicio no hábil equivale al hábil anterior).
+    """
+    inicios = a_dias(inicios)
+    if np.size(inicios) == 0:
+        return inicios
+    anio_desde, anio_hasta = _rango_anios(inicios)
+    # Holgura para plazos que cruzan el cambio de año
+    holgura = dias // 200 + 1
+    return np.busday_offset(
+        inicios, dias, roll="backward", busdaycal=calendario(anio_desde, anio_hasta + holgura)
+    )
+
+
+def vencimientos_legales(fechas, dias=None):
+    """
+    Último día hábil del plazo legal (`dias`, por defecto PLAZO_LEGAL_DIAS) de
+    cada fecha de publicación, como lista de date.
+    """
+    dias = settings.PLAZO_LEGAL_DIAS if dias is None else dias
+    return sumar_dias_habiles(list(fechas), dias).tolist()
+
+
+def corte_vencimiento(ahora=None):
+    """
+    Último día hábil hasta hoy. Un plazo que terminó antes ya tuvo un hábil
+    de más: fecha_vencimiento_legal < corte equivale a
+    dias_habiles_entre(fecha_publicacion, ahora) > PLAZO_LEGAL_DIAS.
+    """
+    hoy = timezone.localdate(ahora)
+    corte = np.busday_offset(
+        np.datetime64(hoy, "D"), 0, roll="backward", busdaycal=calendario(hoy.year - 1, hoy.year)
+    )
+    return corte.astype(date)
+
+
+def limite_plazo_vencido(dias=None, ahora=None):
+    """
+    Instante antes del cual una publicación ya superó `dias` hábiles (por
+    defecto PLAZO_LEGAL_DIAS) a la fecha de `ahora`: fecha_publicacion < límite
+    equivale a fecha_vencimiento_legal < corte_vencimiento(ahora).
+    """
+    dias = settings.PLAZO_LEGAL_DIAS if dias is None else dias
+    hoy = timezone.localdate(ahora)
+    # Más de `dias` hábiles en (fecha, hoy] <=> fecha anterior al hábil número dias + 1 hacia atrás
+    corte = np.busday_offset(
+        np.datetime64(hoy, "D"), -dias, roll="backward",
+        busdaycal=calendario(hoy.year - dias // 200 - 1, hoy.year),
+    )
+    return timezone.make_aware(datetime.combine(corte.astype(date), time.min))
+
+
+def actualizar_vencimientos(modelo, solo_faltantes=False, tamano_lote=2000):
+    """
+    Recalcula fecha_vencimiento_legal por lotes de id y escribe solo las que
+    cambian; retorna cuántas. `modelo` es Publicacion (ver el comando
+    recalcular_vencimientos).
+    """
+    queryset = modelo.objects.order_by("id")
+    if solo_faltantes:
+        queryset = queryset.filter(fecha_vencimiento_legal__isnull=True)
+    actualizadas, ultimo_id = 0, 0
+    while True:
+        filas = list(
+            queryset.filter(id__gt=ultimo_id).values_list("id", "fecha_publicacion", "fecha_vencimiento_legal")[
+                :tamano_lote
+            ]
+        )
+        if not filas:
+            return actualizadas
+        ultimo_id = filas[-1][0]
+        vencimientos = vencimientos_legales(fecha for _, fecha, _ in filas)
+        cambios = [
+            modelo(id=publicacion_id, fecha_vencimiento_legal=vencimiento)
+            for (publicacion_id, _, actual), vencimiento in zip(filas, vencimientos)
+            if actual != vencimiento
+        ]
+        modelo.objects.bulk_update(cambios, ["fecha_vencimiento_legal"])
+        actualizadas += len(cambios)
@@ -0,0 +1,97 @@
+"""
+Distribución de tiempos de atención (/estadisticas/distribucion-tiempos/).
+
+La base entrega una fila compacta por publicación con respuesta: el id del
+grupo y los segundos hasta la primera respuesta y hasta la resolución,
+calculados en SQL (SegundosEntre). Con eso se arman arreglos de numpy: los
+percentiles salen de np.percentile por grupo (interpolación lineal, igual
+que percentile_cont de PostgreSQL) y los histogramas de todos los grupos de
+un solo np.bincount. Nunca se instancian publicaciones.
+"""
+import numpy as np
+from django.db.models import FloatField, Func
+from ..models import Categoria, DepartamentoMunicipal, JuntaVecinal
+
+# Agrupación -> (campo con el id del grupo, modelo del grupo, campo del nombre)
+AGRUPACIONES = {
+    "departamento": ("departamento_id", DepartamentoMunicipal, "nombre"),
+    "categoria": ("categoria_id", Categoria, "nombre"),
+    "junta_vecinal": ("junta_vecinal_id", JuntaVecinal, "nombre_junta"),
+}
+
+PERCENTILES = (50, 75, 90, 99)
+
+# Bordes de los tramos del histograma, en días; el último tramo es abierto
+LIMITES_HISTOGRAMA_DIAS = (0, 1, 2, 3, 5, 10, 15, 20, 30, 60, 90)
+
+SEGUNDOS_POR_DIA = 86400
+
+
+class SegundosEntre(Func):
+    """Segundos de `inicio` a `fin` (dos DateTimeField) como número, sin timedelta"""
+
+    template = "EXTRACT(EPOCH FROM (%(expressions)s))"
+    arg_joiner = " - "
+    output_field = FloatField()
+
+    def __init__(self, fin, inicio, **extra):
+        super().__init__(fin, inicio, **extra)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        julianos = self.copy()
+        julianos.set_source_expressions(
+            [Func(expresion, function="JULIANDAY") for expresion in self.get_source_expressions()]
+        )
+        return super(SegundosEntre, julianos).as_sql(
+            compiler, connection, template="((%(expressions)s) * 86400.0)", **extra_context
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        invertido = self.copy()
+        invertido.set_source_expressions(self.get_source_expressions()[::-1])
+        return super(SegundosEntre, invertido).as_sql(
+            compiler, connection, template="(TIMESTAMPDIFF(MICROSECOND, %(expressions)s) / 1000000.0)",
+            arg_joiner=", ", **extra_context,
+        )
+
+
+def etiquetas_histograma():
+    limites = LIMITES_HISTOGRAMA_DIAS
+    return [f"{desde}-{hasta}" for desde, hasta in zip(limites, limites[1:])] + [f"{limites[-1]}+"]
+
+
+def _resumen(dias, histograma):
+    if dias.size == 0:
+        return {"cantidad": 0, "promedio": None, **{f"p{p}": None for p in PERCENTILES}, "histograma": histograma}
+    valores = np.percentile(dias, PERCENTILES)
+    return {
+        "cantidad": int(dias.size),
+        "promedio": round(float(dias.mean()), 2),
+        **{f"p{p}": round(float(valor), 2) for p, valor in zip(PERCENTILES, valores)},
+        "histograma": histograma,
+    }
+
+
+def resumir(grupos, segundos, cantidad_grupos):
+    """
+    Percentiles e histograma en días por grupo y del total. `grupos` son
+    índices 0..cantidad_grupos-1 y `segundos` las duraciones (NaN = sin dato).
+    Retorna (resúmenes por grupo, resumen total).
+    """
+    validos = ~np.isnan(segundos) & (segundos >= 0)
+    grupos, dias = grupos[validos], segundos[validos] / SEGUNDOS_POR_DIA
+
+    tramos = len(LIMITES_HISTOGRAMA_DIAS)
+    tramo = np.searchsorted(LIMITES_HISTOGRAMA_DIAS, dias, side="right") - 1
+    histogramas = np.bincount(grupos * tramos + tramo, minlength=cantidad_grupos * tramos).reshape(
+        cantidad_grupos, tramos
+    )
+
+    orden = np.argsort(grupos, kind="stable")
+    cortes = np.searchsorted(grupos[orden], np.arange(cantidad_grupos + 1))
+    dias_ordenados = dias[orden]
+    por_grupo = [
+        _resumen(dias_ordenados[cortes[indice]:cortes[indice + 1]], histogramas[indice].tolist())
+        for indice in range(cantidad_grupos)
+    ]
+    return por_grupo, _resumen(dias, histogramas.sum(axis=0).tolist())
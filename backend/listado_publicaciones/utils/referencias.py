@@ -0,0 +1,66 @@
+"""
+Mapa id -> nombre de las tablas de referencia (juntas, departamentos,
+categorías, situaciones) para que los filtros por nombre resuelvan ids una
+vez y filtren por la FK indexada con IN, en vez de JOIN + ILIKE por fila.
+
+El mapa se guarda en el cache de Django con la marca (versión y fecha) de
+MarcaCambio de la tabla en la clave: cualquier alta, cambio o baja genera una
+clave nueva en todos los procesos, y leer las marcas es una sola consulta
+indexada.
+"""
+from django.core.cache import cache
+from ..models import JuntaVecinal, DepartamentoMunicipal, Categoria, SituacionPublicacion, MarcaCambio
+
+# clave -> (modelo, campo con el nombre)
+TABLAS_REFERENCIA = {
+    "junta_vecinal": (JuntaVecinal, "nombre_junta"),
+    "departamento": (DepartamentoMunicipal, "nombre"),
+    "categoria": (Categoria, "nombre"),
+    "situacion": (SituacionPublicacion, "nombre"),
+}
+
+TIEMPO_CACHE_REFERENCIAS = 60 * 60
+
+
+class MapaReferencias:
+    """Una instancia por request: las versiones se leen una sola vez."""
+
+    def __init__(self):
+        self._versiones = None
+        self._nombres = {}
+
+    def _version(self, clave):
+        if self._versiones is None:
+            self._versiones = MarcaCambio.marcas(modelo for modelo, _ in TABLAS_REFERENCIA.values())
+        modelo, _ = TABLAS_REFERENCIA[clave]
+        marca = self._versiones.get(MarcaCambio.tabla_de(modelo))
+        if marca is None:
+            return "0"
+        # La fecha distingue una versión reutilizada tras un rollback
+        version, fecha = marca
+        return f"{version}-{fecha.timestamp()}"
+
+    def nombres(self, clave):
+        """[(id, nombre en minúsculas)] de la tabla"""
+        if clave not in self._nombres:
+            modelo, campo = TABLAS_REFERENCIA[clave]
+            clave_cache = f"referencias:{MarcaCambio.tabla_de(modelo)}:{self._version(clave)}"
+            nombres = cache.get(clave_cache)
+            if nombres is None:
+                # Un nombre NULL nunca coincide con __icontains
+                nombres = [
+                    (pk, nombre.lower())
+                    for pk, nombre in modelo.objects.values_list("pk", campo)
+                    if nombre is not None
+                ]
+                cache.set(clave_cache, nombres, TIEMPO_CACHE_REFERENCIAS)
+            self._nombres[clave] = nombres
+        return self._nombres[clave]
+
+    def ids_por_nombre(self, clave, valor):
+        """
+        Ids cuyo nombre contiene alguno de los textos de `valor` (separados por
+        coma), con la misma semántica que el OR de `__icontains` que reemplaza.
+        """
+        textos = [texto.lower() for texto in valor.split(",")]
+        return [pk for pk, nombre in self.nombres(clave) if any(texto in nombre for texto in textos)]
@@ -0,0 +1,195 @@
+"""
+Series de tiempo de publicaciones por día, semana, mes o trimestre.
+
+Los periodos se truncan en la zona de settings.TIME_ZONE (America/Santiago)
+dentro de la misma consulta que agrupa y cuenta: una serie es un solo
+recorrido de la base, sin importar el largo del rango. Las claves llevan el
+año ("2025-03-14", "2025-W11", "2025-03", "2025-T1"), así que dos años no se
+juntan en doce meses, y los periodos sin publicaciones se rellenan con ceros.
+
+El resultado es columnar: la lista de periodos y, por métrica, un arreglo del
+mismo largo. Acepta querysets de Publicacion o del rollup diario
+(ResumenDiario), que suma `publicaciones` en vez de contar filas.
+"""
+from datetime import date, timedelta
+from zoneinfo import ZoneInfo
+from django.conf import settings
+from django.db.models import Count, Q, Sum, DateField, DateTimeField
+from django.db.models.functions import Coalesce, Trunc
+from ..models import ResumenDiario
+from .constants import MESES_ESPANOL
+
+# Granularidad -> kind de Trunc
+GRANULARIDADES = {"dia": "day", "semana": "week", "mes": "month", "trimestre": "quarter"}
+
+# Métrica -> filtro del conteo (None cuenta todo)
+METRICAS = {
+    "total": None,
+    "recibidos": Q(situacion__nombre="Recibido"),
+    "pendientes": Q(situacion__nombre="Pendiente"),
+    "en_curso": Q(situacion__nombre="En curso"),
+    "resueltos": Q(situacion__nombre="Resuelto"),
+}
+
+# Agrupación -> campo con el nombre del grupo
+AGRUPACIONES = {
+    "categoria": "categoria__nombre",
+    "departamento": "departamento__nombre",
+    "junta_vecinal": "junta_vecinal__nombre_junta",
+    "situacion": "situacion__nombre",
+}
+
+SIN_GRUPO = "Sin asignar"
+
+# Tope de periodos rellenados (unos tres años por día)
+MAXIMO_PERIODOS = 1100
+
+
+def conteo(queryset, filtro=None):
+    if queryset.model is ResumenDiario:
+        return Coalesce(Sum("publicaciones", filter=filtro), 0)
+    return Count("id", filter=filtro)
+
+
+def campo_fecha(queryset):
+    return "dia" if queryset.model is ResumenDiario else "fecha_publicacion"
+
+
+def truncar(queryset, granularidad):
+    """Inicio del periodo (date) de cada fila, en la zona horaria local"""
+    campo = campo_fecha(queryset)
+    if isinstance(queryset.model._meta.get_field(campo), DateTimeField):
+        return Trunc(
+            campo, GRANULARIDADES[granularidad], output_field=DateField(), tzinfo=ZoneInfo(settings.TIME_ZONE)
+        )
+    return Trunc(campo, GRANULARIDADES[granularidad], output_field=DateField())
+
+
+def errores_parametros(granularidad, metricas, agrupar_por=None):
+    """{parámetro: mensaje} de los valores desconocidos"""
+    errores = {}
+    if granularidad not in GRANULARIDADES:
+        errores["granularidad"] = f"Debe ser una de: {', '.join(GRANULARIDADES)}"
+    desconocidas = [metrica for metrica in metricas if metrica not in METRICAS]
+    if desconocidas or not metricas:
+        errores["metricas"] = f"Métricas disponibles: {', '.join(METRICAS)}"
+    if agrupar_por is not None and agrupar_por not in AGRUPACIONES:
+        errores["agrupar_por"] = f"Debe ser una de: {', '.join(AGRUPACIONES)}"
+    return errores
+
+
+def _sumar_meses(fecha, meses):
+    indice = fecha.year * 12 + fecha.month - 1 + meses
+    return date(indice // 12, indice % 12 + 1, 1)
+
+
+def inicio_periodo(fecha, granularidad):
+    if granularidad == "semana":
+        return fecha - timedelta(days=fecha.weekday())
+    if granularidad == "mes":
+        return fecha.replace(day=1)
+    if granularidad == "trimestre":
+        return date(fecha.year, (fecha.month - 1) // 3 * 3 + 1, 1)
+    return fecha
+
+
+def siguiente_periodo(inicio, granularidad):
+    if granularidad == "semana":
+        return inicio + timedelta(days=7)
+    if granularidad == "mes":
+        return _sumar_meses(inicio, 1)
+    if granularidad == "trimestre":
+        return _sumar_meses(inicio, 3)
+    return inicio + timedelta(days=1)
+
+
+def periodos(desde, hasta, granularidad):
+    """Inicios de todos los periodos entre `desde` y `hasta`, ambos incluidos"""
+    inicio, fin = inicio_periodo(desde, granularidad), inicio_periodo(hasta, granularidad)
+    resultado = []
+    while inicio <= fin:
+        if len(resultado) == MAXIMO_PERIODOS:
+            raise ValueError(
+                f"El rango tiene más de {MAXIMO_PERIODOS} periodos; use una granularidad mayor o acote las fechas"
+            )
+        resultado.append(inicio)
+        inicio = siguiente_periodo(inicio, granularidad)
+    return resultado
+
+
+def clave_periodo(inicio, granularidad):
+    if granularidad == "semana":
+        anio, semana, _ = inicio.isocalendar()
+        return f"{anio}-W{semana:02d}"
+    if granularidad == "mes":
+        return f"{inicio.year}-{inicio.month:02d}"
+    if granularidad == "trimestre":
+        return f"{inicio.year}-T{(inicio.month - 1) // 3 + 1}"
+    return inicio.isoformat()
+
+
+def etiqueta_periodo(inicio, granularidad):
+    if granularidad == "semana":
+        anio, semana, _ = inicio.isocalendar()
+        return f"Sem {semana} {anio}"
+    if granularidad == "mes":
+        return f"{MESES_ESPANOL[inicio.month]} {inicio.year}"
+    if granularidad == "trimestre":
+        return f"T{(inicio.month - 1) // 3 + 1} {inicio.year}"
+    return f"{inicio.day} {MESES_ESPANOL[inicio.month]} {inicio.year}"
+
+
+def serie(queryset, granularidad="mes", metricas=("total",), agrupar_por=None, desde=None, hasta=None):
+    """
+    {"granularidad", "periodos", "etiquetas", "series"} con una consulta.
+
+    `series` es {métrica: [valor por periodo]}, o {grupo: {métrica: [...]}}
+    con `agrupar_por`. El rango va de `desde` a `hasta` (date); sin ellos, del
+    primer al último periodo con publicaciones.
+    """
+    campo = campo_fecha(queryset)
+    if isinstance(queryset.model._meta.get_field(campo), DateTimeField):
+        campo = f"{campo}__date"
+    if desde is not None:
+        queryset = queryset.filter(**{f"{campo}__gte": desde})
+    if hasta is not None:
+        queryset = queryset.filter(**{f"{campo}__lte": hasta})
+
+    campo_grupo = AGRUPACIONES[agrupar_por] if agrupar_por else None
+    filas = list(
+        queryset.annotate(periodo=truncar(queryset, granularidad))
+        .values("periodo", *([campo_grupo] if campo_grupo else []))
+        .annotate(**{metrica: conteo(queryset, METRICAS[metrica]) for metrica in metricas})
+        .order_by()
+    )
+
+    fechas = [fila["periodo"] for fila in filas if fila["periodo"] is not None]
+    desde = desde or (min(fechas) if fechas else None)
+    hasta = hasta or (max(fechas) if fechas else None)
+    inicios = periodos(desde, hasta, granularidad) if desde and hasta else []
+    posiciones = {inicio: posicion for posicion, inicio in enumerate(inicios)}
+
+    def columnas():
+        return {metrica: [0] * len(inicios) for metrica in metricas}
+
+    series = {} if campo_grupo else columnas()
+    for fila in filas:
+        posicion = posiciones.get(fila["periodo"])
+        if posicion is None:
+            continue
+        if campo_grupo:
+            grupo = fila[campo_grupo] if fila[campo_grupo] is not None else SIN_GRUPO
+            destino = series.setdefault(grupo, columnas())
+        else:
+            destino = series
+        for metrica in metricas:
+            destino[metrica][posicion] += fila[metrica]
+
+    if campo_grupo:
+        series = dict(sorted(series.items()))
+    return {
+        "granularidad": granularidad,
+        "periodos": [clave_periodo(inicio, granularidad) for inicio in inicios],
+        "etiquetas": [etiqueta_periodo(inicio, granularidad) for inicio in inicios],
+        "series": series,
+    }
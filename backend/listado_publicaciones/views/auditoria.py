@@ -4,7 +4,7 @@ from ..serializers.v1 import (
     HistorialModificacionesSerializer,
     AuditoriaSerializer,
 )
-from ..pagination import DynamicPageNumberPagination
+from ..pagination import DynamicPageNumberPagination, CursorOpcionalPagination
 from listado_publicaciones.permissions import IsAdmin, IsMunicipalStaff
 import logging
 
@@ -109,6 +109,9 @@ class HistorialModificacionesViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = HistorialModificaciones.objects.all().order_by("-fecha")
     serializer_class = HistorialModificacionesSerializer
     permission_classes = [IsAdmin | IsMunicipalStaff]
+    # Sin parámetros sigue respondiendo la lista completa; ?paginacion=cursor pagina por (fecha, id)
+    pagination_class = CursorOpcionalPagination
+    keyset_campo = "fecha"
 
     def get_queryset(self):
         queryset = HistorialModificaciones.objects.all().order_by("-fecha")
@@ -120,7 +123,7 @@ class HistorialModificacionesViewSet(viewsets.ReadOnlyModelViewSet):
         if autor_id is not None:
             queryset = queryset.filter(autor_id=autor_id)
 
-        return queryset
+        return HistorialModificacionesSerializer.queryset_optimizado(queryset)
 
 
 class AuditoriaViewSet(viewsets.ReadOnlyModelViewSet):
@@ -130,6 +133,7 @@ class AuditoriaViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = AuditoriaSerializer
     permission_classes = [IsAdmin]
     pagination_class = DynamicPageNumberPagination
+    keyset_campo = "fecha"
 
     def get_queryset(self):
         queryset = Auditoria.objects.all().order_by("-fecha")
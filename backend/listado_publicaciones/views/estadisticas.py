@@ -2,16 +2,36 @@ from rest_framework.decorators import api_view, permission_classes
 from listado_publicaciones.permissions import IsAdmin, IsAuthenticatedOrAdmin
 from rest_framework.response import Response
 from rest_framework import status
+from django.db import transaction
+from django.shortcuts import get_object_or_404
 from ..services.statistics_service import StatisticsService
+from ..services.resumen_diario_service import ResumenDiarioService
+from ..services.dashboard_service import DashboardService, SECCIONES
+from ..services.trabajos_estadistica_service import TrabajoEstadisticaService
 from ..filters import PublicacionFilter
-from ..models import Publicacion
-
-# Helper para no repetir código de filtrado
+from ..models import Publicacion, TrabajoEstadistica
+from ..serializers.v1 import TrabajoEstadisticaSerializer
+from ..utils.conjuntos_filtrados import queryset_filtrado
+from ..utils import distribucion_tiempos, series_tiempo
+from ..utils.cache_estadisticas import contadores_cache, reiniciar_contadores_cache, cache_estadisticas_backend
+
+# Helper para no repetir código de filtrado. El conjunto filtrado se comparte
+# entre endpoints con los mismos filtros (utils/conjuntos_filtrados.py)
 def get_filtered_queryset(request):
     filterset = PublicacionFilter(request.GET, queryset=Publicacion.objects.all())
     if not filterset.is_valid():
         return None, filterset.errors
-    return filterset.qs, None
+    return queryset_filtrado(filterset), None
+
+
+# Para los endpoints que solo cuentan publicaciones: el rollup diario con los
+# mismos filtros, o las publicaciones si hay filtros que el rollup no tiene
+def get_resumen_queryset(request):
+    filterset = PublicacionFilter(request.GET, queryset=Publicacion.objects.all())
+    if not filterset.is_valid():
+        return None, filterset.errors
+    resumen = ResumenDiarioService.queryset_filtrado(filterset)
+    return (queryset_filtrado(filterset) if resumen is None else resumen), None
 
 @api_view(["GET"])
 @permission_classes([IsAdmin])
@@ -20,7 +40,7 @@ def ResumenEstadisticas(request):
     Retorna estadísticas generales.
     CORRECCIÓN: Ahora aplica filtros globales (fecha, departamento, etc.)
     """
-    qs, errors = get_filtered_queryset(request)
+    qs, errors = get_resumen_queryset(request)
     if errors: return Response(errors, status=400)
     
     data = StatisticsService.get_resumen_estadisticas(qs)
@@ -34,7 +54,7 @@ def PublicacionesPorMesyCategoria(request):
     Retorna publicaciones por mes y categoría.
     CORRECCIÓN: Ahora respeta el rango de fechas seleccionado.
     """
-    qs, errors = get_filtered_queryset(request)
+    qs, errors = get_resumen_queryset(request)
     if errors: return Response(errors, status=400)
 
     data = StatisticsService.get_publicaciones_por_mes_categoria(qs)
@@ -48,7 +68,7 @@ def PublicacionesPorCategoria(request):
     Retorna total por categoría.
     CORRECCIÓN: Ahora permite filtrar por zona o fecha.
     """
-    qs, errors = get_filtered_queryset(request)
+    qs, errors = get_resumen_queryset(request)
     if errors: return Response(errors, status=400)
 
     data = StatisticsService.get_publicaciones_por_categoria(qs)
@@ -61,10 +81,9 @@ def ResueltosPorMes(request):
     """
     Retorna la cantidad de publicaciones resueltas vs recibidas por mes.
     """
-    filterset = PublicacionFilter(request.GET, queryset=Publicacion.objects.all())
-    if not filterset.is_valid():
-        return Response(filterset.errors, status=400)
-    data = StatisticsService.get_resueltos_por_mes(filterset.qs)
+    qs, errors = get_resumen_queryset(request)
+    if errors: return Response(errors, status=400)
+    data = StatisticsService.get_resueltos_por_mes(qs)
     return Response(data)
 
 
@@ -77,12 +96,11 @@ def TasaResolucionDepartamento(request):
     """
 
     # 1. Aplicar filtros
-    filterset = PublicacionFilter(request.GET, queryset=Publicacion.objects.all())
-    if not filterset.is_valid():
-        return Response(filterset.errors, status=400)
+    qs, errors = get_resumen_queryset(request)
+    if errors: return Response(errors, status=400)
 
     # 2. Llamar al servicio corregido pasando el QS filtrado
-    data = StatisticsService.get_tasa_resolucion_departamento(filterset.qs)
+    data = StatisticsService.get_tasa_resolucion_departamento(qs)
     
     return Response(data)
 
@@ -94,12 +112,11 @@ def PublicacionesPorJuntaVecinalAPIView(request):
     Retorna datos completos de las juntas incluyendo índice de criticidad y mapa de calor.
     """
     # 1. Aplicar filtros
-    filterset = PublicacionFilter(request.GET, queryset=Publicacion.objects.all())
-    if not filterset.is_valid():
-        return Response(filterset.errors, status=400)
+    qs, errors = get_filtered_queryset(request)
+    if errors: return Response(errors, status=400)
 
     # 2. Usar el nuevo método con lógica completa
-    data = StatisticsService.get_analisis_criticidad_juntas(filterset.qs)
+    data = StatisticsService.get_analisis_criticidad_juntas(qs)
     return Response(data)
 
 
@@ -110,13 +127,12 @@ def junta_mas_critica(request):
     Identifica la junta más crítica usando la lógica completa y formato compatible con Main.
     """
     # 1. Filtros
-    filterset = PublicacionFilter(request.GET, queryset=Publicacion.objects.all())
-    if not filterset.is_valid():
-        return Response(filterset.errors, status=400)
+    qs, errors = get_filtered_queryset(request)
+    if errors: return Response(errors, status=400)
     
     # 2. Llamar al nuevo WRAPPER
     # Esto devuelve { "total_juntas...", "junta_mas_critica": { "junta":..., "metricas":... } }
-    data = StatisticsService.get_estadisticas_criticidad_completa(filterset.qs)
+    data = StatisticsService.get_estadisticas_criticidad_completa(qs)
     
     return Response(data)
 
@@ -128,12 +144,11 @@ def publicaciones_resueltas_por_junta_vecinal(request):
     Retorna métricas de eficiencia y satisfacción (Mapa de Frío).
     """
     # 1. Aplicar filtros
-    filterset = PublicacionFilter(request.GET, queryset=Publicacion.objects.all())
-    if not filterset.is_valid():
-        return Response(filterset.errors, status=400)
+    qs, errors = get_filtered_queryset(request)
+    if errors: return Response(errors, status=400)
 
     # 2. Usar el nuevo método con lógica completa
-    data = StatisticsService.get_analisis_frio_juntas(filterset.qs)
+    data = StatisticsService.get_analisis_frio_juntas(qs)
     return Response(data)
 
 
@@ -144,21 +159,157 @@ def junta_mas_eficiente(request):
     Identifica la junta vecinal con mayor tasa de resolución considerando plazos legales.
     """
     # 1. Aplicar filtros igual que en el código original
-    publicaciones = Publicacion.objects.all()
-    filterset = PublicacionFilter(request.GET, queryset=publicaciones)
+    qs, errors = get_filtered_queryset(request)
 
-    if not filterset.is_valid():
+    if errors:
         return Response(
-            {"error": "Filtros inválidos", "detalles": filterset.errors},
+            {"error": "Filtros inválidos", "detalles": errors},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
     # 2. Llamar al servicio pasando el QuerySet filtrado
-    stats = StatisticsService.get_estadisticas_eficiencia_completa(filterset.qs)
+    stats = StatisticsService.get_estadisticas_eficiencia_completa(qs)
     
     return Response(stats, status=status.HTTP_200_OK)
 
 
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def distribucion_tiempos_atencion(request):
+    """
+    Percentiles (p50, p75, p90, p99) e histograma del tiempo hasta la primera
+    respuesta y hasta la resolución, en días, con ?agrupar_por=departamento|
+    categoria|junta_vecinal (departamento por defecto) y los filtros de siempre.
+    """
+    qs, errors = get_filtered_queryset(request)
+    if errors: return Response(errors, status=400)
+
+    agrupar_por = request.query_params.get("agrupar_por", "departamento")
+    if agrupar_por not in distribucion_tiempos.AGRUPACIONES:
+        return Response(
+            {"agrupar_por": f"Debe ser una de: {', '.join(distribucion_tiempos.AGRUPACIONES)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return Response(StatisticsService.get_distribucion_tiempos(qs, agrupar_por=agrupar_por))
+
+
+# Sin ATOMIC_REQUESTS: las secciones se calculan en hilos con sus propias conexiones
+@transaction.non_atomic_requests
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def dashboard_estadisticas(request):
+    """
+    Dashboard completo en una llamada: ?secciones=resumen,criticidad,... (todas
+    por defecto) con los mismos filtros que los demás endpoints. Retorna los
+    datos de cada sección y el tiempo que tomó.
+    """
+    filterset = PublicacionFilter(request.GET, queryset=Publicacion.objects.all())
+    if not filterset.is_valid():
+        return Response(filterset.errors, status=400)
+
+    secciones = [s.strip() for s in request.query_params.get("secciones", "").split(",") if s.strip()]
+    desconocidas = DashboardService.secciones_desconocidas(secciones)
+    if desconocidas:
+        return Response(
+            {"secciones": f"Secciones desconocidas: {', '.join(desconocidas)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return Response(DashboardService.calcular(filterset, secciones))
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def serie_temporal(request):
+    """
+    Serie de tiempo columnar: ?granularidad=dia|semana|mes|trimestre,
+    ?metricas=total,resueltos,... y ?agrupar_por=categoria|departamento|...
+    con los filtros de siempre. El rango de fecha_publicacion, si viene,
+    fija el primer y último periodo.
+    """
+    filterset = PublicacionFilter(request.GET, queryset=Publicacion.objects.all())
+    if not filterset.is_valid():
+        return Response(filterset.errors, status=400)
+
+    granularidad = request.query_params.get("granularidad", "mes")
+    metricas = [m.strip() for m in request.query_params.get("metricas", "total").split(",") if m.strip()]
+    agrupar_por = request.query_params.get("agrupar_por") or None
+    errores = series_tiempo.errores_parametros(granularidad, metricas, agrupar_por)
+    if errores:
+        return Response(errores, status=status.HTTP_400_BAD_REQUEST)
+
+    rango = filterset.form.cleaned_data.get("fecha_publicacion")
+    resumen = ResumenDiarioService.queryset_filtrado(filterset)
+    try:
+        data = StatisticsService.get_serie_temporal(
+            queryset_filtrado(filterset) if resumen is None else resumen,
+            granularidad=granularidad,
+            metricas=metricas,
+            agrupar_por=agrupar_por,
+            desde=rango.start.date() if rango and rango.start else None,
+            hasta=rango.stop.date() if rango and rango.stop else None,
+        )
+    except ValueError as error:
+        return Response({"granularidad": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(data)
+
+
+@api_view(["POST"])
+@permission_classes([IsAdmin])
+def crear_trabajo_estadistica(request):
+    """
+    Encola el cálculo de secciones del dashboard fuera del request:
+    {"secciones": [...] (todas por defecto), "filtros": {parámetros de PublicacionFilter}}.
+    202 con el trabajo nuevo o uno igual en curso; 200 si ya hay un resultado
+    vigente. El progreso y el resultado se consultan en /trabajos/<id>/.
+    """
+    secciones = request.data.get("secciones") or list(SECCIONES)
+    if isinstance(secciones, str):
+        secciones = [s.strip() for s in secciones.split(",") if s.strip()]
+    if not isinstance(secciones, list) or not all(isinstance(s, str) for s in secciones):
+        return Response({"secciones": "Debe ser una lista de nombres de sección"}, status=400)
+    secciones = list(dict.fromkeys(secciones))
+    desconocidas = DashboardService.secciones_desconocidas(secciones)
+    if desconocidas:
+        return Response(
+            {"secciones": f"Secciones desconocidas: {', '.join(desconocidas)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    filtros = request.data.get("filtros") or {}
+    if not isinstance(filtros, dict):
+        return Response({"filtros": "Debe ser un objeto con los parámetros de filtrado"}, status=400)
+    filtros = {str(nombre): str(valor) for nombre, valor in filtros.items() if valor not in (None, "")}
+    filterset = TrabajoEstadisticaService.filterset(filtros)
+    if not filterset.is_valid():
+        return Response(filterset.errors, status=400)
+
+    trabajo, _ = TrabajoEstadisticaService.encolar(request.user, secciones, filtros)
+    codigo = status.HTTP_200_OK if trabajo.estado == TrabajoEstadistica.COMPLETADO else status.HTTP_202_ACCEPTED
+    return Response(TrabajoEstadisticaSerializer(trabajo).data, status=codigo)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def detalle_trabajo_estadistica(request, trabajo_id):
+    """Estado, progreso (0-100) y, al completarse, resultado de un trabajo"""
+    trabajo = get_object_or_404(TrabajoEstadistica, id=trabajo_id)
+    return Response(TrabajoEstadisticaSerializer(trabajo).data)
+
+
+@api_view(["GET", "DELETE"])
+@permission_classes([IsAdmin])
+def estadisticas_cache(request):
+    """
+    Aciertos y fallos del cache de StatisticsService por método (GET) o
+    reinicio de los contadores (DELETE).
+    """
+    if request.method == "DELETE":
+        reiniciar_contadores_cache()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+    return Response({"backend": type(cache_estadisticas_backend()).__name__, **contadores_cache()})
+
+
 @api_view(["GET"])
 @permission_classes([IsAdmin])
 def estadisticas_departamentos(request):
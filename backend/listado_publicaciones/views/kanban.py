@@ -25,6 +25,8 @@ class TableroViewSet(viewsets.ModelViewSet):
         if departamento_id is not None:
             queryset = queryset.filter(departamento_id=departamento_id)
 
+        if self.action in ["list", "retrieve"]:
+            queryset = TableroSerializer.queryset_optimizado(queryset)
         return queryset
 
 
@@ -42,6 +44,8 @@ class ColumnaViewSet(viewsets.ModelViewSet):
         if tablero_id is not None:
             queryset = queryset.filter(tablero_id=tablero_id)
 
+        if self.action in ["list", "retrieve"]:
+            queryset = ColumnaSerializer.queryset_optimizado(queryset)
         return queryset
 
 
@@ -69,6 +73,8 @@ class TareaViewSet(viewsets.ModelViewSet):
         if categoria_id is not None:
             queryset = queryset.filter(categoria_id=categoria_id)
 
+        if self.action in ["list", "retrieve"]:
+            queryset = TareaListSerializer.queryset_optimizado(queryset)
         return queryset
 
     @action(detail=True, methods=["post"])
@@ -115,6 +121,8 @@ class ComentarioViewSet(viewsets.ModelViewSet):
         if usuario_id is not None:
             queryset = queryset.filter(usuario_id=usuario_id)
 
+        if self.action in ["list", "retrieve"]:
+            queryset = ComentarioSerializer.queryset_optimizado(queryset)
         return queryset
 
     def perform_create(self, serializer):
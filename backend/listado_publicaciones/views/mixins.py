@@ -0,0 +1,106 @@
+import hashlib
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+from ..models import MarcaCambio
+from ..serializers.compilado import serializar_compilado
+
+
+class ListadoCompiladoMixin:
+    """
+    Usa la serialización compilada (serializers/compilado.py) en la acción list.
+
+    El JSON es idéntico al de DRF; si la vista pide campos dinámicos
+    (?fields=), que dependen de cada request, se usa el camino normal.
+    """
+
+    listado_compilado = True
+
+    def usar_listado_compilado(self):
+        if not self.listado_compilado:
+            return False
+        get_campos = getattr(self, "get_campos_solicitados", None)
+        return get_campos is None or get_campos() is None
+
+    def list(self, request, *args, **kwargs):
+        if not self.usar_listado_compilado():
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer_class = self.get_serializer_class()
+        contexto = self.get_serializer_context()
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                serializar_compilado(serializer_class, page, contexto)
+            )
+        return Response(serializar_compilado(serializer_class, queryset, contexto))
+
+
+class ListadoCondicionalMixin:
+    """
+    GET condicional (ETag / Last-Modified) para la acción list.
+
+    Los validadores salen de las marcas de agua de las tablas que aparecen en
+    el listado (MarcaCambio, una consulta indexada), no del cuerpo: con
+    If-None-Match / If-Modified-Since vigentes se responde 304 sin consultar
+    ni serializar. `tablas_condicionales` lista los modelos de los que depende
+    la representación (por defecto, solo el del queryset).
+    """
+
+    tablas_condicionales = None
+
+    def get_tablas_condicionales(self):
+        return self.tablas_condicionales or (self.queryset.model,)
+
+    def validadores_condicionales(self, request):
+        modelos = self.get_tablas_condicionales()
+        marcas = MarcaCambio.marcas(modelos)
+        tablas = sorted(MarcaCambio.tabla_de(modelo) for modelo in modelos)
+
+        # El listado depende de los datos, de la URL (filtros, página) y del usuario
+        firma = "|".join(
+            [
+                type(self).__name__,
+                request.get_full_path(),
+                str(getattr(request.user, "pk", None)),
+                request.META.get("HTTP_ACCEPT", ""),
+            ]
+            + [f"{tabla}:{self._version(marcas.get(tabla))}" for tabla in tablas]
+        )
+        etag = f'W/"{hashlib.md5(firma.encode()).hexdigest()}"'
+        fechas = [fecha for _, fecha in marcas.values()]
+        ultima_modificacion = int(max(fechas).timestamp()) if fechas else None
+        return etag, ultima_modificacion
+
+    @staticmethod
+    def _version(marca):
+        # La fecha distingue la versión que ve una transacción con cambios
+        # pendientes de la misma versión confirmada por otra
+        if marca is None:
+            return "0"
+        version, fecha = marca
+        return f"{version}-{fecha.timestamp()}"
+
+    def _agregar_validadores(self, response, etag, ultima_modificacion):
+        response["ETag"] = etag
+        if ultima_modificacion is not None:
+            response["Last-Modified"] = http_date(ultima_modificacion)
+        # El cliente debe revalidar siempre; la respuesta depende del token
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Authorization", "Accept"))
+        return response
+
+    def list(self, request, *args, **kwargs):
+        etag, ultima_modificacion = self.validadores_condicionales(request)
+        no_modificado = get_conditional_response(
+            request, etag=etag, last_modified=ultima_modificacion
+        )
+        if no_modificado is not None:
+            return self._agregar_validadores(no_modificado, etag, ultima_modificacion)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            self._agregar_validadores(response, etag, ultima_modificacion)
+        return response
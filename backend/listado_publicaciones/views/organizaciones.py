@@ -7,6 +7,7 @@ from ..models import (
     RespuestaMunicipal,
     EvidenciaRespuesta,
     Usuario,
+    Publicacion,
 )
 from ..serializers.v1 import (
     CategoriaSerializer,
@@ -30,6 +31,7 @@ from ..permissions import (
     IsMunicipalStaff,
 )
 from .auditoria import AuditMixin
+from .mixins import ListadoCompiladoMixin, ListadoCondicionalMixin
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.decorators import action
@@ -41,8 +43,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-class CategoriasViewSet(AuditMixin, viewsets.ModelViewSet):
+class CategoriasViewSet(ListadoCondicionalMixin, AuditMixin, viewsets.ModelViewSet):
     queryset = Categoria.objects.all().order_by("-fecha_creacion")
+    # cantidad_publicaciones depende de Publicacion
+    tablas_condicionales = (Categoria, DepartamentoMunicipal, Publicacion)
 
     def get_permissions(self):
         if self.action in ["list", "retrieve"]:
@@ -103,7 +107,7 @@ class UsuarioDepartamentoViewSet(viewsets.ModelViewSet):
         return queryset
 
 
-class JuntasVecinalesViewSet(AuditMixin, viewsets.ModelViewSet):
+class JuntasVecinalesViewSet(ListadoCondicionalMixin, AuditMixin, viewsets.ModelViewSet):
     queryset = JuntaVecinal.objects.all()
     serializer_class = JuntaVecinalSerializer
 
@@ -245,7 +249,7 @@ class JuntasVecinalesViewSet(AuditMixin, viewsets.ModelViewSet):
             )
 
 
-class JuntaVecinalPaginatedViewSet(AuditMixin, viewsets.ModelViewSet):
+class JuntaVecinalPaginatedViewSet(ListadoCondicionalMixin, AuditMixin, viewsets.ModelViewSet):
     queryset = JuntaVecinal.objects.all().order_by("-fecha_creacion")
     serializer_class = JuntaVecinalSerializer
     pagination_class = DynamicPageNumberPagination
@@ -265,7 +269,7 @@ class JuntaVecinalPaginatedViewSet(AuditMixin, viewsets.ModelViewSet):
         return "Juntas Vecinales Paginadas"
 
 
-class RespuestasMunicipalesViewSet(viewsets.ModelViewSet):
+class RespuestasMunicipalesViewSet(ListadoCompiladoMixin, viewsets.ModelViewSet):
     queryset = RespuestaMunicipal.objects.all()
 
     def get_permissions(self):
@@ -277,6 +281,12 @@ class RespuestasMunicipalesViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAdmin | IsMunicipalStaff]
         return [permission() for permission in permission_classes]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ["list", "retrieve", "por_publicacion"]:
+            queryset = RespuestaMunicipalListSerializer.queryset_optimizado(queryset)
+        return queryset
+
     def get_serializer_class(self):
         if self.action in ["list", "retrieve", "por_publicacion"]:
             return RespuestaMunicipalListSerializer
@@ -294,7 +304,7 @@ class RespuestasMunicipalesViewSet(viewsets.ModelViewSet):
         Endpoint personalizado para obtener todas las respuestas municipales
         asociadas a una publicación específica.
         """
-        respuestas = self.queryset.filter(publicacion_id=publicacion_id)
+        respuestas = self.get_queryset().filter(publicacion_id=publicacion_id)
 
         if not respuestas.exists():
             return Response(
@@ -6,9 +6,16 @@ from ..models import (
     AnuncioMunicipal,
     ImagenAnuncio,
     HistorialModificaciones,
+    Usuario,
+    UsuarioDepartamento,
+    DepartamentoMunicipal,
+    Categoria,
+    JuntaVecinal,
 )
 from ..serializers.v1 import (
+    UsuarioListSerializer,
     PublicacionListSerializer,
+    PublicacionLiteSerializer,
     PublicacionCreateUpdateSerializer,
     PublicacionConHistorialSerializer,
     EvidenciaSerializer,
@@ -17,34 +24,84 @@ from ..serializers.v1 import (
     AnuncioMunicipalCreateUpdateSerializer,
     ImagenAnuncioSerializer,
 )
-from ..pagination import DynamicPageNumberPagination
+from ..serializers.campos import campos_desde_request
+from ..pagination import DynamicPageNumberPagination, KeysetPagination
 from ..filters import PublicacionFilter, AnuncioMunicipalFilter
 from ..permissions import (
     IsAdmin,
     IsAuthenticatedOrAdmin,
+    IsMunicipalStaff,
 )
 from .auditoria import AuditMixin, crear_auditoria, crear_historial_modificacion
+from .mixins import ListadoCompiladoMixin, ListadoCondicionalMixin
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework import status
 from django.db.models import Prefetch
+from ..services.lote_publicaciones_service import LotePublicacionesService, TAMANO_MAXIMO_LOTE
+from ..services.busqueda_service import BusquedaPublicacionesService, LONGITUD_MINIMA_BUSQUEDA
+from ..serializers.compilado import serializar_compilado
 
-class PublicacionViewSet(viewsets.ModelViewSet):
+class PublicacionViewSet(ListadoCondicionalMixin, ListadoCompiladoMixin, viewsets.ModelViewSet):
     queryset = Publicacion.objects.all().order_by("-fecha_publicacion")
     permission_classes = [IsAuthenticatedOrAdmin]
     pagination_class = DynamicPageNumberPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = PublicacionFilter
     ordering_fields = ["fecha_publicacion"]
+    keyset_campo = "fecha_publicacion"
+    tablas_condicionales = (
+        Publicacion,
+        Evidencia,
+        Usuario,
+        UsuarioDepartamento,
+        DepartamentoMunicipal,
+        Categoria,
+        JuntaVecinal,
+        SituacionPublicacion,
+    )
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.es_perfil_lite():
+            queryset = PublicacionLiteSerializer.queryset_optimizado(queryset)
+        elif self.action in ["list", "retrieve", "con_historial", "buscar"]:
+            # Listado con número de consultas constante (sin N+1 por fila)
+            queryset = PublicacionListSerializer.queryset_optimizado(
+                queryset, self.get_campos_solicitados()
+            )
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "con_historial":
             return PublicacionConHistorialSerializer
-        if self.action in ["list", "retrieve"]:
+        if self.es_perfil_lite():
+            return PublicacionLiteSerializer
+        if self.action in ["list", "retrieve", "buscar"]:
             return PublicacionListSerializer
         return PublicacionCreateUpdateSerializer
 
+    def get_serializer(self, *args, **kwargs):
+        campos = self.get_campos_solicitados()
+        if campos is not None:
+            kwargs["campos"] = campos
+        return super().get_serializer(*args, **kwargs)
+
+    def get_campos_solicitados(self):
+        """Árbol de ?fields=/?expand= para list y retrieve (None = representación completa)"""
+        if self.action not in ["list", "retrieve"]:
+            return None
+        return campos_desde_request(self.request)
+
+    def es_perfil_lite(self):
+        return (
+            self.action in ["list", "retrieve"]
+            and self.request is not None
+            and self.request.query_params.get("perfil") == "lite"
+        )
+
     def perform_update(self, serializer):
         """Auditoría para actualización de publicaciones"""
         instance = serializer.instance
@@ -122,8 +179,8 @@ class PublicacionViewSet(viewsets.ModelViewSet):
 
         # Optimización: Pre-cargamos el historial y el autor de cada modificación
         # para evitar N+1 queries.
-        historial_queryset = HistorialModificaciones.objects.select_related(
-            "autor"
+        historial_queryset = HistorialModificaciones.objects.prefetch_related(
+            Prefetch("autor", queryset=UsuarioListSerializer.queryset_optimizado())
         ).order_by("-fecha")
 
         base_queryset = self.get_queryset().prefetch_related(
@@ -143,6 +200,82 @@ class PublicacionViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"], url_path="buscar", permission_classes=[IsMunicipalStaff])
+    def buscar(self, request, *args, **kwargs):
+        """
+        Búsqueda por texto en título, descripción y ubicación, ordenada por relevancia.
+
+        GET /api/v1/publicaciones/buscar/?q=bache%20pasaje&departamento=Obras
+        Acepta los filtros de PublicacionFilter y la paginación por página del
+        listado. El modo cursor recorre por (fecha, id) y perdería el orden por
+        relevancia: se rechaza.
+        """
+        texto = request.query_params.get("q", "").strip()
+        if len(texto) < LONGITUD_MINIMA_BUSQUEDA:
+            return Response(
+                {"error": f"El parámetro 'q' debe tener al menos {LONGITUD_MINIMA_BUSQUEDA} caracteres"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if KeysetPagination.solicitada(request, self):
+            return Response(
+                {"error": "La búsqueda se ordena por relevancia y no admite paginación por cursor; usa ?page="},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = BusquedaPublicacionesService.buscar(self.filter_queryset(self.get_queryset()), texto)
+        serializer_class = self.get_serializer_class()
+        contexto = self.get_serializer_context()
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializar_compilado(serializer_class, page, contexto))
+        return Response(serializar_compilado(serializer_class, queryset, contexto))
+
+    @action(detail=False, methods=["post"], url_path="lote")
+    def crear_lote(self, request, *args, **kwargs):
+        """
+        Crea varias publicaciones en un envío (cola offline de la app móvil).
+
+        POST /api/v1/publicaciones/lote/
+        Body: {"publicaciones": [{...mismo formato que el POST individual..., "id_local": "opcional"}]}
+
+        Retorna un resultado por ítem, en el mismo orden: "creada" con id y
+        código, o "error" con los errores de validación.
+        """
+        items = request.data.get("publicaciones") if isinstance(request.data, dict) else request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"error": "Se requiere una lista no vacía en 'publicaciones'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > TAMANO_MAXIMO_LOTE:
+            return Response(
+                {"error": f"El lote admite como máximo {TAMANO_MAXIMO_LOTE} publicaciones"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        resultados, creadas = LotePublicacionesService.crear(items, self.get_serializer_context())
+
+        if creadas:
+            crear_auditoria(
+                usuario=request.user,
+                accion="CREATE",
+                modulo="Publicaciones",
+                descripcion=f"Creación por lote: {creadas} de {len(items)} publicaciones",
+                es_exitoso=True,
+            )
+
+        if creadas == len(items):
+            codigo_estado = status.HTTP_201_CREATED
+        elif creadas:
+            codigo_estado = status.HTTP_207_MULTI_STATUS
+        else:
+            codigo_estado = status.HTTP_400_BAD_REQUEST
+        return Response(
+            {"creadas": creadas, "con_errores": len(items) - creadas, "resultados": resultados},
+            status=codigo_estado,
+        )
+
 
 class EvidenciasViewSet(viewsets.ModelViewSet):
     queryset = Evidencia.objects.all()
@@ -163,7 +296,7 @@ class EvidenciasViewSet(viewsets.ModelViewSet):
         return [permission() for permission in permission_classes]
 
 
-class SituacionesPublicacionesViewSet(viewsets.ModelViewSet):
+class SituacionesPublicacionesViewSet(ListadoCondicionalMixin, viewsets.ModelViewSet):
     queryset = SituacionPublicacion.objects.all()
     serializer_class = SituacionPublicacionSerializer
 
@@ -175,12 +308,23 @@ class SituacionesPublicacionesViewSet(viewsets.ModelViewSet):
         return [permission() for permission in permission_classes]
 
 
-class AnunciosMunicipalesViewSet(AuditMixin, viewsets.ModelViewSet):
+class AnunciosMunicipalesViewSet(
+    ListadoCondicionalMixin, ListadoCompiladoMixin, AuditMixin, viewsets.ModelViewSet
+):
     queryset = AnuncioMunicipal.objects.all().order_by("-fecha")
     pagination_class = DynamicPageNumberPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = AnuncioMunicipalFilter
     ordering_fields = ["fecha"]
+    tablas_condicionales = (
+        AnuncioMunicipal,
+        ImagenAnuncio,
+        Usuario,
+        UsuarioDepartamento,
+        DepartamentoMunicipal,
+        Categoria,
+        Publicacion,
+    )
 
     def get_permissions(self):
         if self.action in ["list", "retrieve"]:
@@ -189,6 +333,12 @@ class AnunciosMunicipalesViewSet(AuditMixin, viewsets.ModelViewSet):
             permission_classes = [IsAdmin]
         return [permission() for permission in permission_classes]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ["list", "retrieve"]:
+            queryset = AnuncioMunicipalListSerializer.queryset_optimizado(queryset)
+        return queryset
+
     def get_serializer_class(self):
         if self.action in ["list", "retrieve"]:
             return AnuncioMunicipalListSerializer
@@ -0,0 +1,48 @@
+from rest_framework.decorators import api_view, permission_classes
+from listado_publicaciones.permissions import IsAuthenticatedOrAdmin
+from rest_framework.response import Response
+from rest_framework import status
+from ..services.sincronizacion_service import (
+    SincronizacionService,
+    RECURSOS_SINCRONIZABLES,
+    MarcaInvalida,
+)
+
+LIMITE_POR_DEFECTO = 200
+LIMITE_MAXIMO = 1000
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticatedOrAdmin])
+def cambios(request, recurso):
+    """
+    Sincronización incremental para la app móvil
+
+    GET /api/v1/sincronizacion/<publicaciones|respuestas|anuncios>/?desde=<marca>&limite=200
+
+    Sin `desde` entrega todas las filas. La respuesta trae `actualizados`
+    (mismo formato que el listado), `eliminados` (ids) y la `marca` a enviar en
+    la próxima llamada; mientras `hay_mas` sea true se sigue pidiendo.
+    """
+    if recurso not in RECURSOS_SINCRONIZABLES:
+        return Response(
+            {"error": f"Recurso no sincronizable. Opciones: {', '.join(RECURSOS_SINCRONIZABLES)}"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    try:
+        limite = int(request.query_params.get("limite", LIMITE_POR_DEFECTO))
+    except ValueError:
+        return Response({"error": "limite debe ser un entero"}, status=status.HTTP_400_BAD_REQUEST)
+    limite = max(1, min(limite, LIMITE_MAXIMO))
+
+    try:
+        data = SincronizacionService.cambios(
+            recurso,
+            marca=request.query_params.get("desde"),
+            limite=limite,
+            contexto={"request": request},
+        )
+    except MarcaInvalida as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(data)
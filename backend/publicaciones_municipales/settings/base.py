@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt",
     "listado_publicaciones",
@@ -52,6 +53,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Comprime la respuesta ya generada por el resto de la cadena
+    "listado_publicaciones.middleware.CompresionRespuestaMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -163,3 +166,59 @@ AUTH_USER_MODEL = "listado_publicaciones.Usuario"
 
 # Límites de Negocio
 PLAZO_LEGAL_DIAS = 20
+# Feriados extraordinarios (elecciones, interferiados) que se suman al
+# calendario nacional de listado_publicaciones/utils/dias_habiles.py
+FERIADOS_ADICIONALES = [
+    fecha.strip() for fecha in os.environ.get("FERIADOS_ADICIONALES", "").split(",") if fecha.strip()
+]
+
+# Secciones de /estadisticas/dashboard/ que se calculan en paralelo. Cada hilo
+# abre su propia conexión a la base de datos; 1 las calcula en secuencia.
+ESTADISTICAS_DASHBOARD_HILOS = int(os.environ.get("ESTADISTICAS_DASHBOARD_HILOS", 4))
+
+# Cola de trabajos de estadísticas (/estadisticas/trabajos/), atendida por
+# `manage.py procesar_trabajos_estadistica`: procesos del pool, segundos entre
+# consultas a la cola vacía y segundos tras los que un trabajo en proceso se
+# da por abandonado y vuelve a la cola.
+ESTADISTICAS_TRABAJOS_PROCESOS = int(os.environ.get("ESTADISTICAS_TRABAJOS_PROCESOS", 2))
+ESTADISTICAS_TRABAJOS_INTERVALO = float(os.environ.get("ESTADISTICAS_TRABAJOS_INTERVALO", 2))
+ESTADISTICAS_TRABAJOS_TIEMPO_MAXIMO = int(os.environ.get("ESTADISTICAS_TRABAJOS_TIEMPO_MAXIMO", 1800))
+
+# Cache de resultados de StatisticsService (listado_publicaciones/utils/cache_estadisticas.py).
+# ESTADISTICAS_CACHE_URL elige el backend: vacío = memoria local del proceso,
+# "file:///ruta" = archivos, "redis://host:puerto/db" = Redis o compatible.
+ESTADISTICAS_CACHE_URL = os.environ.get("ESTADISTICAS_CACHE_URL", "")
+if ESTADISTICAS_CACHE_URL.startswith(("redis://", "rediss://")):
+    _cache_estadisticas = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": ESTADISTICAS_CACHE_URL,
+    }
+elif ESTADISTICAS_CACHE_URL.startswith("file://"):
+    _cache_estadisticas = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": ESTADISTICAS_CACHE_URL[len("file://"):],
+    }
+else:
+    _cache_estadisticas = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "estadisticas",
+    }
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "estadisticas": {
+        **_cache_estadisticas,
+        "TIMEOUT": int(os.environ.get("ESTADISTICAS_CACHE_TTL", 300)),
+    },
+}
+
+# Compresión de respuestas (listado_publicaciones/middleware.py). brotli y
+# zstd se usan solo si los paquetes "brotli" / "zstandard" están instalados.
+COMPRESION_RESPUESTAS = {
+    "NIVELES": {
+        "br": int(os.environ.get("COMPRESION_NIVEL_BR", 4)),
+        "zstd": int(os.environ.get("COMPRESION_NIVEL_ZSTD", 3)),
+        "gzip": int(os.environ.get("COMPRESION_NIVEL_GZIP", 6)),
+    },
+    "TAMANO_MINIMO": int(os.environ.get("COMPRESION_TAMANO_MINIMO", 1024)),
+}